@@ -5,8 +5,13 @@ Provides personalized vault recommendations to users based on their preferences
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
+from ai_agent.vault_registry import VaultRegistry
+from ai_engine.selection import top_k_indices
+from observability import metrics
+import numpy as np
 
 
 class RiskTolerance(Enum):
@@ -50,12 +55,23 @@ class VaultRecommendation:
 class PraxosAIAgent:
     """AI Agent that provides personalized vault suggestions"""
     
+    # Risk tier match score by |vault tier - user tier| (3+ tiers away = last entry)
+    RISK_MATCH_SCORES = np.array([100.0, 80.0, 50.0, 20.0])
+    
+    # Minimum match score for a vault to be recommended
+    MIN_MATCH_SCORE = 50
+    
     def __init__(self):
-        self.vault_registry: List[Dict] = []
+        self.vault_registry = VaultRegistry()
+        # Ranked candidates per preference class, valid for one registry version
+        self._recommendation_cache: Dict[Tuple, Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]] = {}
+        self._cache_version = -1
     
-    def register_vault(self, vault_info: Dict):
+    def register_vault(self, vault_info: Dict, key: str = None):
         """
-        Register a vault for recommendation
+        Register (or update) a vault for recommendation
+        
+        Registering the same key again replaces the earlier entry.
         
         Args:
             vault_info: Dictionary containing vault metadata:
@@ -68,8 +84,13 @@ class PraxosAIAgent:
                     "strategy": "balanced-diversified",
                     "assets": [...]
                 }
+            key: Registry key (defaults to the vault address)
         """
-        self.vault_registry.append(vault_info)
+        self.vault_registry.upsert(vault_info, key)
+    
+    def unregister_vault(self, key: str) -> bool:
+        """Remove a vault from recommendation (key as used when registering)"""
+        return self.vault_registry.remove(key)
     
     def suggest_vaults(
         self,
@@ -86,32 +107,154 @@ class PraxosAIAgent:
         Returns:
             List of vault recommendations sorted by match score
         """
-        recommendations = []
+        with metrics.stage("rank_vaults"):
+            return self._suggest_vaults(user_prefs, max_recommendations)
+    
+    def _suggest_vaults(
+        self,
+        user_prefs: UserPreferences,
+        max_recommendations: int
+    ) -> List[VaultRecommendation]:
+        rows, scores, yields = self._class_candidates(user_prefs)
+        metrics.record_size("rank_vaults", "candidates", len(rows))
         
-        for vault in self.vault_registry:
-            score = self._calculate_match_score(vault, user_prefs)
-            timeframe_match = self._check_timeframe_match(vault, user_prefs.timeframe)
-            
-            reasoning = self._generate_reasoning(vault, user_prefs, score)
+        if yields is None:
+            # No yield preference: the cached ranking is final
+            top_rows = rows[:max(max_recommendations, 0)]
+            top_scores = scores[:max(max_recommendations, 0)]
+        else:
+            # Refine the cached base scores with this request's yield threshold
+            scores = self._add_yield_scores(scores, yields, user_prefs.min_yield)
             
-            rec = VaultRecommendation(
+            # Filter out low-scoring vaults, then take the best (ties keep registration order)
+            eligible = np.flatnonzero(scores >= self.MIN_MATCH_SCORE)
+            top = eligible[top_k_indices(scores[eligible], max_recommendations)]
+            top_rows, top_scores = rows[top], scores[top]
+        
+        # Only the returned vaults are materialized
+        recommendations = []
+        for row, score in zip(top_rows.tolist(), top_scores.tolist()):
+            vault = self.vault_registry[row]
+            timeframe_match = self._check_timeframe_match(vault, user_prefs.timeframe)
+            recommendations.append(VaultRecommendation(
                 vault_address=vault["address"],
                 vault_name=vault["name"],
                 match_score=score,
                 risk_tier=vault["risk_tier"],
                 expected_yield=vault.get("expected_yield", 0.0),
                 timeframe_match=timeframe_match,
-                reasoning=reasoning
-            )
-            recommendations.append(rec)
+                reasoning=self._generate_reasoning(vault, user_prefs, score, timeframe_match)
+            ))
+        
+        return recommendations
+    
+    def precompute_recommendations(self):
+        """Build the cached candidate rankings for every preference class"""
+        for risk_tolerance in RiskTolerance:
+            for timeframe in Timeframe:
+                for min_yield in (None, 1.0):
+                    self._class_candidates(UserPreferences(timeframe, risk_tolerance, 0.0, min_yield))
+    
+    def _class_candidates(
+        self,
+        user_prefs: UserPreferences
+    ) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """
+        Cached candidates for the preference class of user_prefs
+        
+        A class is (risk tolerance, timeframe, whether a minimum yield is set);
+        preferred asset types are not scored. Entries are dropped whenever the
+        registry version changes.
+        
+        Returns:
+            Without a yield preference: (rows, scores), eligible vaults ranked
+            best first, and None. With one: (rows, base_scores, yields) for the
+            candidate vaults in registration order; the yield component depends
+            on the exact threshold and is added per request.
+        """
+        if self._cache_version != self.vault_registry.version:
+            self._recommendation_cache = {}
+            self._cache_version = self.vault_registry.version
+        
+        key = (user_prefs.risk_tolerance, user_prefs.timeframe, bool(user_prefs.min_yield))
+        entry = self._recommendation_cache.get(key)
+        if entry is not None:
+            return entry
+        
+        rows = self._candidate_rows(user_prefs)
+        risk_tiers, durations, yields = self.vault_registry.features(rows)
+        scores = self._base_scores(user_prefs, risk_tiers, durations)
+        if user_prefs.min_yield:
+            entry = (rows, scores, yields)
+        else:
+            scores = self._add_yield_scores(scores, yields, None)
+            eligible = np.flatnonzero(scores >= self.MIN_MATCH_SCORE)
+            ranked = eligible[np.argsort(-scores[eligible], kind="stable")]
+            entry = (rows[ranked], scores[ranked], None)
+        
+        self._recommendation_cache[key] = entry
+        return entry
+    
+    def _candidate_rows(self, user_prefs: UserPreferences) -> np.ndarray:
+        """
+        Registry rows of the vaults that can reach MIN_MATCH_SCORE, ascending
         
-        # Sort by match score (highest first)
-        recommendations.sort(key=lambda x: x.match_score, reverse=True)
+        Within a (risk tier, duration bucket) group only the yield component
+        varies, so groups whose best possible score is too low are skipped.
+        """
+        max_yield_score = 100 if user_prefs.min_yield else 50
+        groups = []
+        for tier, bucket in self.vault_registry.groups():
+            tier_delta = min(abs(tier - user_prefs.risk_tolerance.value), len(self.RISK_MATCH_SCORES) - 1)
+            upper_bound = self.RISK_MATCH_SCORES[tier_delta] * 0.4
+            upper_bound += (100 if bucket == user_prefs.timeframe.value else 50) * 0.3
+            upper_bound += max_yield_score * 0.2 + 50 * 0.1
+            if upper_bound >= self.MIN_MATCH_SCORE:
+                groups.append((tier, bucket))
+        return self.vault_registry.group_rows(groups)
+    
+    def _base_scores(
+        self,
+        user_prefs: UserPreferences,
+        risk_tiers: np.ndarray,
+        durations: np.ndarray
+    ) -> np.ndarray:
+        """Risk tier and timeframe components of the match score"""
+        # Risk tier matching (40% weight)
+        tier_delta = np.minimum(np.abs(risk_tiers - user_prefs.risk_tolerance.value), len(self.RISK_MATCH_SCORES) - 1)
+        score = self.RISK_MATCH_SCORES[tier_delta] * 0.4
+        
+        # Timeframe matching (30% weight)
+        score += np.where(self._timeframe_mask(durations, user_prefs.timeframe), 100.0, 50.0) * 0.3
+        return score
+    
+    @staticmethod
+    def _add_yield_scores(base_scores: np.ndarray, yields: np.ndarray, min_yield: Optional[float]) -> np.ndarray:
+        """Complete base scores with the yield and asset type components"""
+        # Yield matching (20% weight)
+        if min_yield:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                shortfall = np.maximum(0, (yields / min_yield) * 100)
+            score = base_scores + np.where(yields >= min_yield, 100.0, shortfall) * 0.2
+        else:
+            score = base_scores + 50 * 0.2  # Neutral if no yield preference
         
-        # Filter out low-scoring recommendations
-        recommendations = [r for r in recommendations if r.match_score >= 50]
+        # Asset type matching (10% weight, not scored yet)
+        score += 50 * 0.1
+        
+        return np.minimum(100, score)
+    
+    @staticmethod
+    def _timeframe_mask(durations: np.ndarray, user_timeframe: Timeframe) -> np.ndarray:
+        """Vectorized _check_timeframe_match over target durations (days)"""
+        if user_timeframe == Timeframe.SHORT_TERM:
+            return durations <= 365
+        elif user_timeframe == Timeframe.MEDIUM_TERM:
+            return (durations > 365) & (durations <= 1095)
+        elif user_timeframe == Timeframe.LONG_TERM:
+            return durations > 1095
         
-        return recommendations[:max_recommendations]
+        return np.ones(len(durations), dtype=bool)
     
     def _calculate_match_score(self, vault: Dict, user_prefs: UserPreferences) -> float:
         """Calculate how well a vault matches user preferences (0-100)"""
@@ -182,26 +325,48 @@ class PraxosAIAgent:
         self,
         vault: Dict,
         user_prefs: UserPreferences,
-        score: float
+        score: float,
+        timeframe_match: bool = None
     ) -> str:
-        """Generate human-readable reasoning for recommendation"""
-        reasons = []
-        
-        risk_match = self._match_risk_tier(vault["risk_tier"], user_prefs.risk_tolerance)
-        if risk_match >= 80:
-            reasons.append(f"Risk tier {vault['risk_tier']} aligns well with your {user_prefs.risk_tolerance.name.lower()} risk tolerance")
-        
-        if self._check_timeframe_match(vault, user_prefs.timeframe):
-            reasons.append(f"Timeframe matches your {user_prefs.timeframe.value}-term investment preference")
-        
-        expected_yield = vault.get("expected_yield", 0.0)
-        if expected_yield > 0:
-            reasons.append(f"Expected yield: {expected_yield:.2f}%")
-        
-        if not reasons:
-            reasons.append("This vault may be suitable based on your preferences")
+        """
+        Generate human-readable reasoning for recommendation
         
-        return ". ".join(reasons) + "."
+        Only called for the recommendations actually returned; the text is
+        memoized per (vault tier, risk tolerance, timeframe match, yield).
+        """
+        if timeframe_match is None:
+            timeframe_match = self._check_timeframe_match(vault, user_prefs.timeframe)
+        return _reasoning_text(
+            vault["risk_tier"],
+            user_prefs.risk_tolerance,
+            user_prefs.timeframe if timeframe_match else None,
+            vault.get("expected_yield", 0.0)
+        )
+
+
+@lru_cache(maxsize=4096)
+def _reasoning_text(
+    risk_tier: int,
+    risk_tolerance: RiskTolerance,
+    matched_timeframe: Optional[Timeframe],
+    expected_yield: float
+) -> str:
+    """Reasoning sentence for one combination of match outcomes"""
+    reasons = []
+    
+    if abs(risk_tier - risk_tolerance.value) in (0, 1):  # _match_risk_tier >= 80
+        reasons.append(f"Risk tier {risk_tier} aligns well with your {risk_tolerance.name.lower()} risk tolerance")
+    
+    if matched_timeframe is not None:
+        reasons.append(f"Timeframe matches your {matched_timeframe.value}-term investment preference")
+    
+    if expected_yield > 0:
+        reasons.append(f"Expected yield: {expected_yield:.2f}%")
+    
+    if not reasons:
+        reasons.append("This vault may be suitable based on your preferences")
+    
+    return ". ".join(reasons) + "."
 
 
 if __name__ == "__main__":
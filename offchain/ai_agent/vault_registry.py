@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Praxos Vault Registry
+Registered vaults with their recommendation features held as NumPy columns
+"""
+
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+# Duration buckets, matching the Timeframe values used by the suggestion engine
+DURATION_BUCKETS = ("short", "medium", "long")
+
+
+def duration_bucket(target_duration: int) -> str:
+    """Duration bucket of a vault target duration (days)"""
+    if target_duration <= 365:
+        return "short"
+    if target_duration <= 1095:
+        return "medium"
+    return "long"
+
+
+class VaultRegistry:
+    """
+    Registry of vaults available for recommendation, keyed by vault address
+
+    Vault metadata dicts are kept as registered; the fields used for scoring
+    (risk tier, target duration, expected yield) are mirrored into typed
+    columns, so vaults can be scored in vectorized passes. Rows are secondary
+    indexed by (risk tier, duration bucket), and a version counter is bumped on
+    every change so downstream caches can detect staleness.
+
+    Rows stay in registration order: updates are made in place and removed
+    vaults leave a hole until the columns are compacted.
+    """
+
+    def __init__(self):
+        self._vaults: List[Optional[Dict]] = []
+        self._keys: List[Optional[Hashable]] = []
+        self._rows: Dict[Hashable, int] = {}
+        self._capacity = 0
+        self._risk_tier = np.zeros(0, dtype=np.int64)
+        self._target_duration = np.zeros(0, dtype=np.int64)
+        self._expected_yield = np.zeros(0, dtype=np.float64)
+        # (risk tier, duration bucket) -> rows, plus sorted array views built on demand
+        self._groups: Dict[Tuple[int, str], Set[int]] = {}
+        self._group_arrays: Dict[Tuple[int, str], np.ndarray] = {}
+        self._version = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def __iter__(self) -> Iterator[Dict]:
+        return (vault for vault in self._vaults if vault is not None)
+
+    def __getitem__(self, row: int) -> Dict:
+        return self._vaults[row]
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter, incremented whenever the registered vaults change"""
+        return self._version
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Vault registered under a key, or None"""
+        row = self._rows.get(key)
+        return None if row is None else self._vaults[row]
+
+    def upsert(self, vault_info: Dict, key: Hashable = None) -> int:
+        """
+        Register a vault, replacing any vault registered under the same key
+
+        Re-registering identical metadata is a no-op (the version is unchanged).
+
+        Args:
+            vault_info: Vault metadata (see PraxosAIAgent.register_vault)
+            key: Registry key (defaults to vault_info["address"])
+
+        Returns:
+            Row of the vault in the feature columns
+        """
+        if key is None:
+            key = vault_info["address"]
+
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._vaults)
+            self._ensure_capacity(row + 1)
+            self._vaults.append(None)
+            self._keys.append(key)
+            self._rows[key] = row
+        elif self._vaults[row] == vault_info:
+            return row
+        else:
+            self._ungroup(row)
+
+        self._vaults[row] = vault_info
+        self._risk_tier[row] = vault_info["risk_tier"]
+        self._target_duration[row] = vault_info.get("target_duration", 0)
+        self._expected_yield[row] = vault_info.get("expected_yield", 0.0)
+        self._group(row)
+        self._version += 1
+        return row
+
+    def remove(self, key: Hashable) -> bool:
+        """Unregister the vault with the given key"""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return False
+
+        self._ungroup(row)
+        self._vaults[row] = None
+        self._keys[row] = None
+        self._version += 1
+
+        holes = len(self._vaults) - len(self._rows)
+        if holes > max(1024, len(self._rows)):
+            self._compact()
+        return True
+
+    def groups(self) -> List[Tuple[int, str]]:
+        """Non-empty (risk tier, duration bucket) groups"""
+        return list(self._groups)
+
+    def group_rows(self, groups: Iterable[Tuple[int, str]]) -> np.ndarray:
+        """Rows of the vaults in the given (risk tier, duration bucket) groups, ascending"""
+        mask = np.zeros(len(self._vaults), dtype=bool)
+        for group in groups:
+            if group in self._groups:
+                mask[self._group_rows(group)] = True
+        return np.flatnonzero(mask)
+
+    def rows_for(self, risk_tier: int = None, bucket: str = None) -> np.ndarray:
+        """Rows of the vaults in a risk tier and/or duration bucket, ascending"""
+        return self.group_rows(
+            group for group in self._groups
+            if (risk_tier is None or group[0] == risk_tier) and (bucket is None or group[1] == bucket)
+        )
+
+    def features(self, rows: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Feature columns of registered vaults
+
+        Args:
+            rows: Rows to gather (None = every registered vault, in order)
+
+        Returns:
+            (risk_tier, target_duration in days, expected_yield in percent)
+        """
+        if rows is None:
+            rows = np.fromiter(sorted(self._rows.values()), dtype=np.int64, count=len(self._rows))
+        return self._risk_tier[rows], self._target_duration[rows], self._expected_yield[rows]
+
+    def _group_rows(self, group: Tuple[int, str]) -> np.ndarray:
+        rows = self._group_arrays.get(group)
+        if rows is None:
+            members = self._groups[group]
+            rows = np.sort(np.fromiter(members, dtype=np.int64, count=len(members)))
+            self._group_arrays[group] = rows
+        return rows
+
+    def _group(self, row: int):
+        group = (int(self._risk_tier[row]), duration_bucket(int(self._target_duration[row])))
+        self._groups.setdefault(group, set()).add(row)
+        self._group_arrays.pop(group, None)
+
+    def _ungroup(self, row: int):
+        group = (int(self._risk_tier[row]), duration_bucket(int(self._target_duration[row])))
+        members = self._groups[group]
+        members.discard(row)
+        if not members:
+            del self._groups[group]
+        self._group_arrays.pop(group, None)
+
+    def _compact(self):
+        """Drop the holes left by removed vaults, preserving registration order"""
+        live = np.fromiter(sorted(self._rows.values()), dtype=np.int64, count=len(self._rows))
+        n = len(live)
+        self._risk_tier[:n] = self._risk_tier[live]
+        self._target_duration[:n] = self._target_duration[live]
+        self._expected_yield[:n] = self._expected_yield[live]
+        self._vaults = [self._vaults[row] for row in live.tolist()]
+        self._keys = [self._keys[row] for row in live.tolist()]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+
+        self._groups = {}
+        self._group_arrays = {}
+        for row in range(n):
+            self._group(row)
+
+    def _ensure_capacity(self, size: int):
+        """Grow the feature columns geometrically"""
+        if size <= self._capacity:
+            return
+        capacity = max(64, self._capacity)
+        while capacity < size:
+            capacity *= 2
+
+        n = len(self._vaults)
+        for name in ("_risk_tier", "_target_duration", "_expected_yield"):
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:n] = old[:n]
+            setattr(self, name, grown)
+        self._capacity = capacity
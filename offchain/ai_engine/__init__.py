@@ -1,4 +1,6 @@
 from .allocation_engine import PraxosAIEngine, VaultStrategy
+from .monte_carlo import MonteCarloEngine, StrategyRiskReport
+from .optimizer import PortfolioOptimizer
+from .strategy_registry import StrategyRegistry
 
-__all__ = ["PraxosAIEngine", "VaultStrategy"]
-
+__all__ = ["PraxosAIEngine", "VaultStrategy", "MonteCarloEngine", "StrategyRiskReport", "PortfolioOptimizer", "StrategyRegistry"]
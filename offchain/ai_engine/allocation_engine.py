@@ -5,9 +5,18 @@ Performs risk analysis and constructs optimal ERC-4626 vault strategies from ris
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from simulation.risk_model import RiskSignature, RiskSimulator
+from simulation.correlation import factor_correlation
+from ai_engine.monte_carlo import MonteCarloEngine, StrategyRiskReport
+from ai_engine.optimizer import PortfolioOptimizer, to_basis_points
+from ai_engine.candidate_index import CandidateIndex
+from ai_engine.selection import select_diverse_top_k
+from ai_engine.parallel import ParallelStrategyBuilder
+from ai_engine.strategy_registry import StrategyRegistry
+from observability import metrics
+import numpy as np
 import random
 
 
@@ -61,14 +70,42 @@ class PraxosAIEngine:
         }
     }
     
-    def __init__(self, risk_simulator: RiskSimulator):
+    # Default candidate ranking score: linear weights over RiskSignature fields
+    # (a template may override it with its own "selection_score")
+    SELECTION_SCORE = {"credit_score": 0.4, "annual_yield": 6.0}
+    
+    def __init__(
+        self,
+        risk_simulator: RiskSimulator,
+        optimizer: PortfolioOptimizer = None,
+        selection_score: Dict[str, float] = None,
+        max_workers: int = 1,
+        strategy_registry: StrategyRegistry = None
+    ):
+        """
+        Args:
+            risk_simulator: Simulator holding the signature universe
+            optimizer: Portfolio optimizer used for weights (None = credit/yield scoring)
+            selection_score: Field weights used to rank candidates (default SELECTION_SCORE)
+            max_workers: Worker processes for strategy construction (1 = build serially)
+            strategy_registry: Registry recording generated strategies (default
+                retains the last 16 generations)
+        """
         self.risk_simulator = risk_simulator
-        self.generated_strategies: List[VaultStrategy] = []
+        self.optimizer = optimizer
+        self.selection_score = selection_score or self.SELECTION_SCORE
+        self.max_workers = max_workers
+        self.strategy_registry = strategy_registry if strategy_registry is not None else StrategyRegistry()
+        # Last optimized weights per strategy, used to warm-start the optimizer
+        # (kept only for strategies the registry still retains)
+        self._previous_weights: Dict[str, Dict[str, float]] = {}
+        self._parallel_builder = None
     
     def generate_vault_strategies(
         self,
         available_assets: List[RiskSignature],
-        strategy_types: List[str] = None
+        strategy_types: List[str] = None,
+        templates: Dict[str, Dict] = None
     ) -> List[VaultStrategy]:
         """
         Generate vault strategies from available RWA assets
@@ -76,59 +113,193 @@ class PraxosAIEngine:
         Args:
             available_assets: List of risk signatures for available RWAs
             strategy_types: List of strategy types to generate (None = all)
+            templates: Additional / overriding templates by strategy type
+                (user-supplied variants of STRATEGY_TEMPLATES)
             
         Returns:
             List of vault strategies
         """
-        if strategy_types is None:
-            strategy_types = list(self.STRATEGY_TEMPLATES.keys())
+        selected_templates = self._select_templates(strategy_types, templates)
+        index = self._build_index(available_assets)
+        built = self._build_strategies(available_assets, index, selected_templates)
         
-        strategies = []
-        for strategy_type in strategy_types:
-            if strategy_type not in self.STRATEGY_TEMPLATES:
-                continue
-            
-            template = self.STRATEGY_TEMPLATES[strategy_type]
-            strategy = self._construct_strategy(
-                strategy_type,
-                template,
-                available_assets
-            )
+        strategies = [strategy for strategy in built if strategy]
+        self.record_strategies(strategies)
+        
+        return strategies
+    
+    def update_vault_strategies(
+        self,
+        available_assets: List[RiskSignature],
+        previous_strategies: List[VaultStrategy],
+        changed_signatures: Sequence[RiskSignature],
+        strategy_types: List[str] = None,
+        templates: Dict[str, Dict] = None
+    ) -> Tuple[List[VaultStrategy], List[str]]:
+        """
+        Regenerate only the strategies affected by a change of the universe
+        
+        A template's strategy depends only on its candidate set, so it can
+        change only if an added, removed or changed asset matches the
+        template's filter criteria before or after the change. Those templates
+        are rebuilt over the full universe; the others keep their previous
+        strategy object. The result equals generate_vault_strategies over
+        available_assets as long as the assets that did not change keep their
+        relative order.
+        
+        Args:
+            available_assets: The updated universe
+            previous_strategies: Result of the previous generate / update call
+                with the same strategy_types and templates
+            changed_signatures: Signatures of every removed asset (old
+                version), added asset (new version) and changed asset (both)
+            strategy_types: List of strategy types to generate (None = all)
+            templates: Additional / overriding templates by strategy type
             
+        Returns:
+            (strategies, IDs of the templates that were rebuilt)
+        """
+        selected_templates = self._select_templates(strategy_types, templates)
+        previous = {strategy.strategy_id: strategy for strategy in previous_strategies}
+        
+        with metrics.stage("filter_assets"):
+            changed_index = CandidateIndex.from_signatures(changed_signatures)
+            affected = [
+                (strategy_type, template)
+                for strategy_type, template in selected_templates
+                if len(changed_index.query(template)) > 0
+            ]
+        metrics.record_size("filter_assets", "affected_templates", len(affected))
+        
+        rebuilt: Dict[str, Optional[VaultStrategy]] = {}
+        if affected:
+            index = self._build_index(available_assets)
+            built = self._build_strategies(available_assets, index, affected)
+            rebuilt = {strategy_type: strategy for (strategy_type, _), strategy in zip(affected, built)}
+        
+        strategies = []
+        for strategy_type, _ in selected_templates:
+            strategy = rebuilt[strategy_type] if strategy_type in rebuilt else previous.get(strategy_type)
             if strategy:
                 strategies.append(strategy)
-                self.generated_strategies.append(strategy)
+        self.record_strategies(strategies)
         
-        return strategies
+        return strategies, list(rebuilt)
+    
+    def _select_templates(
+        self,
+        strategy_types: List[str] = None,
+        templates: Dict[str, Dict] = None
+    ) -> List[Tuple[str, Dict]]:
+        """(strategy type, template) pairs to build, in strategy_types order"""
+        all_templates = dict(self.STRATEGY_TEMPLATES)
+        if templates:
+            all_templates.update(templates)
+        if strategy_types is None:
+            strategy_types = list(all_templates.keys())
+        return [
+            (strategy_type, all_templates[strategy_type])
+            for strategy_type in strategy_types
+            if strategy_type in all_templates
+        ]
+    
+    def _build_index(self, available_assets: List[RiskSignature]) -> CandidateIndex:
+        """Index the universe once; every template filters through it"""
+        with metrics.stage("build_index"):
+            index = CandidateIndex.from_signatures(available_assets)
+        metrics.record_size("build_index", "assets", len(available_assets))
+        return index
+    
+    def _build_strategies(
+        self,
+        available_assets: List[RiskSignature],
+        index: CandidateIndex,
+        selected_templates: List[Tuple[str, Dict]]
+    ) -> List[Optional[VaultStrategy]]:
+        """Construct one strategy (or None) per template"""
+        if self.max_workers > 1 and len(selected_templates) > 1:
+            if self._parallel_builder is None:
+                self._parallel_builder = ParallelStrategyBuilder(self.max_workers)
+            return self._parallel_builder.build(self, available_assets, index, selected_templates)
+        return [
+            self._construct_strategy(strategy_type, template, available_assets, index)
+            for strategy_type, template in selected_templates
+        ]
+    
+    def record_strategies(self, strategies: List[VaultStrategy]) -> int:
+        """
+        Record a generation of strategies in the registry
+        
+        Called by generate / update; also used to re-record strategies
+        served from a cache without rebuilding them.
+        
+        Returns:
+            The new generation number
+        """
+        generation = self.strategy_registry.record(strategies)
+        self._prune_previous_weights()
+        return generation
+    
+    def _prune_previous_weights(self):
+        """Drop warm starts of strategies the registry no longer retains"""
+        retired = [
+            strategy_id for strategy_id in self._previous_weights
+            if self.strategy_registry.get(strategy_id) is None
+        ]
+        for strategy_id in retired:
+            del self._previous_weights[strategy_id]
+    
+    @property
+    def generated_strategies(self) -> List[VaultStrategy]:
+        """Strategies from the retained generations, oldest first"""
+        return self.strategy_registry.strategies()
+    
+    def close(self):
+        """Release the worker pool used for parallel strategy construction"""
+        if self._parallel_builder is not None:
+            self._parallel_builder.close()
+            self._parallel_builder = None
     
     def _construct_strategy(
         self,
         strategy_id: str,
         template: Dict,
-        available_assets: List[RiskSignature]
+        available_assets: List[RiskSignature],
+        index: CandidateIndex = None
     ) -> VaultStrategy:
         """Construct a single vault strategy"""
+        if index is None:
+            index = CandidateIndex.from_signatures(available_assets)
+        
         # Filter assets based on template criteria
-        candidates = self._filter_assets(available_assets, template)
+        with metrics.stage("filter_assets"):
+            candidate_rows = index.query(template)
+        metrics.record_size("filter_assets", "candidates", len(candidate_rows))
         
-        if len(candidates) == 0:
+        if len(candidate_rows) == 0:
             return None
         
         # Select assets for diversification
-        selected = self._select_assets(candidates, template)
+        with metrics.stage("select_assets"):
+            selected_rows = self._select_rows(index, candidate_rows, template)
+            selected = [available_assets[row] for row in selected_rows.tolist()]
+        metrics.record_size("select_assets", "selected", len(selected))
         
         if len(selected) == 0:
             return None
         
         # Calculate optimal weights
-        weights = self._calculate_weights(selected, template)
+        with metrics.stage("calculate_weights"):
+            weights = self._calculate_weights(selected, template, strategy_id)
         
         # Calculate expected metrics
-        expected_yield = self._calculate_expected_yield(selected, weights)
-        diversification_score = self._calculate_diversification(selected)
+        with metrics.stage("strategy_metrics"):
+            expected_yield = self._calculate_expected_yield(selected, weights)
+            diversification_score = self._calculate_diversification(selected)
         
         # Generate human-readable name
-        name = self._generate_name(strategy_id, selected)
+        with metrics.stage("naming"):
+            name = self._generate_name(strategy_id, selected)
         
         return VaultStrategy(
             strategy_id=strategy_id,
@@ -144,42 +315,27 @@ class PraxosAIEngine:
     def _filter_assets(
         self,
         assets: List[RiskSignature],
-        template: Dict
+        template: Dict,
+        index: CandidateIndex = None
     ) -> List[RiskSignature]:
-        """Filter assets based on template criteria"""
-        candidates = []
+        """
+        Filter assets based on template criteria
         
-        for asset in assets:
-            # Check risk tier (allow ±1 tier flexibility)
-            if abs(asset.risk_tier - template["risk_tier"]) > 1:
-                continue
-            
-            # Check credit score if specified
-            if "min_credit_score" in template:
-                if asset.credit_score < template["min_credit_score"]:
-                    continue
-            
-            # Check preferred asset types
-            if "preferred_types" in template:
-                if asset.asset_type not in template["preferred_types"]:
-                    # Still allow, but lower priority
-                    pass
-            
-            # Check minimum yield
-            if "min_yield" in template:
-                if asset.annual_yield < template["min_yield"]:
-                    continue
-            
-            # Check duration alignment
-            if template["target_duration"] > 0:
-                # Prefer assets with similar duration
-                duration_diff = abs(asset.maturity_days - template["target_duration"])
-                if duration_diff > template["target_duration"] * 0.5:
-                    continue
+        Args:
+            assets: Asset universe
+            template: Strategy template
+            index: CandidateIndex over `assets` (built on the fly if omitted)
             
-            candidates.append(asset)
+        Returns:
+            Matching assets, in universe order
+        """
+        if index is None:
+            index = CandidateIndex.from_signatures(assets)
         
-        return candidates
+        # Criteria: risk tier within +/-1, min_credit_score, min_yield and
+        # maturity within 50% of target_duration. preferred_types does not
+        # exclude assets (it only expresses a priority).
+        return [assets[row] for row in index.query(template).tolist()]
     
     def _select_assets(
         self,
@@ -187,44 +343,48 @@ class PraxosAIEngine:
         template: Dict
     ) -> List[RiskSignature]:
         """Select assets for optimal diversification"""
-        max_assets = min(template["max_assets"], len(candidates))
-        min_diversification = template.get("min_diversification", 2)
-        
-        # Prioritize diversification
-        selected = []
-        asset_types_seen = set()
-        
-        # First pass: ensure type diversification
-        for asset in candidates:
-            if len(selected) >= max_assets:
-                break
-            if asset.asset_type not in asset_types_seen:
-                selected.append(asset)
-                asset_types_seen.add(asset.asset_type)
-        
-        # Second pass: fill remaining slots
-        for asset in candidates:
-            if len(selected) >= max_assets:
-                break
-            if asset not in selected:
-                selected.append(asset)
-        
-        # Ensure minimum diversification
-        if len(selected) < min_diversification:
-            selected = candidates[:max(max_assets, min_diversification)]
-        
-        return selected[:max_assets]
+        index = CandidateIndex.from_signatures(candidates)
+        rows = self._select_rows(index, np.arange(len(candidates)), template)
+        return [candidates[row] for row in rows.tolist()]
+    
+    def _select_rows(
+        self,
+        index: CandidateIndex,
+        candidate_rows: np.ndarray,
+        template: Dict
+    ) -> np.ndarray:
+        """
+        Select candidate rows by score, covering one asset of each type first
+        
+        Candidates are ranked by the template's selection_score (or the
+        engine's), independent of the order the universe was supplied in.
+        
+        Returns:
+            Selected universe rows, in selection order
+        """
+        scores = index.scores(candidate_rows, template.get("selection_score", self.selection_score))
+        picked = select_diverse_top_k(
+            scores,
+            index.asset_type_codes[candidate_rows],
+            template["max_assets"],
+            template.get("min_diversification", 2)
+        )
+        return candidate_rows[picked]
     
     def _calculate_weights(
         self,
         assets: List[RiskSignature],
-        template: Dict
+        template: Dict,
+        strategy_id: str = None
     ) -> List[int]:
         """Calculate optimal allocation weights"""
         n = len(assets)
         if n == 0:
             return []
         
+        if self.optimizer is not None:
+            return self._optimize_weights(assets, template, strategy_id)
+        
         # Base equal weight
         base_weight = 10000 // n
         weights = [base_weight] * n
@@ -253,6 +413,50 @@ class PraxosAIEngine:
         
         return weights
     
+    def _optimize_weights(
+        self,
+        assets: List[RiskSignature],
+        template: Dict,
+        strategy_id: str = None
+    ) -> List[int]:
+        """Calculate weights with the configured portfolio optimizer"""
+        addresses = [asset.asset_address for asset in assets]
+        max_weight = template.get("max_weight_bps", self.optimizer.max_weight * 10000) / 10000.0
+        
+        # Warm-start from the previous solution for the assets still selected
+        warm_start = None
+        previous = self._previous_weights.get(strategy_id)
+        if previous:
+            fallback = 1.0 / len(assets)
+            warm_start = np.array([previous.get(address, fallback) for address in addresses])
+        
+        weights = self.optimizer.optimize(
+            np.array([asset.annual_yield / 100.0 for asset in assets]),
+            self._covariance(assets),
+            max_weight=max_weight,
+            warm_start=warm_start
+        )
+        if strategy_id is not None:
+            self._previous_weights[strategy_id] = dict(zip(addresses, weights.tolist()))
+        return to_basis_points(weights, max_weight)
+    
+    def _covariance(self, assets: List[RiskSignature]) -> np.ndarray:
+        """Covariance matrix of the assets, from the simulator's correlation engine when possible"""
+        engine = self.risk_simulator.correlation_engine
+        addresses = [asset.asset_address for asset in assets]
+        with self.risk_simulator.lock:
+            if all(address in engine for address in addresses):
+                return engine.submatrix(addresses)
+            
+            # Stable across processes, unlike hash() of the type name
+            store = self.risk_simulator.signature_store
+            codes = np.array([store.type_code(asset.asset_type) for asset in assets])
+        tiers = np.array([asset.risk_tier for asset in assets])
+        correlation = factor_correlation(codes, tiers, codes, tiers)
+        np.fill_diagonal(correlation, 1.0)
+        vols = np.array([asset.volatility for asset in assets])
+        return correlation * np.outer(vols, vols)
+    
     def _calculate_expected_yield(
         self,
         assets: List[RiskSignature],
@@ -309,12 +513,39 @@ class PraxosAIEngine:
         
         return base_name
     
+    def evaluate_strategy_risk(
+        self,
+        strategies: List[VaultStrategy],
+        monte_carlo: MonteCarloEngine = None
+    ) -> List[StrategyRiskReport]:
+        """
+        Estimate VaR / CVaR for strategies with a Monte Carlo simulation
+        
+        All strategies are priced in one pass over a shared path matrix.
+        
+        Args:
+            strategies: Strategies to evaluate (e.g. from generate_vault_strategies)
+            monte_carlo: Configured engine (a default MonteCarloEngine if omitted)
+            
+        Returns:
+            One StrategyRiskReport per strategy, in input order
+        """
+        if monte_carlo is None:
+            monte_carlo = MonteCarloEngine()
+        
+        signatures = {
+            address: self.risk_simulator.get_risk_signature(address)
+            for strategy in strategies
+            for address in strategy.assets
+        }
+        # Dict order matches the engine's first-appearance asset ordering
+        with self.risk_simulator.lock:
+            correlation = self.risk_simulator.correlation_engine.submatrix(list(signatures), covariance=False)
+        return monte_carlo.evaluate_strategies(strategies, signatures, correlation)
+    
     def get_strategy_by_id(self, strategy_id: str) -> VaultStrategy:
-        """Get a specific strategy by ID"""
-        for strategy in self.generated_strategies:
-            if strategy.strategy_id == strategy_id:
-                return strategy
-        return None
+        """Get the most recently generated strategy with the given ID"""
+        return self.strategy_registry.get(strategy_id)
 
 
 if __name__ == "__main__":
@@ -348,4 +579,10 @@ if __name__ == "__main__":
         print(f"  Expected Yield: {strategy.expected_yield:.2f}%")
         print(f"  Diversification: {strategy.diversification_score:.1f}")
         print(f"  Assets: {len(strategy.assets)}")
+    
+    reports = engine.evaluate_strategy_risk(strategies, MonteCarloEngine(seed=42))
+    for report in reports:
+        print(f"\n{report.strategy_id} ({report.confidence:.0%}, {report.horizon_days}d):")
+        print(f"  VaR: {report.var:.2%}")
+        print(f"  CVaR: {report.cvar:.2%}")
 
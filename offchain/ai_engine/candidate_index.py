@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Praxos Candidate Index
+Pre-built index over a signature universe for fast strategy template filtering
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from simulation.risk_model import RiskSignature
+
+
+class CandidateIndex:
+    """
+    Index of a signature universe for template candidate queries
+
+    Assets are bucketed by risk tier. Each bucket holds its rows sorted by
+    maturity_days and by credit_score, so the duration window and minimum
+    credit score of a template become bisect range queries; the remaining
+    criteria are applied as boolean masks over the (already narrowed) range.
+    Queries return universe row numbers in ascending order, i.e. the same
+    order as the input signatures.
+    """
+
+    # Numeric RiskSignature fields held as columns (usable for filtering and scoring)
+    NUMERIC_FIELDS = (
+        "risk_tier", "annual_yield", "maturity_days", "credit_score",
+        "volatility", "liquidity_score", "counterparty_risk"
+    )
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        asset_type_codes: np.ndarray,
+        orderings: Dict[str, np.ndarray] = None
+    ):
+        """
+        Args:
+            columns: Universe columns by RiskSignature field name, one entry
+                per row (risk_tier, credit_score, annual_yield and
+                maturity_days are required)
+            asset_type_codes: Non-negative integer asset type code per row
+            orderings: Precomputed row orderings from another index over the
+                same columns (see `orderings`), to skip sorting
+        """
+        self.columns = {name: np.asarray(values) for name, values in columns.items()}
+        self.asset_type_codes = np.asarray(asset_type_codes, dtype=np.int64)
+        self.risk_tier = self.columns["risk_tier"]
+        self.credit_score = self.columns["credit_score"]
+        self.annual_yield = self.columns["annual_yield"]
+        self.maturity_days = self.columns["maturity_days"]
+        self.size = len(self.risk_tier)
+
+        if orderings is None:
+            # Rows grouped by tier, and within each tier sorted by maturity / credit
+            # (lexsort is stable, so ties keep universe order)
+            orderings = {
+                "by_tier": np.argsort(self.risk_tier, kind="stable"),
+                "by_maturity": np.lexsort((self.maturity_days, self.risk_tier)),
+                "by_credit": np.lexsort((self.credit_score, self.risk_tier))
+            }
+        self.orderings = orderings
+
+        self._buckets: Dict[int, Dict[str, np.ndarray]] = {}
+        by_tier = orderings["by_tier"]
+        tiers, starts = np.unique(self.risk_tier[by_tier], return_index=True)
+        ends = np.append(starts[1:], self.size)
+        for tier, lo, hi in zip(tiers.tolist(), starts.tolist(), ends.tolist()):
+            by_maturity = orderings["by_maturity"][lo:hi]
+            by_credit = orderings["by_credit"][lo:hi]
+            self._buckets[tier] = {
+                "rows": by_tier[lo:hi],
+                "by_maturity": by_maturity,
+                "maturity": self.maturity_days[by_maturity],
+                "by_credit": by_credit,
+                "credit": self.credit_score[by_credit]
+            }
+
+    @classmethod
+    def from_signatures(cls, signatures: Sequence[RiskSignature]) -> "CandidateIndex":
+        """Build an index over a list of risk signatures (rows = list positions)"""
+        if isinstance(signatures, SignatureColumns):
+            return signatures.index()
+        n = len(signatures)
+        columns = {
+            name: np.fromiter((getattr(s, name) for s in signatures), dtype=np.float64, count=n)
+            for name in cls.NUMERIC_FIELDS
+        }
+        columns["risk_tier"] = columns["risk_tier"].astype(np.int64)
+        columns["maturity_days"] = columns["maturity_days"].astype(np.int64)
+
+        vocabulary: Dict[str, int] = {}
+        codes = np.fromiter(
+            (vocabulary.setdefault(s.asset_type, len(vocabulary)) for s in signatures),
+            dtype=np.int64, count=n
+        )
+        return cls(columns, codes)
+
+    def scores(self, rows: np.ndarray, weights: Dict[str, float]) -> np.ndarray:
+        """Linear score sum(weight * column) for the given rows"""
+        total = np.zeros(len(rows))
+        for name, weight in weights.items():
+            total += weight * self.columns[name][rows]
+        return total
+
+    def query(self, template: Dict) -> np.ndarray:
+        """
+        Get the rows matching a strategy template's filter criteria
+
+        Criteria: risk tier within +/-1 of the template tier, optional
+        min_credit_score and min_yield, and maturity within 50% of the
+        target duration when the template has one.
+
+        Returns:
+            Matching rows in ascending order
+        """
+        target_tier = template["risk_tier"]
+        target_duration = template["target_duration"]
+        min_credit = template.get("min_credit_score")
+        min_yield = template.get("min_yield")
+
+        matches: List[np.ndarray] = []
+        for tier, bucket in self._buckets.items():
+            if abs(tier - target_tier) > 1:
+                continue
+
+            if target_duration > 0:
+                window = target_duration * 0.5
+                lo = np.searchsorted(bucket["maturity"], target_duration - window, side="left")
+                hi = np.searchsorted(bucket["maturity"], target_duration + window, side="right")
+                rows = bucket["by_maturity"][lo:hi]
+                if min_credit is not None:
+                    rows = rows[self.credit_score[rows] >= min_credit]
+            elif min_credit is not None:
+                lo = np.searchsorted(bucket["credit"], min_credit, side="left")
+                rows = bucket["by_credit"][lo:]
+            else:
+                rows = bucket["rows"]
+
+            if min_yield is not None:
+                rows = rows[self.annual_yield[rows] >= min_yield]
+            matches.append(rows)
+
+        if not matches:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.concatenate(matches))
+
+
+class SignatureColumns:
+    """
+    Columnar signature universe filled chunk by chunk
+
+    A read-only sequence of RiskSignatures that keeps one array per numeric
+    field, an asset type code and the address of each row, and materializes
+    a RiskSignature only when a row is read. Strategy construction reads the
+    few selected rows, and CandidateIndex.from_signatures indexes the arrays
+    directly, so a streamed universe can be allocated without keeping its
+    signatures.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Number of rows the universe will hold
+        """
+        self.columns = {name: np.zeros(capacity, dtype=np.float64) for name in CandidateIndex.NUMERIC_FIELDS}
+        self.asset_type_codes = np.zeros(capacity, dtype=np.int64)
+        self.addresses: List[str] = []
+        self.asset_types: List[str] = []
+        self._type_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def extend(self, signatures: Sequence[RiskSignature]):
+        """Append signatures as the next rows (they are not referenced afterwards)"""
+        start, stop = len(self.addresses), len(self.addresses) + len(signatures)
+        if stop > len(self.asset_type_codes):
+            raise ValueError("More signatures than the universe capacity")
+        for name, column in self.columns.items():
+            column[start:stop] = [getattr(s, name) for s in signatures]
+        self.asset_type_codes[start:stop] = [self._type_code(s.asset_type) for s in signatures]
+        self.addresses.extend(s.asset_address for s in signatures)
+
+    def __getitem__(self, row: int) -> RiskSignature:
+        """Materialize the signature at a row"""
+        if not 0 <= row < len(self.addresses):
+            raise IndexError(f"Row {row} out of range")
+        cols = self.columns
+        maturity_days = int(cols["maturity_days"][row])
+        return RiskSignature(
+            asset_address=self.addresses[row],
+            asset_type=self.asset_types[self.asset_type_codes[row]],
+            risk_tier=int(cols["risk_tier"][row]),
+            annual_yield=float(cols["annual_yield"][row]),
+            maturity_days=maturity_days,
+            credit_score=float(cols["credit_score"][row]),
+            volatility=float(cols["volatility"][row]),
+            liquidity_score=int(cols["liquidity_score"][row]),
+            counterparty_risk=float(cols["counterparty_risk"][row]),
+            duration=maturity_days / 365.0
+        )
+
+    def index(self) -> CandidateIndex:
+        """CandidateIndex over the rows filled so far"""
+        n = len(self.addresses)
+        columns = {name: column[:n] for name, column in self.columns.items()}
+        columns["risk_tier"] = columns["risk_tier"].astype(np.int64)
+        columns["maturity_days"] = columns["maturity_days"].astype(np.int64)
+        return CandidateIndex(columns, self.asset_type_codes[:n])
+
+    def _type_code(self, asset_type: str) -> int:
+        code = self._type_index.get(asset_type)
+        if code is None:
+            code = self._type_index[asset_type] = len(self.asset_types)
+            self.asset_types.append(asset_type)
+        return code
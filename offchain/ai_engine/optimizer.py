@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Praxos Portfolio Optimizer
+Mean-variance, minimum-variance and risk-parity weighting for vault strategies
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+
+class PortfolioOptimizer:
+    """
+    Long-only portfolio optimizer with per-asset weight caps
+
+    All modes are solved with vectorized iterative methods (accelerated
+    projected gradient for the quadratic objectives, multiplicative risk
+    budgeting for risk parity) and can be warm-started from a previous
+    solution.
+    """
+
+    MODES = ("mean-variance", "min-variance", "risk-parity")
+
+    def __init__(
+        self,
+        mode: str = "mean-variance",
+        risk_aversion: float = 4.0,
+        max_weight: float = 1.0,
+        max_iterations: int = 500,
+        tolerance: float = 1e-8
+    ):
+        """
+        Args:
+            mode: One of MODES
+            risk_aversion: Variance penalty for mean-variance (higher = more conservative)
+            max_weight: Default per-asset weight cap, as a fraction of the portfolio
+            max_iterations: Iteration limit for the solvers
+            tolerance: Convergence threshold on the weight change
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown optimizer mode {mode}, expected one of {self.MODES}")
+        self.mode = mode
+        self.risk_aversion = risk_aversion
+        self.max_weight = max_weight
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+
+    def optimize(
+        self,
+        expected_returns: np.ndarray,
+        covariance: np.ndarray,
+        max_weight: Optional[float] = None,
+        warm_start: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Solve for portfolio weights
+
+        Args:
+            expected_returns: Expected annual return per asset (fractions)
+            covariance: Asset covariance matrix
+            max_weight: Per-asset cap overriding the default (raised to 1/n if infeasible)
+            warm_start: Initial weights, e.g. the previous solution
+
+        Returns:
+            Weights summing to 1
+        """
+        mu = np.asarray(expected_returns, dtype=np.float64)
+        sigma = np.asarray(covariance, dtype=np.float64)
+        n = len(mu)
+        if n == 0:
+            return np.zeros(0)
+
+        cap = max(self.max_weight if max_weight is None else max_weight, 1.0 / n)
+        if warm_start is not None and len(warm_start) == n and np.sum(warm_start) > 0:
+            w0 = project_capped_simplex(np.asarray(warm_start, dtype=np.float64), cap)
+        else:
+            w0 = np.full(n, 1.0 / n)
+
+        if self.mode == "risk-parity":
+            return self._risk_parity(sigma, cap, w0)
+        if self.mode == "min-variance":
+            mu = np.zeros(n)
+        return self._mean_variance(mu, sigma, cap, w0)
+
+    def _mean_variance(self, mu: np.ndarray, sigma: np.ndarray, cap: float, w0: np.ndarray) -> np.ndarray:
+        """Minimize (lambda/2) w'Sw - mu'w over the capped simplex (FISTA)"""
+        lam = self.risk_aversion
+        lipschitz = lam * float(np.linalg.eigvalsh(sigma)[-1]) if len(mu) > 1 else lam * float(sigma.ravel()[0])
+        step = 1.0 / max(lipschitz, 1e-12)
+
+        w = w0
+        y = w0
+        t = 1.0
+        for _ in range(self.max_iterations):
+            gradient = lam * (sigma @ y) - mu
+            w_next = project_capped_simplex(y - step * gradient, cap)
+            t_next = (1.0 + np.sqrt(1.0 + 4.0 * t * t)) / 2.0
+            y = w_next + ((t - 1.0) / t_next) * (w_next - w)
+            converged = np.max(np.abs(w_next - w)) < self.tolerance
+            w, t = w_next, t_next
+            if converged:
+                break
+        return w
+
+    def _risk_parity(self, sigma: np.ndarray, cap: float, w0: np.ndarray) -> np.ndarray:
+        """Equalize risk contributions with damped multiplicative updates"""
+        n = len(w0)
+        budget = 1.0 / n
+        w = np.maximum(w0, 1e-12)
+        for _ in range(self.max_iterations):
+            marginal = sigma @ w
+            total = float(w @ marginal)
+            if total <= 0:
+                break
+            contributions = w * marginal / total
+            w_next = project_capped_simplex(w * np.sqrt(budget / np.maximum(contributions, 1e-18)), cap)
+            converged = np.max(np.abs(w_next - w)) < self.tolerance
+            w = np.maximum(w_next, 1e-12)
+            if converged:
+                break
+        return w / w.sum()
+
+
+def project_capped_simplex(v: np.ndarray, cap: float) -> np.ndarray:
+    """
+    Euclidean projection onto {w : sum(w) = 1, 0 <= w <= cap}
+
+    The projection is clip(v - tau, 0, cap) for the shift tau where the clipped
+    sum equals 1. That sum is piecewise linear in tau with breakpoints at v and
+    v - cap; it is evaluated at every breakpoint with prefix sums over sorted v
+    (O(n log n)) and tau is interpolated exactly within the bracketing segment.
+    """
+    n = len(v)
+    cap = max(cap, 1.0 / n)
+    ordered = np.sort(v)
+    prefix = np.concatenate(([0.0], np.cumsum(ordered)))
+    breakpoints = np.sort(np.concatenate((ordered - cap, ordered)))
+
+    # For each breakpoint tau: assets in [partial, full) lie strictly inside
+    # (tau, tau + cap) and contribute v - tau, assets from `full` on contribute cap
+    partial = np.searchsorted(ordered, breakpoints, side="right")
+    full = np.searchsorted(ordered, breakpoints + cap, side="left")
+    sums = cap * (n - full) + (prefix[full] - prefix[partial]) - breakpoints * (full - partial)
+
+    k = int(np.searchsorted(-sums, -1.0))
+    if k == 0:
+        tau = breakpoints[0]
+    else:
+        lo, hi = breakpoints[k - 1], breakpoints[k]
+        f_lo, f_hi = sums[k - 1], sums[k]
+        tau = lo + (f_lo - 1.0) * (hi - lo) / (f_lo - f_hi) if f_lo > f_hi else hi
+    return np.clip(v - tau, 0.0, cap)
+
+
+def to_basis_points(weights: np.ndarray, max_weight: float = 1.0) -> List[int]:
+    """
+    Round fractional weights to integer basis points summing to exactly 10000
+
+    Uses largest-remainder rounding while keeping every weight within the
+    cap (expressed as a fraction, raised to 1/n if infeasible).
+    """
+    n = len(weights)
+    if n == 0:
+        return []
+    cap_bps = max(int(np.floor(max_weight * 10000)), -(-10000 // n))
+
+    raw = np.asarray(weights, dtype=np.float64) * 10000
+    bps = np.minimum(np.floor(raw).astype(np.int64), cap_bps)
+    remainder = 10000 - int(bps.sum())
+    if remainder > 0:
+        # Hand out the missing points by largest fractional part, respecting the cap
+        order = np.argsort(-(raw - np.floor(raw)), kind="stable")
+        while remainder > 0:
+            for i in order:
+                if remainder == 0:
+                    break
+                if bps[i] < cap_bps:
+                    bps[i] += 1
+                    remainder -= 1
+    return bps.tolist()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Praxos Parallel Strategy Builder
+Fans strategy templates out to a process pool over a shared-memory signature universe
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+import multiprocessing
+
+import numpy as np
+
+from simulation.risk_model import RiskSignature
+from ai_engine.candidate_index import CandidateIndex
+
+
+# Layout of the shared universe block: a float64 section with one row per
+# numeric field, followed by an int64 section with the asset type codes and
+# the index's precomputed row orderings
+FLOAT_FIELDS = CandidateIndex.NUMERIC_FIELDS
+INT_FIELDS = ("asset_type_code", "by_tier", "by_maturity", "by_credit")
+_INTEGER_COLUMNS = ("risk_tier", "maturity_days", "liquidity_score")
+
+# Per-worker cache of the currently attached universe
+_worker_universe: Dict = {}
+
+
+class ParallelStrategyBuilder:
+    """
+    Builds vault strategies for many templates on a process pool
+
+    The signature universe is published once per call as a single columnar
+    shared-memory block; workers attach to it instead of receiving a pickled
+    RiskSignature list, and return strategies that reference universe rows,
+    which are mapped back to asset addresses in the parent. The engine's
+    optimizer warm starts travel the same way: each task gets its
+    strategy's previous weights keyed by row, and the weights it optimized
+    are merged back into the engine. Results are returned in template
+    order, so the merge is deterministic.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, mp_context: str = None):
+        """
+        Args:
+            max_workers: Pool size (defaults to the CPU count)
+            mp_context: Multiprocessing start method ("fork", "spawn", ...)
+        """
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._start_method: Optional[str] = None
+
+    def build(
+        self,
+        engine,
+        available_assets: Sequence[RiskSignature],
+        index: CandidateIndex,
+        templates: List[Tuple[str, Dict]]
+    ) -> List:
+        """
+        Construct one strategy per template in parallel
+
+        Args:
+            engine: PraxosAIEngine whose optimizer / selection settings are
+                used; its optimizer warm starts are read and updated
+            available_assets: Signature universe (rows of `index`)
+            index: CandidateIndex over available_assets
+            templates: (strategy_id, template) pairs
+
+        Returns:
+            VaultStrategy (or None when no assets qualify) per template, in order
+        """
+        if not templates:
+            return []
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, _block_bytes(index.size)))
+        try:
+            floats, ints = _block_views(shm, index.size)
+            for i, name in enumerate(FLOAT_FIELDS):
+                floats[i] = index.columns[name]
+            ints[0] = index.asset_type_codes
+            for i, name in enumerate(INT_FIELDS[1:], start=1):
+                ints[i] = index.orderings[name]
+            del floats, ints
+
+            pool = self._pool()
+            # Forked workers share our resource tracker; others must not track the block
+            untrack = self._start_method != "fork"
+            vocabulary = self._type_vocabulary(available_assets, index)
+            settings = (engine.optimizer, engine.selection_score)
+            warm_starts = self._row_warm_starts(engine._previous_weights, available_assets, templates)
+            tasks = [
+                (shm.name, index.size, untrack, vocabulary, settings, strategy_id, template, warm_starts.get(strategy_id))
+                for strategy_id, template in templates
+            ]
+            results = list(pool.map(_build_strategy, tasks))
+        finally:
+            shm.close()
+            shm.unlink()
+
+        strategies = []
+        for (strategy_id, _), (strategy, weights) in zip(templates, results):
+            if strategy is not None:
+                strategy.assets = [available_assets[int(row)].asset_address for row in strategy.assets]
+            if weights is not None:
+                engine._previous_weights[strategy_id] = {
+                    available_assets[int(row)].asset_address: weight for row, weight in weights.items()
+                }
+            strategies.append(strategy)
+        return strategies
+
+    def close(self):
+        """Shut down the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            context = multiprocessing.get_context(self.mp_context)
+            self._start_method = context.get_start_method()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        return self._executor
+
+    @staticmethod
+    def _row_warm_starts(
+        previous_weights: Dict[str, Dict[str, float]],
+        available_assets: Sequence[RiskSignature],
+        templates: List[Tuple[str, Dict]]
+    ) -> Dict[str, Dict[str, float]]:
+        """Previous weights of the templates' strategies, keyed by the universe rows of their assets"""
+        previous = {
+            strategy_id: previous_weights[strategy_id]
+            for strategy_id, _ in templates if previous_weights.get(strategy_id)
+        }
+        if not previous:
+            return {}
+
+        wanted = set().union(*previous.values())
+        addresses = getattr(available_assets, "addresses", None)
+        if addresses is None:
+            addresses = [asset.asset_address for asset in available_assets]
+        rows_by_address: Dict[str, List[int]] = {}
+        for row, address in enumerate(addresses):
+            if address in wanted:
+                rows_by_address.setdefault(address, []).append(row)
+
+        # Workers name each asset by its row (see _RowSignatures)
+        return {
+            strategy_id: {
+                str(row): weight
+                for address, weight in weights.items()
+                for row in rows_by_address.get(address, ())
+            }
+            for strategy_id, weights in previous.items()
+        }
+
+    @staticmethod
+    def _type_vocabulary(available_assets: Sequence[RiskSignature], index: CandidateIndex) -> List[str]:
+        """Asset type name for each type code used by the index"""
+        codes = index.asset_type_codes
+        present, first_rows = np.unique(codes, return_index=True)
+        vocabulary = [""] * (int(present.max()) + 1 if len(present) else 0)
+        for code, row in zip(present.tolist(), first_rows.tolist()):
+            vocabulary[code] = available_assets[row].asset_type
+        return vocabulary
+
+
+class _RowSignatures:
+    """Sequence view materializing RiskSignatures from shared columns on access"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], codes: np.ndarray, vocabulary: List[str]):
+        self._columns = columns
+        self._codes = codes
+        self._vocabulary = vocabulary
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __getitem__(self, row: int) -> RiskSignature:
+        cols = self._columns
+        maturity_days = int(cols["maturity_days"][row])
+        return RiskSignature(
+            asset_address=str(row),  # mapped back to the real address by the parent
+            asset_type=self._vocabulary[int(self._codes[row])],
+            risk_tier=int(cols["risk_tier"][row]),
+            annual_yield=float(cols["annual_yield"][row]),
+            maturity_days=maturity_days,
+            credit_score=float(cols["credit_score"][row]),
+            volatility=float(cols["volatility"][row]),
+            liquidity_score=int(cols["liquidity_score"][row]),
+            counterparty_risk=float(cols["counterparty_risk"][row]),
+            duration=maturity_days / 365.0
+        )
+
+
+def _block_bytes(size: int) -> int:
+    return 8 * size * (len(FLOAT_FIELDS) + len(INT_FIELDS))
+
+
+def _block_views(shm: shared_memory.SharedMemory, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Float and int sections of a shared universe block"""
+    floats = np.ndarray((len(FLOAT_FIELDS), size), dtype=np.float64, buffer=shm.buf)
+    ints = np.ndarray(
+        (len(INT_FIELDS), size), dtype=np.int64, buffer=shm.buf, offset=8 * size * len(FLOAT_FIELDS)
+    )
+    return floats, ints
+
+
+def _attach_universe(shm_name: str, size: int, untrack: bool, vocabulary: List[str]):
+    """Attach to (and index) a shared universe, reusing it across tasks"""
+    if _worker_universe.get("name") == shm_name:
+        return _worker_universe["index"], _worker_universe["assets"]
+
+    if "shm" in _worker_universe:
+        _worker_universe.pop("shm").close()
+    _worker_universe.clear()
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    if untrack:
+        # Keep this process's resource tracker from unlinking the parent's block
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+
+    floats, ints = _block_views(shm, size)
+    columns = {name: floats[i] for i, name in enumerate(FLOAT_FIELDS)}
+    for name in _INTEGER_COLUMNS:
+        columns[name] = columns[name].astype(np.int64)
+    codes = ints[0]
+    orderings = {name: ints[i] for i, name in enumerate(INT_FIELDS) if i > 0}
+
+    index = CandidateIndex(columns, codes, orderings)
+    assets = _RowSignatures(columns, codes, vocabulary)
+    _worker_universe.update(name=shm_name, shm=shm, index=index, assets=assets)
+    return index, assets
+
+
+def _build_strategy(task):
+    """
+    Worker entry point: construct one strategy against the shared universe
+
+    Returns the strategy (or None) and the weights the optimizer chose for
+    it, keyed by row (None when the optimizer did not run).
+    """
+    shm_name, size, untrack, vocabulary, (optimizer, selection_score), strategy_id, template, warm_start = task
+    # Imported here to avoid a circular import with allocation_engine
+    from ai_engine.allocation_engine import PraxosAIEngine
+    from simulation.risk_model import RiskSimulator
+
+    index, assets = _attach_universe(shm_name, size, untrack, vocabulary)
+    engine = PraxosAIEngine(RiskSimulator(enable_cache=False), optimizer, selection_score)
+    if warm_start:
+        engine._previous_weights[strategy_id] = warm_start
+    strategy = engine._construct_strategy(strategy_id, template, assets, index)
+    weights = engine._previous_weights.get(strategy_id)
+    return strategy, weights if weights is not warm_start else None
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Praxos Asset Selection
+Score-ranked top-k selection with an asset-type diversity pass
+"""
+
+import numpy as np
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k highest scores, best first
+
+    Uses argpartition, so only the k winners are sorted (O(n + k log k)).
+    Ties are broken by position, which makes the result deterministic.
+    """
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if k < n:
+        kth = np.argpartition(-scores, k - 1)[:k]
+        # Pull in every position tied with the k-th best, then break ties by position
+        threshold = scores[kth].min()
+        positions = np.flatnonzero(scores >= threshold)
+    else:
+        positions = np.arange(n)
+    return positions[np.argsort(-scores[positions], kind="stable")][:k]
+
+
+def select_diverse_top_k(
+    scores: np.ndarray,
+    type_codes: np.ndarray,
+    k: int,
+    min_diversification: int = 2
+) -> np.ndarray:
+    """
+    Pick k candidates, ranking by score but covering asset types first
+
+    First the best candidate of every asset type is taken (best types first),
+    then the remaining slots are filled with the highest-scoring candidates
+    not yet picked.
+
+    Args:
+        scores: Candidate scores (higher is better)
+        type_codes: Non-negative integer asset type code per candidate
+        k: Number of candidates to pick
+        min_diversification: If fewer than this many can be picked, fall back
+            to the plain top-k by score
+
+    Returns:
+        Positions of the picked candidates, in selection order
+    """
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if k < min_diversification:
+        return top_k_indices(scores, k)
+
+    # Diversity pass: best candidate of each present type
+    best_per_type = []
+    for code in np.flatnonzero(np.bincount(type_codes)):
+        members = np.flatnonzero(type_codes == code)
+        best_per_type.append(members[np.argmax(scores[members])])
+    best_per_type = np.array(best_per_type, dtype=np.int64)
+    order = np.lexsort((best_per_type, -scores[best_per_type]))
+    picked = best_per_type[order][:k]
+    if len(picked) == k:
+        return picked
+
+    # Fill pass: the top (k + types) overall always contain k - len(picked) unpicked candidates
+    fill = top_k_indices(scores, k + len(picked))
+    fill = fill[~np.isin(fill, picked)][:k - len(picked)]
+    return np.concatenate((picked, fill))
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Praxos Strategy Registry
+Versioned, bounded store of generated vault strategies
+"""
+
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+
+
+class StrategyRegistry:
+    """
+    Registry of generated vault strategies, grouped into generations
+
+    Every generate_vault_strategies call records one generation. Strategies
+    are indexed by strategy_id (latest generation wins) and by a hash of
+    their content, both O(1). Only the newest max_generations generations are
+    retained; older ones are dropped together with their index entries.
+    """
+
+    def __init__(self, max_generations: int = 16):
+        """
+        Args:
+            max_generations: Number of generations to retain (>= 1)
+        """
+        if max_generations < 1:
+            raise ValueError("max_generations must be at least 1")
+        self.max_generations = max_generations
+        self._generations: "OrderedDict[int, List[Tuple[str, object]]]" = OrderedDict()
+        self._latest_generation = 0
+        # strategy_id -> (generation, strategy) of its most recent version
+        self._by_id: Dict[str, Tuple[int, object]] = {}
+        # content hash -> [strategy, number of retained generations holding it]
+        self._by_hash: Dict[str, list] = {}
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._generations.values())
+
+    @property
+    def latest_generation(self) -> int:
+        """Number of the most recently recorded generation (0 if none)"""
+        return self._latest_generation
+
+    @staticmethod
+    def content_hash(strategy) -> str:
+        """SHA-256 over a canonical JSON encoding of the strategy's fields"""
+        payload = json.dumps(asdict(strategy), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def record(self, strategies: List) -> int:
+        """
+        Record a new generation of strategies
+
+        Strategies with the same content as a retained one are stored once
+        and resolved to the existing object.
+
+        Returns:
+            The new generation number
+        """
+        self._latest_generation += 1
+        generation = self._latest_generation
+
+        entries = []
+        for strategy in strategies:
+            digest = self.content_hash(strategy)
+            slot = self._by_hash.get(digest)
+            if slot is None:
+                slot = self._by_hash[digest] = [strategy, 0]
+            slot[1] += 1
+            entries.append((digest, slot[0]))
+            self._by_id[strategy.strategy_id] = (generation, slot[0])
+        self._generations[generation] = entries
+
+        while len(self._generations) > self.max_generations:
+            self._evict_oldest()
+        return generation
+
+    def get(self, strategy_id: str):
+        """Latest retained version of a strategy, or None"""
+        entry = self._by_id.get(strategy_id)
+        return entry[1] if entry else None
+
+    def get_by_hash(self, content_hash: str):
+        """Retained strategy with the given content hash, or None"""
+        slot = self._by_hash.get(content_hash)
+        return slot[0] if slot else None
+
+    def generation(self, generation: Optional[int] = None) -> List:
+        """
+        Strategies recorded in a generation
+
+        Args:
+            generation: Generation number (None = latest)
+
+        Returns:
+            The generation's strategies in recording order (empty if not retained)
+        """
+        if generation is None:
+            generation = self._latest_generation
+        return [strategy for _, strategy in self._generations.get(generation, [])]
+
+    def strategies(self) -> List:
+        """All retained strategies, oldest generation first"""
+        return [strategy for entries in self._generations.values() for _, strategy in entries]
+
+    def clear(self):
+        """Drop every generation (the generation counter keeps increasing)"""
+        self._generations.clear()
+        self._by_id.clear()
+        self._by_hash.clear()
+
+    def _evict_oldest(self):
+        generation, entries = self._generations.popitem(last=False)
+        for digest, strategy in entries:
+            slot = self._by_hash.get(digest)
+            if slot is not None:
+                slot[1] -= 1
+                if slot[1] <= 0:
+                    del self._by_hash[digest]
+            latest = self._by_id.get(strategy.strategy_id)
+            if latest is not None and latest[0] == generation:
+                del self._by_id[strategy.strategy_id]
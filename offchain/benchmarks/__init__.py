@@ -0,0 +1,7 @@
+from .cases import BenchmarkCase, CASES, synthetic_vaults
+from .runner import BenchmarkResult, compare, load_baseline, run_benchmarks, run_case, save_baseline
+
+__all__ = [
+    "BenchmarkCase", "CASES", "synthetic_vaults",
+    "BenchmarkResult", "compare", "load_baseline", "run_benchmarks", "run_case", "save_baseline"
+]
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Praxos Benchmark Cases
+Workloads for the simulator, allocation engine, suggestion agent and full pipeline
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from simulation.risk_model import RiskSimulator
+from ai_engine.allocation_engine import PraxosAIEngine
+from ai_agent.suggestion_engine import PraxosAIAgent, RiskTolerance, Timeframe, UserPreferences
+from vault_generator import VaultGenerator
+from loadgen.universe import generate_universe
+
+
+# Fixed valuation time, so runs are comparable across days
+BENCHMARK_TIMESTAMP = 1_760_000_000
+
+
+@dataclass
+class BenchmarkCase:
+    """A benchmarked workload, parameterized by universe size"""
+    name: str
+    unit: str  # What the throughput counts
+    setup: Callable[[int], Dict]  # Untimed: builds fresh state for one run
+    run: Callable[[Dict], None]  # Timed
+    teardown: Optional[Callable[[Dict], None]] = None
+
+
+def synthetic_vaults(n: int, seed: int = 11) -> List[Dict]:
+    """Deterministic vault metadata in the PraxosAIAgent.register_vault format"""
+    rng = np.random.default_rng(seed)
+    tiers = rng.integers(1, 6, n)
+    durations = rng.integers(30, 3650, n)
+    yields = np.round(rng.uniform(1.0, 15.0, n), 2)
+    return [
+        {
+            "address": f"0x{i:040x}",
+            "name": f"Vault {i}",
+            "risk_tier": int(tier),
+            "target_duration": int(duration),
+            "expected_yield": float(expected_yield),
+            "strategy": "benchmark",
+            "assets": []
+        }
+        for i, (tier, duration, expected_yield) in enumerate(zip(tiers.tolist(), durations.tolist(), yields.tolist()))
+    ]
+
+
+# Every preference class the agent distinguishes, with and without a yield floor
+USER_PROFILES = [
+    UserPreferences(timeframe, risk_tolerance, 10_000.0, min_yield)
+    for risk_tolerance in RiskTolerance
+    for timeframe in Timeframe
+    for min_yield in (None, 6.0)
+]
+
+
+def _token_columns(n: int) -> Dict:
+    tokens = generate_universe(n, seed=7, now=BENCHMARK_TIMESTAMP)
+    return {
+        "addresses": [token["address"] for token in tokens],
+        "asset_types": [token["asset_type"] for token in tokens],
+        "annual_yields": [token["annual_yield"] for token in tokens],
+        "maturities": [token["maturity_timestamp"] for token in tokens],
+        "risk_tiers": [token["risk_tier"] for token in tokens]
+    }
+
+
+def _setup_simulation(n: int) -> Dict:
+    state = _token_columns(n)
+    state["simulator"] = RiskSimulator()
+    return state
+
+
+def _run_simulate_risk(state: Dict):
+    simulate = state["simulator"].simulate_risk
+    for inputs in zip(state["addresses"], state["asset_types"], state["annual_yields"],
+                      state["maturities"], state["risk_tiers"]):
+        simulate(*inputs, BENCHMARK_TIMESTAMP)
+
+
+def _setup_repeat_simulation(n: int) -> Dict:
+    state = _setup_simulation(n)
+    _run_simulate_risk(state)
+    return state
+
+
+def _run_simulate_risk_batch(state: Dict):
+    state["simulator"].simulate_risk_batch(
+        state["addresses"], state["asset_types"], state["annual_yields"],
+        state["maturities"], state["risk_tiers"], BENCHMARK_TIMESTAMP
+    )
+
+
+def _setup_engine(n: int) -> Dict:
+    state = _setup_simulation(n)
+    simulator = state["simulator"]
+    state["signatures"] = simulator.simulate_risk_batch(
+        state["addresses"], state["asset_types"], state["annual_yields"],
+        state["maturities"], state["risk_tiers"], BENCHMARK_TIMESTAMP
+    )
+    state["engine"] = PraxosAIEngine(simulator)
+    return state
+
+
+def _run_engine(state: Dict):
+    state["engine"].generate_vault_strategies(state["signatures"])
+
+
+def _teardown_engine(state: Dict):
+    state["engine"].close()
+
+
+def _setup_agent(n: int) -> Dict:
+    agent = PraxosAIAgent()
+    for vault in synthetic_vaults(n):
+        agent.register_vault(vault)
+    return {"agent": agent}
+
+
+def _run_agent(state: Dict):
+    # A fresh agent per run, so the per-class rankings are built cold
+    suggest = state["agent"].suggest_vaults
+    for user_prefs in USER_PROFILES:
+        suggest(user_prefs)
+
+
+def _setup_pipeline(n: int) -> Dict:
+    return {"tokens": generate_universe(n, seed=7, now=BENCHMARK_TIMESTAMP), "generator": VaultGenerator()}
+
+
+def _run_pipeline(state: Dict):
+    state["generator"].process_rwa_tokens(state["tokens"])
+
+
+def _teardown_pipeline(state: Dict):
+    state["generator"].ai_engine.close()
+
+
+CASES = [
+    BenchmarkCase("simulate_risk", "tokens", _setup_simulation, _run_simulate_risk),
+    # Same inputs again (e.g. dashboard refreshes), served from the signature cache
+    BenchmarkCase("simulate_risk_repeat", "tokens", _setup_repeat_simulation, _run_simulate_risk),
+    BenchmarkCase("simulate_risk_batch", "tokens", _setup_simulation, _run_simulate_risk_batch),
+    BenchmarkCase("generate_vault_strategies", "assets", _setup_engine, _run_engine, _teardown_engine),
+    # Throughput counts registered vaults ranked, per pass over every USER_PROFILES query
+    BenchmarkCase("suggest_vaults", "vaults", _setup_agent, _run_agent),
+    BenchmarkCase("process_rwa_tokens", "tokens", _setup_pipeline, _run_pipeline, _teardown_pipeline),
+]
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Praxos Benchmark Runner
+Times the benchmark cases, records peak memory and checks results against a baseline
+"""
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Sequence
+import argparse
+import gc
+import json
+import os
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+from .cases import CASES, BenchmarkCase
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+BASELINE_FORMAT_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and memory of one case at one universe size"""
+    case: str
+    size: int
+    unit: str
+    seconds: float  # Best of the timed runs
+    items_per_second: float
+    peak_bytes: int  # Peak memory allocated by the run (tracemalloc)
+
+    @property
+    def key(self) -> str:
+        return f"{self.case}@{self.size}"
+
+
+def _run_once(case: BenchmarkCase, size: int, trace_memory: bool):
+    """Run a case on fresh state; returns (seconds, peak bytes or 0)"""
+    state = case.setup(size)
+    gc.collect()
+    try:
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        case.run(state)
+        elapsed = time.perf_counter() - start
+        peak = 0
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        return elapsed, peak
+    finally:
+        if case.teardown is not None:
+            case.teardown(state)
+
+
+def run_case(case: BenchmarkCase, size: int, repeat: int = 3) -> BenchmarkResult:
+    """
+    Benchmark one case at one size
+
+    Timed runs are made without tracemalloc (which slows allocation-heavy
+    code); one extra traced run measures peak memory. Setup is never timed.
+
+    Args:
+        case: Benchmark case
+        size: Universe size
+        repeat: Timed runs (the fastest is reported)
+    """
+    seconds = min(_run_once(case, size, trace_memory=False)[0] for _ in range(max(1, repeat)))
+    _, peak = _run_once(case, size, trace_memory=True)
+    return BenchmarkResult(
+        case=case.name,
+        size=size,
+        unit=case.unit,
+        seconds=seconds,
+        items_per_second=size / seconds if seconds > 0 else float("inf"),
+        peak_bytes=peak
+    )
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    case_names: Sequence[str] = None,
+    repeat: int = 3,
+    verbose: bool = True
+) -> List[BenchmarkResult]:
+    """Run the selected cases (default: all) at every size"""
+    cases = [case for case in CASES if not case_names or case.name in case_names]
+    results = []
+    for size in sizes:
+        for case in cases:
+            result = run_case(case, size, repeat)
+            results.append(result)
+            if verbose:
+                print(
+                    f"{result.key:<36} {result.seconds * 1000:>11.1f} ms"
+                    f" {result.items_per_second:>14,.0f} {result.unit}/s"
+                    f" {result.peak_bytes / 2**20:>10.1f} MiB peak"
+                )
+    return results
+
+
+def environment() -> Dict:
+    """Machine / interpreter description stored alongside baselines"""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def save_baseline(results: List[BenchmarkResult], path: str):
+    """Write results as a baseline JSON file"""
+    baseline = {
+        "version": BASELINE_FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "results": {result.key: asdict(result) for result in results}
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+
+
+def load_baseline(path: str) -> Dict:
+    """Read a baseline JSON file"""
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported baseline format in {path}")
+    return baseline
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: Dict,
+    tolerance: float = 0.25,
+    memory_tolerance: float = 0.25
+) -> List[str]:
+    """
+    Check results against a baseline
+
+    Args:
+        results: Current results
+        baseline: Baseline as returned by load_baseline
+        tolerance: Allowed relative throughput drop (0.25 = 25% slower)
+        memory_tolerance: Allowed relative peak memory growth
+
+    Returns:
+        Regression messages (empty if every case is within tolerance)
+    """
+    regressions = []
+    for result in results:
+        reference = baseline["results"].get(result.key)
+        if reference is None:
+            continue
+        throughput_ratio = result.items_per_second / reference["items_per_second"]
+        if throughput_ratio < 1.0 - tolerance:
+            regressions.append(
+                f"{result.key}: throughput {result.items_per_second:,.0f} {result.unit}/s is "
+                f"{(1.0 - throughput_ratio) * 100:.1f}% below baseline {reference['items_per_second']:,.0f}"
+            )
+        if reference["peak_bytes"] and result.peak_bytes > reference["peak_bytes"] * (1.0 + memory_tolerance):
+            regressions.append(
+                f"{result.key}: peak memory {result.peak_bytes / 2**20:.1f} MiB is "
+                f"{(result.peak_bytes / reference['peak_bytes'] - 1.0) * 100:.1f}% above baseline "
+                f"{reference['peak_bytes'] / 2**20:.1f} MiB"
+            )
+    return regressions
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Praxos offchain engines")
+    parser.add_argument(
+        "--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated universe sizes (e.g. 1000,10000,100000,1000000)"
+    )
+    parser.add_argument("--cases", help="Comma-separated case names (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (fastest is kept)")
+    parser.add_argument("--baseline", help="Baseline JSON to check results against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed throughput drop vs. baseline")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="Allowed peak memory growth vs. baseline")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the results as a new baseline")
+    parser.add_argument("--list", action="store_true", help="List the benchmark cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for case in CASES:
+            print(f"{case.name:<28} throughput in {case.unit}/s")
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    case_names = [name for name in args.cases.split(",") if name] if args.cases else None
+    unknown = set(case_names or ()) - {case.name for case in CASES}
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    results = run_benchmarks(sizes, case_names, args.repeat)
+
+    status = 0
+    if args.baseline:
+        regressions = compare(results, load_baseline(args.baseline), args.tolerance, args.memory_tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for message in regressions:
+                print(f"  {message}")
+            status = 1
+        else:
+            print(f"\nNo regressions against {args.baseline}")
+
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+        print(f"Baseline saved to {args.save_baseline}")
+    return status
@@ -0,0 +1,7 @@
+from .universe import ASSET_TYPE_PROFILES, AssetTypeProfile, generate_universe, to_analyze_request
+from .driver import LoadReport, build_payloads, run_load
+
+__all__ = [
+    "ASSET_TYPE_PROFILES", "AssetTypeProfile", "generate_universe", "to_analyze_request",
+    "LoadReport", "build_payloads", "run_load"
+]
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Praxos Load Driver
+Replays mixed generate / recommend / analyze traffic against a running API server
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from .universe import generate_universe, to_analyze_request
+
+
+ENDPOINTS = {
+    "generate": "/api/vaults/generate",
+    "recommend": "/api/vaults/recommend",
+    "analyze": "/api/risk/analyze",
+}
+DEFAULT_MIX = {"generate": 1, "recommend": 3, "analyze": 6}
+
+
+@dataclass
+class EndpointStats:
+    """Latencies and failures observed for one request kind"""
+    latencies: List[float] = field(default_factory=list)  # Seconds, successful requests only
+    errors: int = 0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load run"""
+    elapsed: float
+    concurrency: int
+    stats: Dict[str, EndpointStats]
+
+    def summary(self) -> Dict:
+        """Per-kind and overall request counts, throughput and latency percentiles (ms)"""
+        rows = {kind: _summarize(stats.latencies, stats.errors, self.elapsed) for kind, stats in self.stats.items()}
+        all_latencies = [latency for stats in self.stats.values() for latency in stats.latencies]
+        all_errors = sum(stats.errors for stats in self.stats.values())
+        rows["total"] = _summarize(all_latencies, all_errors, self.elapsed)
+        return rows
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of ascending values (q in 0..100)"""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, min(len(sorted_values), int(-(-q * len(sorted_values) // 100))))
+    return sorted_values[rank - 1]
+
+
+def _summarize(latencies: List[float], errors: int, elapsed: float) -> Dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered) + errors,
+        "errors": errors,
+        "throughput_rps": len(ordered) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000
+    }
+
+
+def build_payloads(
+    universe_size: int = 10_000,
+    tokens_per_request: int = 200,
+    distinct: int = 32,
+    seed: int = 0,
+    now: int = None
+) -> Dict[str, List[bytes]]:
+    """
+    Pre-encoded request bodies per request kind
+
+    Generate / recommend requests carry overlapping windows of a synthetic
+    universe and analyze requests single tokens from it, so a run mixes
+    response cache hits (repeated bodies) with fresh work.
+
+    Args:
+        universe_size: Tokens in the synthetic universe
+        tokens_per_request: Tokens per generate / recommend request
+        distinct: Distinct bodies per kind
+        seed: Seed of the universe and request parameters
+        now: Valuation time token maturities are counted from (default:
+            now); pass a fixed time for byte-identical bodies across runs
+    """
+    universe = generate_universe(universe_size, seed=seed, now=now)
+    rng = random.Random(seed)
+    window = min(tokens_per_request, universe_size)
+
+    def window_at(i: int) -> List[Dict]:
+        start = (i * window // 2) % max(1, universe_size - window + 1)
+        return universe[start:start + window]
+
+    encode = lambda body: json.dumps(body).encode("utf-8")
+    return {
+        "generate": [encode({"rwa_tokens": window_at(i)}) for i in range(distinct)],
+        "recommend": [
+            encode({
+                "user_risk_tolerance": rng.randint(1, 5),
+                "investment_horizon_days": rng.choice((180, 365, 730, 1095, 1825)),
+                "target_yield_bps": rng.choice((0, 400, 600, 800)),
+                "available_rwa_tokens": window_at(i)
+            })
+            for i in range(distinct)
+        ],
+        "analyze": [encode(to_analyze_request(token)) for token in rng.sample(universe, min(distinct, universe_size))]
+    }
+
+
+def _send(url: str, body: bytes, timeout: float) -> int:
+    """POST a JSON body and read the whole response; returns the status code"""
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"}, method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        return e.code
+
+
+def run_load(
+    base_url: str,
+    payloads: Dict[str, List[bytes]],
+    mix: Dict[str, float] = None,
+    concurrency: int = 8,
+    duration: float = 30.0,
+    max_requests: int = None,
+    timeout: float = 60.0,
+    seed: int = 0
+) -> LoadReport:
+    """
+    Drive traffic from concurrent client threads
+
+    Each thread sends requests back to back (closed loop), picking the kind
+    by the mix weights and the body from that kind's payloads, until the
+    duration elapses or max_requests have been sent.
+
+    Args:
+        base_url: Server root, e.g. http://localhost:5000
+        payloads: Request bodies per kind (see build_payloads)
+        mix: Relative weight per kind (default DEFAULT_MIX)
+        concurrency: Client threads
+        duration: Seconds to run
+        max_requests: Stop after this many requests (default: no limit)
+        timeout: Per-request timeout in seconds
+        seed: Seed of the request sequence
+    """
+    mix = {kind: weight for kind, weight in (mix or DEFAULT_MIX).items() if weight > 0}
+    unknown = set(mix) - set(ENDPOINTS)
+    if unknown:
+        raise ValueError(f"Unknown request kinds: {', '.join(sorted(unknown))}")
+    kinds, weights = list(mix), list(mix.values())
+    stats = {kind: EndpointStats() for kind in kinds}
+    lock = threading.Lock()
+    sent = 0
+    start = time.perf_counter()
+    deadline = start + duration
+
+    def client(worker: int):
+        nonlocal sent
+        rng = random.Random(seed * 1000 + worker)
+        while time.perf_counter() < deadline:
+            with lock:
+                if max_requests is not None and sent >= max_requests:
+                    return
+                sent += 1
+            kind = rng.choices(kinds, weights)[0]
+            body = rng.choice(payloads[kind])
+            began = time.perf_counter()
+            try:
+                status = _send(base_url.rstrip("/") + ENDPOINTS[kind], body, timeout)
+            except (OSError, urllib.error.URLError):
+                status = 0  # connection failure / timeout
+            latency = time.perf_counter() - began
+            with lock:
+                kind_stats = stats[kind]
+                kind_stats.status_counts[status] = kind_stats.status_counts.get(status, 0) + 1
+                if 200 <= status < 300:
+                    kind_stats.latencies.append(latency)
+                else:
+                    kind_stats.errors += 1
+
+    threads = [threading.Thread(target=client, args=(worker,), daemon=True) for worker in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return LoadReport(elapsed=time.perf_counter() - start, concurrency=concurrency, stats=stats)
+
+
+def print_report(report: LoadReport):
+    """Print a load report as a table"""
+    print(f"{report.concurrency} clients, {report.elapsed:.1f} s")
+    print(f"{'kind':<10} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for kind, row in report.summary().items():
+        print(
+            f"{kind:<10} {row['requests']:>9} {row['errors']:>7} {row['throughput_rps']:>9.1f}"
+            f" {row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f}"
+        )
+
+
+def _parse_mix(text: str) -> Dict[str, float]:
+    """Parse "generate=1,recommend=3,analyze=6" """
+    mix = {}
+    for part in text.split(","):
+        kind, _, weight = part.partition("=")
+        mix[kind.strip()] = float(weight or 1)
+    return mix
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay mixed traffic against a Praxos API server")
+    parser.add_argument("--url", default="http://localhost:5000", help="Server root URL")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent client threads")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--requests", type=int, help="Stop after this many requests")
+    parser.add_argument("--mix", default="generate=1,recommend=3,analyze=6", help="Relative weight per request kind")
+    parser.add_argument("--universe-size", type=int, default=10_000, help="Tokens in the synthetic universe")
+    parser.add_argument("--tokens-per-request", type=int, default=200, help="Tokens per generate / recommend request")
+    parser.add_argument("--distinct", type=int, default=32, help="Distinct request bodies per kind")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+    parser.add_argument("--json", metavar="PATH", help="Also write the summary as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = _parse_mix(args.mix)
+        payloads = build_payloads(args.universe_size, args.tokens_per_request, args.distinct, args.seed)
+        report = run_load(
+            args.url, payloads, mix, args.concurrency, args.duration, args.requests, args.timeout, args.seed
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"concurrency": report.concurrency, "elapsed": report.elapsed, "summary": report.summary()}, f, indent=2)
+    return 1 if any(stats.errors for stats in report.stats.values()) else 0
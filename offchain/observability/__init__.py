@@ -0,0 +1,4 @@
+from . import metrics
+from . import profiling
+
+__all__ = ["metrics", "profiling"]
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Praxos Metrics
+Low-overhead stage timing histograms and counters with Prometheus text export
+"""
+
+from bisect import bisect_left
+from contextlib import nullcontext
+from contextvars import ContextVar
+from time import perf_counter, sleep
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import json
+import os
+import threading
+import uuid
+
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+class Histogram:
+    """Cumulative-bucket histogram with one series per label combination"""
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float], label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.label_names = tuple(label_names)
+        # labels -> [per-bucket counts (last = +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Tuple[str, ...] = ()):
+        """Record one observation for a label combination (values in label_names order)"""
+        position = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][position] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(labels, list(counts), total, count) for labels, (counts, total, count) in self._series.items()]
+        for labels, counts, total, count in sorted(snapshot):
+            base = _format_labels(self.label_names, labels)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names + ('le',), labels + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{base} {total!r}")
+            lines.append(f"{self.name}_count{base} {count}")
+        return lines
+
+    def snapshot(self) -> list:
+        """Series as JSON-serializable [labels, bucket counts, sum, count] rows"""
+        with self._lock:
+            return [[list(labels), list(counts), total, count] for labels, (counts, total, count) in self._series.items()]
+
+    def merge(self, rows: list):
+        """Add the series of a snapshot (e.g. from another process)"""
+        with self._lock:
+            for labels, counts, total, count in rows:
+                series = self._series.setdefault(tuple(labels), [[0] * (len(self.buckets) + 1), 0.0, 0])
+                series[0] = [mine + theirs for mine, theirs in zip(series[0], counts)]
+                series[1] += total
+                series[2] += count
+
+    def empty_copy(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, self.buckets, self.label_names)
+
+
+class Counter:
+    """Monotonic counter with one series per label combination"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._series: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, labels: Tuple[str, ...] = ()):
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            snapshot = sorted(self._series.items())
+        for labels, value in snapshot:
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {value!r}")
+        return lines
+
+    def snapshot(self) -> list:
+        """Series as JSON-serializable [labels, value] rows"""
+        with self._lock:
+            return [[list(labels), value] for labels, value in self._series.items()]
+
+    def merge(self, rows: list):
+        """Add the series of a snapshot (e.g. from another process)"""
+        with self._lock:
+            for labels, value in rows:
+                key = tuple(labels)
+                self._series[key] = self._series.get(key, 0) + value
+
+    def empty_copy(self) -> "Counter":
+        return Counter(self.name, self.documentation, self.label_names)
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def histogram(self, name: str, documentation: str, buckets: Sequence[float], label_names: Sequence[str] = ()) -> Histogram:
+        """Get or create a histogram"""
+        if name not in self._metrics:
+            self._metrics[name] = Histogram(name, documentation, buckets, label_names)
+        return self._metrics[name]
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        """Get or create a counter"""
+        if name not in self._metrics:
+            self._metrics[name] = Counter(name, documentation, label_names)
+        return self._metrics[name]
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, list]:
+        """Series of every metric, keyed by metric name"""
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def merged(self, snapshots: Iterable[Dict[str, list]]) -> "MetricsRegistry":
+        """New registry with the same metrics holding the sum of the given snapshots"""
+        registry = MetricsRegistry()
+        for name, metric in self._metrics.items():
+            registry._metrics[name] = metric.empty_copy()
+        for snapshot in snapshots:
+            for name, rows in snapshot.items():
+                metric = registry._metrics.get(name)
+                if metric is not None:
+                    metric.merge(rows)
+        return registry
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "praxos_stage_duration_seconds", "Time spent in each vault pipeline stage", LATENCY_BUCKETS, ("stage",)
+)
+STAGE_ITEMS = REGISTRY.histogram(
+    "praxos_stage_items", "Input / output sizes of vault pipeline stages", SIZE_BUCKETS, ("stage", "kind")
+)
+REQUEST_SECONDS = REGISTRY.histogram(
+    "praxos_http_request_duration_seconds", "API request latency", LATENCY_BUCKETS, ("endpoint", "method", "status")
+)
+REQUESTS = REGISTRY.counter(
+    "praxos_http_requests_total", "API requests served", ("endpoint", "method", "status")
+)
+
+# Off unless PRAXOS_METRICS is set; when off (and no spans are traced), stage()
+# hands out a shared no-op
+_enabled = os.environ.get("PRAXOS_METRICS", "").lower() in ("1", "true", "yes")
+_tracing = False
+_NO_OP = nullcontext()
+
+# Span recorder of the current request (see observability.profiling); any
+# object with enter(name) and exit(name, start, seconds) methods
+_span_recorder: ContextVar[Optional[object]] = ContextVar("praxos_span_recorder", default=None)
+
+# Shared snapshot directory of a multi-process pool (see share_across_processes)
+SNAPSHOT_PREFIX = "worker-"
+_shared_dir: Optional[str] = None
+_snapshot_path: Optional[str] = None
+_publish_lock = threading.Lock()
+
+
+class _StageTimer:
+    __slots__ = ("name", "start", "recorder")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.recorder = _span_recorder.get() if _tracing else None
+        if self.recorder is not None:
+            self.recorder.enter(self.name)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = perf_counter() - self.start
+        if _enabled:
+            STAGE_SECONDS.observe(elapsed, (self.name,))
+        if self.recorder is not None:
+            self.recorder.exit(self.name, self.start, elapsed)
+        return False
+
+
+def enabled() -> bool:
+    """Whether metrics are being collected"""
+    return _enabled
+
+
+def set_enabled(flag: bool):
+    """Turn collection on or off at runtime"""
+    global _enabled
+    _enabled = flag
+
+
+def set_tracing(flag: bool):
+    """Turn span recording for the current request's recorder on or off process-wide"""
+    global _tracing
+    _tracing = flag
+
+
+def set_span_recorder(recorder: Optional[object]):
+    """Install (or with None, remove) the span recorder of the current thread / context"""
+    _span_recorder.set(recorder)
+
+
+def stage(name: str):
+    """
+    Context manager timing a pipeline stage
+
+    Usage:
+        with metrics.stage("simulation"):
+            ...
+    """
+    return _StageTimer(name) if _enabled or _tracing else _NO_OP
+
+
+def record_size(stage_name: str, kind: str, value: int):
+    """Record an input / output size of a stage (e.g. "filter_assets", "candidates")"""
+    if _enabled:
+        STAGE_ITEMS.observe(value, (stage_name, kind))
+
+
+def observe_request(endpoint: str, method: str, status: int, seconds: float):
+    """Record a served API request"""
+    if _enabled:
+        labels = (endpoint, method, str(status))
+        REQUEST_SECONDS.observe(seconds, labels)
+        REQUESTS.inc(1, labels)
+
+
+def share_across_processes(directory: str, interval: float = 1.0):
+    """
+    Publish this process's metrics to a directory shared with its sibling workers
+
+    The registry is written to a per-process file now and then every
+    `interval` seconds from a background thread, and render() merges the
+    files of every process in the directory, so whichever worker answers a
+    scrape reports totals for the whole pool. Files of exited workers are
+    kept, so their requests stay counted.
+
+    Args:
+        directory: Directory shared by all worker processes
+        interval: Seconds between two snapshots of this process
+    """
+    global _shared_dir, _snapshot_path
+    os.makedirs(directory, exist_ok=True)
+    _shared_dir = directory
+    _snapshot_path = os.path.join(directory, f"{SNAPSHOT_PREFIX}{os.getpid()}-{uuid.uuid4().hex[:8]}.json")
+    write_snapshot()
+    threading.Thread(target=_publish_periodically, args=(interval,), name="praxos-metrics", daemon=True).start()
+
+
+def clear_shared_snapshots(directory: str):
+    """Remove the worker snapshots left in a shared directory by a previous run"""
+    for name in os.listdir(directory):
+        if name.startswith(SNAPSHOT_PREFIX):
+            os.remove(os.path.join(directory, name))
+
+
+def write_snapshot():
+    """Write this process's metrics to its file in the shared directory (if sharing)"""
+    if _snapshot_path is None:
+        return
+    with _publish_lock:
+        temporary = _snapshot_path + ".tmp"
+        with open(temporary, "w") as handle:
+            json.dump(REGISTRY.snapshot(), handle)
+        os.replace(temporary, _snapshot_path)  # readers never see a partial file
+
+
+def _publish_periodically(interval: float):
+    while True:
+        sleep(interval)
+        try:
+            write_snapshot()
+        except OSError:
+            pass  # e.g. the directory was removed at shutdown
+
+
+def _read_snapshots(directory: str) -> Iterator[Dict[str, list]]:
+    for name in sorted(os.listdir(directory)):
+        if not (name.startswith(SNAPSHOT_PREFIX) and name.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(directory, name)) as handle:
+                yield json.load(handle)
+        except (OSError, ValueError):
+            continue
+
+
+def render() -> str:
+    """Current metrics in the Prometheus text exposition format (summed over the pool when shared)"""
+    if _shared_dir is None:
+        return REGISTRY.render()
+    write_snapshot()
+    return REGISTRY.merged(_read_snapshots(_shared_dir)).render()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Praxos Request Profiling
+Opt-in per-request cProfile capture and slow-request span breakdowns
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+import cProfile
+import hmac
+import itertools
+import json
+import os
+import random
+import threading
+import time
+
+from . import metrics
+
+
+PROFILE_HEADER = "X-Praxos-Profile"
+
+# Component owning each pipeline stage (see metrics.stage call sites)
+STAGE_COMPONENTS = {
+    "simulation": "RiskSimulator",
+    "allocation": "PraxosAIEngine",
+    "build_index": "PraxosAIEngine",
+    "filter_assets": "PraxosAIEngine",
+    "select_assets": "PraxosAIEngine",
+    "calculate_weights": "PraxosAIEngine",
+    "strategy_metrics": "PraxosAIEngine",
+    "naming": "PraxosAIEngine",
+    "register_vaults": "PraxosAIAgent",
+    "rank_vaults": "PraxosAIAgent",
+}
+
+
+@dataclass
+class Span:
+    """One timed pipeline stage within a request"""
+    name: str
+    component: str
+    parent: Optional[str]  # Enclosing stage, if any
+    start_ms: float  # Offset from the start of the request
+    duration_ms: float
+
+
+class SpanRecorder:
+    """Collects the stages timed while one request is handled"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans: List[Span] = []
+        self._stack: List[str] = []
+
+    def enter(self, name: str):
+        self._stack.append(name)
+
+    def exit(self, name: str, start: float, seconds: float):
+        self._stack.pop()
+        self.spans.append(Span(
+            name=name,
+            component=STAGE_COMPONENTS.get(name, "other"),
+            parent=self._stack[-1] if self._stack else None,
+            start_ms=(start - self.started) * 1000.0,
+            duration_ms=seconds * 1000.0
+        ))
+
+    def breakdown(self, total_ms: float) -> Dict[str, float]:
+        """
+        Milliseconds spent per component
+
+        Only the outermost span of each component is counted, so nested
+        sub-stages (e.g. allocation -> select_assets) are not double counted.
+        Time outside any component is reported as "unattributed".
+        """
+        components: Dict[str, float] = {}
+        for span in self.spans:
+            if span.parent is not None and STAGE_COMPONENTS.get(span.parent, "other") == span.component:
+                continue
+            components[span.component] = components.get(span.component, 0.0) + span.duration_ms
+        outermost = sum(span.duration_ms for span in self.spans if span.parent is None)
+        components["unattributed"] = max(0.0, total_ms - outermost)
+        return components
+
+
+class RequestProfiler:
+    """
+    Flask hooks capturing profiles of selected requests
+
+    Every request gets a span recorder (a few perf_counter calls per stage).
+    A request is additionally run under cProfile when it carries the
+    X-Praxos-Profile header with the configured token, or is picked by
+    sampling. Without a token the header is ignored, so clients cannot turn
+    profiling on by themselves. Captured requests, and
+    any request slower than the threshold, are written to the output
+    directory as <id>.json (request info, spans, per-component breakdown)
+    plus <id>.prof (pstats format) when cProfile ran.
+
+    Only one request is run under cProfile at a time; a concurrent request
+    asking for a profile gets the span breakdown only.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        sample_rate: float = 0.0,
+        slow_threshold_ms: float = 1000.0,
+        token: str = None,
+        max_files: int = 1000
+    ):
+        """
+        Args:
+            directory: Where profiles are written (created if missing)
+            sample_rate: Fraction of requests run under cProfile
+            slow_threshold_ms: Requests slower than this are captured
+            token: X-Praxos-Profile value that enables cProfile (None disables
+                the header trigger)
+            max_files: Profiles kept on disk (oldest are deleted, checked
+                every max_files / 10 writes)
+        """
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self.token = token
+        self.max_files = max_files
+        self._profiler_lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self._prune_lock = threading.Lock()
+        self._writes_since_prune = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional["RequestProfiler"]:
+        """Profiler configured from PRAXOS_PROFILE_* variables, or None when PRAXOS_PROFILE_DIR is unset"""
+        directory = os.environ.get("PRAXOS_PROFILE_DIR")
+        if not directory:
+            return None
+        return cls(
+            directory,
+            sample_rate=float(os.environ.get("PRAXOS_PROFILE_SAMPLE_RATE", "0")),
+            slow_threshold_ms=float(os.environ.get("PRAXOS_SLOW_REQUEST_MS", "1000")),
+            token=os.environ.get("PRAXOS_PROFILE_TOKEN") or None
+        )
+
+    def install(self, app):
+        """Register the profiling hooks on a Flask app"""
+        from flask import g, request
+
+        metrics.set_tracing(True)
+
+        @app.before_request
+        def _start_profile():
+            recorder = SpanRecorder()
+            metrics.set_span_recorder(recorder)
+            reason = self._reason(request.headers.get(PROFILE_HEADER))
+            profiler = None
+            if reason is not None and self._profiler_lock.acquire(blocking=False):
+                profiler = cProfile.Profile()
+                profiler.enable()
+            g.praxos_profile = (recorder, profiler, reason)
+
+        @app.after_request
+        def _finish_profile(response):
+            state = g.pop("praxos_profile", None)
+            if state is None:
+                return response
+            recorder, profiler, reason = state
+            profile_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{next(self._sequence)}"
+            if reason is not None:
+                response.headers["X-Praxos-Profile-Id"] = profile_id
+            endpoint = request.url_rule.rule if request.url_rule else request.path
+            info = {"method": request.method, "endpoint": endpoint, "path": request.path}
+            # Streamed bodies are produced after this hook; finish once the body is sent
+            response.call_on_close(
+                lambda: self._finish(profile_id, info, response.status_code, recorder, profiler, reason)
+            )
+            return response
+
+        @app.teardown_request
+        def _abandon_profile(exc):
+            # after_request is skipped when the view raised; still release the profiler
+            state = g.pop("praxos_profile", None)
+            if state is not None:
+                recorder, profiler, reason = state
+                profile_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{next(self._sequence)}"
+                info = {"method": request.method, "endpoint": request.path, "path": request.path}
+                self._finish(profile_id, info, 500, recorder, profiler, reason)
+
+    def _reason(self, header: Optional[str]) -> Optional[str]:
+        """Why a request should run under cProfile, or None"""
+        if header and self.token and hmac.compare_digest(header.encode(), self.token.encode()):
+            return "header"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sampled"
+        return None
+
+    def _finish(
+        self,
+        profile_id: str,
+        info: Dict,
+        status: int,
+        recorder: SpanRecorder,
+        profiler: Optional[cProfile.Profile],
+        reason: Optional[str]
+    ):
+        total_ms = (time.perf_counter() - recorder.started) * 1000.0
+        metrics.set_span_recorder(None)
+        if profiler is not None:
+            profiler.disable()
+            self._profiler_lock.release()
+
+        slow = total_ms >= self.slow_threshold_ms
+        if reason is None and not slow:
+            return
+        try:
+            self._write(profile_id, {
+                **info,
+                "status": status,
+                "duration_ms": round(total_ms, 3),
+                "reasons": [r for r in (reason, "slow" if slow else None) if r],
+                "profile": f"{profile_id}.prof" if profiler is not None else None,
+                "breakdown_ms": {name: round(ms, 3) for name, ms in recorder.breakdown(total_ms).items()},
+                "spans": [asdict(span) for span in recorder.spans]
+            }, profiler)
+        except OSError as e:
+            print(f"Could not write request profile {profile_id}: {e}")
+
+    def _write(self, profile_id: str, report: Dict, profiler: Optional[cProfile.Profile]):
+        base = os.path.join(self.directory, profile_id)
+        if profiler is not None:
+            profiler.dump_stats(base + ".prof")
+        with open(base + ".json", "w") as f:
+            json.dump(report, f, indent=2)
+
+        # Scanning the directory is O(files), so only do it every tenth of the budget
+        with self._prune_lock:
+            self._writes_since_prune += 1
+            due = self._writes_since_prune >= max(1, self.max_files // 10)
+            if due:
+                self._writes_since_prune = 0
+        if due:
+            self._prune()
+
+    def _prune(self):
+        """Delete the oldest profiles beyond max_files reports"""
+        reports = sorted(
+            (entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")),
+            key=lambda entry: entry.stat().st_mtime
+        )
+        for entry in reports[:max(0, len(reports) - self.max_files)]:
+            for path in (entry.path, entry.path[:-len(".json")] + ".prof"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
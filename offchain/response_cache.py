@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Praxos Response Cache
+Content-hash keyed, memory-bounded caching of API responses with ETag support
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+import hashlib
+import json
+import threading
+import time
+
+from flask import Response, g, request
+
+
+SECONDS_PER_DAY = 86400
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body and its entity tag"""
+    etag: str  # Unquoted strong entity tag (hash of the body)
+    body: bytes
+    mimetype: str
+    context: Any = None  # Value the view passed to set_cache_context, if any
+
+
+def set_cache_context(value):
+    """
+    Attach a value to the response the current view is producing
+
+    The value is stored with the cached response and handed to the
+    decorator's on_hit callback whenever the response is served from the
+    cache (e.g. the objects needed to replay the view's side effects). It is
+    not counted against the byte budget, so keep it small.
+    """
+    g.response_cache_context = value
+
+
+class ResponseCache:
+    """
+    LRU cache of response bodies keyed on a canonical hash of the request
+
+    Keys combine the request path, the JSON body serialized canonically
+    (sorted keys, no whitespace) and the UTC valuation day, so identical
+    payloads posted on the same day share an entry. The cache is bounded by
+    total body bytes and entry count.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: int = 10_000):
+        """
+        Args:
+            max_bytes: Memory budget for cached bodies
+            max_entries: Maximum number of cached responses
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()  # views run on concurrent request threads
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(path: str, payload, timestamp: Optional[float] = None, variant: str = "") -> str:
+        """
+        Cache key for a JSON request body
+
+        Args:
+            path: Request path
+            payload: Decoded JSON body
+            timestamp: Valuation time (defaults to now); only its UTC day is used
+            variant: Extra discriminator, e.g. the negotiated response format
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        digest = hashlib.sha256()
+        digest.update(f"{path}\n{variant}\n{int(timestamp) // SECONDS_PER_DAY}\n".encode("utf-8"))
+        digest.update(canonical.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a cached response and mark it as recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, body: bytes, mimetype: str = "application/json", context: Any = None) -> CachedResponse:
+        """Cache a response body (bodies larger than the budget are not stored)"""
+        entry = CachedResponse(
+            etag=hashlib.sha256(body).hexdigest()[:32], body=body, mimetype=mimetype, context=context
+        )
+        if len(body) > self.max_bytes:
+            return entry
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous.body)
+            self._entries[key] = entry
+            self._bytes += len(body)
+
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.body)
+                self.evictions += 1
+        return entry
+
+    def clear(self):
+        """Drop all cached responses"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Cache counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+def cached_response(
+    cache: ResponseCache,
+    version: Callable[[], Hashable] = None,
+    on_hit: Callable[[Any], None] = None
+):
+    """
+    Decorator caching a Flask JSON view by request content
+
+    Successful (200) responses are cached per request body and Accept header
+    and served with an ETag and Vary: Accept; a request whose If-None-Match
+    matches gets an empty 304. Requests without a JSON body and streamed
+    responses bypass the cache. A hit skips the view, so a view with side
+    effects must either reflect them in `version` or replay them in `on_hit`.
+
+    Args:
+        cache: Cache holding the responses
+        version: Returns the version of the state the view reads besides
+            the request (e.g. the correlation universe); responses are only
+            reused while it is unchanged
+        on_hit: Called with the entry's context (see set_cache_context)
+            before a cached response is served
+    """
+    def variant() -> str:
+        accept = request.headers.get("Accept", "")
+        return accept if version is None else f"{accept}\n{version()}"
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            payload = request.get_json(silent=True)
+            if payload is None:
+                return view(*args, **kwargs)
+
+            key = cache.make_key(request.path, payload, variant=variant())
+            entry = cache.get(key)
+            status = "HIT"
+            if entry is None:
+                response = view(*args, **kwargs)
+                context = g.pop("response_cache_context", None)
+                if not isinstance(response, Response) or response.status_code != 200 or response.is_streamed:
+                    return response
+                if version is not None:
+                    # The view may itself have moved the version (e.g. by adding its token)
+                    key = cache.make_key(request.path, payload, variant=variant())
+                entry = cache.put(key, response.get_data(), response.mimetype, context)
+                status = "MISS"
+            elif on_hit is not None:
+                on_hit(entry.context)
+
+            if request.if_none_match.contains(entry.etag):
+                response = Response(status=304)
+            else:
+                response = Response(entry.body, mimetype=entry.mimetype)
+            response.set_etag(entry.etag)
+            response.vary.add("Accept")
+            response.headers["X-Cache"] = status
+            return response
+        return wrapper
+    return decorator
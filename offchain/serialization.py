@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Praxos Serialization
+Generated dataclass encoders and JSON / MessagePack response encoding
+"""
+
+from dataclasses import fields as dataclass_fields
+from enum import Enum
+from typing import Callable, Dict, Optional, Sequence, Tuple
+import json
+
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None
+
+
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPE = "application/msgpack"
+# Mimetypes a client may use to ask for MessagePack
+MSGPACK_MIMETYPES = (MSGPACK_MIMETYPE, "application/x-msgpack")
+
+# Generated encoders by (dataclass, selected fields)
+_ENCODERS: Dict[Tuple[type, Optional[Tuple[str, ...]]], Callable[[object], Dict]] = {}
+
+
+def encoder_for(cls: type, fields: Sequence[str] = None) -> Callable[[object], Dict]:
+    """
+    Get the dict encoder for a dataclass, generating it on first use
+
+    The encoder is compiled from source once per type (and field selection)
+    into a single dict display, so encoding an instance does no per-field
+    introspection. Enum fields are encoded as their value.
+
+    Args:
+        cls: Dataclass type
+        fields: Fields to include, in output order (default: all fields)
+    """
+    key = (cls, tuple(fields) if fields else None)
+    encoder = _ENCODERS.get(key)
+    if encoder is not None:
+        return encoder
+
+    declared = {field.name: field for field in dataclass_fields(cls)}
+    names = key[1] or tuple(declared)
+    items = []
+    for name in names:
+        if name not in declared:
+            raise ValueError(f"{cls.__name__} has no field {name}")
+        field_type = declared[name].type
+        if isinstance(field_type, type) and issubclass(field_type, Enum):
+            items.append(f"{name!r}: obj.{name}.value")
+        else:
+            items.append(f"{name!r}: obj.{name}")
+
+    source = "def encode(obj):\n    return {" + ", ".join(items) + "}\n"
+    namespace: Dict = {}
+    exec(compile(source, f"<{cls.__name__} encoder>", "exec"), namespace)
+    encoder = namespace["encode"]
+    _ENCODERS[key] = encoder
+    return encoder
+
+
+def msgpack_available() -> bool:
+    """Whether the optional msgpack package is installed"""
+    return msgpack is not None
+
+
+def encode_payload(payload, mimetype: str) -> bytes:
+    """
+    Encode a response payload (dicts / lists of primitives)
+
+    Args:
+        payload: Data to encode
+        mimetype: JSON_MIMETYPE or one of MSGPACK_MIMETYPES
+    """
+    if mimetype in MSGPACK_MIMETYPES:
+        if msgpack is None:
+            raise RuntimeError("MessagePack encoding requires the msgpack package: pip install msgpack")
+        return msgpack.packb(payload, use_bin_type=True)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Praxos Production Server
+Pre-forked multi-process runner for the backend API
+"""
+
+import argparse
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+from typing import Dict, Optional, Tuple
+
+from werkzeug.serving import make_server
+
+
+def _listen(host: str, port: int, backlog: int) -> socket.socket:
+    """Bind the listening socket shared by all workers"""
+    info = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE)[0]
+    sock = socket.socket(info[0], socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(info[4])
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _metrics_dir() -> Tuple[Optional[str], bool]:
+    """
+    Directory the workers share their metrics through, and whether it is temporary
+
+    None when metrics are off. PRAXOS_METRICS_DIR picks the directory;
+    otherwise a temporary one is created for this run.
+    """
+    from observability import metrics
+
+    if not metrics.enabled():
+        return None, False
+    directory = os.environ.get("PRAXOS_METRICS_DIR")
+    if not directory:
+        return tempfile.mkdtemp(prefix="praxos-metrics-"), True
+    os.makedirs(directory, exist_ok=True)
+    metrics.clear_shared_snapshots(directory)
+    return directory, False
+
+
+def _run_worker(sock: socket.socket, host: str, port: int, threaded: bool, metrics_dir: Optional[str] = None):
+    """Worker process body: build and warm this worker's state, then serve"""
+    # Imported per worker so every process owns its simulator / engine / generator
+    import server
+
+    if metrics_dir is not None:
+        # Any worker may answer a scrape, so /metrics reports the whole pool
+        server.metrics.share_across_processes(metrics_dir)
+    server.warm_up()
+    httpd = make_server(host, port, server.app, threaded=threaded, fd=sock.fileno())
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent coordinates shutdown
+    try:
+        httpd.serve_forever()
+    finally:
+        httpd.server_close()
+
+
+def serve(host: str = "0.0.0.0", port: int = 5000, workers: int = None, threaded: bool = False, backlog: int = 1024):
+    """
+    Serve the API with a pre-forked pool of worker processes
+
+    The parent binds the socket, forks the workers (which accept on the
+    shared socket) and replaces any worker that exits. SIGINT / SIGTERM stop
+    the whole pool. Flask's debugger and reloader are never enabled. With
+    PRAXOS_METRICS set, each worker publishes its metrics to a shared
+    directory (PRAXOS_METRICS_DIR, default a temporary one) and /metrics
+    reports the sum over all workers.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        workers: Number of worker processes (defaults to the CPU count)
+        threaded: Handle requests on threads within each worker. Off by
+            default: concurrency comes from the worker processes, since the
+            agent registry and vault generator state are not locked
+        backlog: Listen backlog of the shared socket
+    """
+    workers = workers or os.cpu_count() or 1
+    sock = _listen(host, port, backlog)
+    print(f"Praxos API serving on http://{host}:{port} ({workers} workers)")
+
+    if not hasattr(os, "fork"):
+        # No fork (e.g. Windows): serve from this process only
+        _run_worker(sock, host, port, threaded)
+        return
+
+    metrics_dir, temporary_metrics_dir = _metrics_dir()
+    children: Dict[int, float] = {}  # pid -> start time
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_worker(sock, host, port, threaded, metrics_dir)
+            except SystemExit as exc:
+                code = exc.code if isinstance(exc.code, int) else 0
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                code = 1
+            os._exit(code)
+        children[pid] = time.monotonic()
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        spawn()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        started = children.pop(pid, None)
+        if started is None or stopping:
+            continue
+        print(f"Worker {pid} exited with status {status}, restarting", file=sys.stderr)
+        if time.monotonic() - started < 1.0:
+            time.sleep(1.0)  # avoid a tight respawn loop when workers crash on start
+        spawn()
+
+    sock.close()
+    if temporary_metrics_dir:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Praxos API with multiple worker processes")
+    parser.add_argument("--host", default=os.environ.get("PRAXOS_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PRAXOS_PORT", "5000")))
+    parser.add_argument(
+        "--workers", type=int, default=int(os.environ.get("PRAXOS_WORKERS", "0")) or None,
+        help="Worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--threads", action="store_true",
+        help="Handle requests on threads within each worker (default: one request at a time per worker)"
+    )
+    args = parser.parse_args()
+    serve(args.host, args.port, args.workers, threaded=args.threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,24 @@ Exposes AI models and vault generation via REST API for frontend integration
 """
 
 try:
-    from flask import Flask, request, jsonify  # type: ignore
+    from flask import Flask, Response, g, request, jsonify, stream_with_context  # type: ignore
     from flask_cors import CORS  # type: ignore
 except ImportError:
     raise ImportError("Please install flask and flask-cors: pip install flask flask-cors")
 import json
-from typing import List, Dict
+import os
+import time
+from typing import List, Dict, Iterator, Optional
 from simulation.risk_model import RiskSimulator, RiskSignature
 from ai_engine.allocation_engine import PraxosAIEngine, VaultStrategy
 from ai_agent.suggestion_engine import PraxosAIAgent, VaultRecommendation
 from vault_generator import VaultGenerator
+from vault_metadata_api import register_vault_metadata_endpoints
+from response_cache import ResponseCache, cached_response, set_cache_context
+from observability import metrics, profiling
+from serialization import (
+    JSON_MIMETYPE, MSGPACK_MIMETYPES, encode_payload, encoder_for, msgpack_available
+)
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend
@@ -22,9 +30,246 @@ CORS(app)  # Enable CORS for frontend
 # Initialize components
 risk_simulator = RiskSimulator()
 ai_engine = PraxosAIEngine(risk_simulator)
-ai_agent = PraxosAIAgent(ai_engine)
+ai_agent = PraxosAIAgent()
 vault_generator = VaultGenerator()
 
+# Vault metadata endpoints, persisted in SQLite (PRAXOS_METADATA_DB) and shared by all workers
+register_vault_metadata_endpoints(app)
+
+# /api/vaults/generate and /api/risk/analyze responses, keyed by request
+# content and valuation day (plus the correlation universe version for analyze)
+response_cache = ResponseCache(
+    max_bytes=int(os.environ.get("PRAXOS_RESPONSE_CACHE_MB", "64")) * 1024 * 1024
+)
+
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Batch risk analysis limits: tokens per request, and tokens simulated per vectorized pass
+MAX_BATCH_TOKENS = int(os.environ.get("PRAXOS_MAX_BATCH_TOKENS", "100000"))
+BATCH_CHUNK_SIZE = 10_000
+
+
+def wants_ndjson() -> bool:
+    """Whether the client asked for a streamed NDJSON response"""
+    return request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def ndjson_response(events: Iterator[Dict]) -> Response:
+    """
+    Stream events as newline-delimited JSON while they are produced
+    
+    A failure mid-stream is reported as a final {"type": "error"} line, since
+    the status code has already been sent.
+    """
+    def lines():
+        try:
+            for event in events:
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            yield json.dumps({"type": "error", "error": str(e)}) + "\n"
+    
+    return Response(stream_with_context(lines()), mimetype=NDJSON_MIMETYPE)
+
+
+# API representations of the pipeline dataclasses (encoders generated once per type)
+strategy_to_dict = encoder_for(VaultStrategy)
+recommendation_to_dict = encoder_for(VaultRecommendation)
+signature_to_dict = encoder_for(RiskSignature)
+_analyzed_signature_to_dict = encoder_for(RiskSignature, (
+    "asset_address", "asset_type", "risk_tier", "volatility",
+    "liquidity_score", "credit_score", "counterparty_risk"
+))
+
+
+def api_response(payload, status: int = 200) -> Response:
+    """Encode a response payload as JSON or, if the client prefers it, MessagePack"""
+    offered = [JSON_MIMETYPE] + (list(MSGPACK_MIMETYPES) if msgpack_available() else [])
+    mimetype = request.accept_mimetypes.best_match(offered, default=JSON_MIMETYPE)
+    return Response(encode_payload(payload, mimetype), status=status, mimetype=mimetype)
+
+
+def risk_analysis_to_dict(signature: RiskSignature, correlation_factors: Dict = None) -> Dict:
+    """API representation of an analyzed risk signature"""
+    if correlation_factors is None:
+        with risk_simulator.lock:
+            correlation_factors = risk_simulator.correlation_engine.correlation_factors(signature.asset_address)
+    result = _analyzed_signature_to_dict(signature)
+    result["correlation_factors"] = correlation_factors
+    return result
+
+
+def validate_risk_token(token) -> Optional[str]:
+    """Error message for a malformed batch analysis item, or None if it is valid"""
+    if not isinstance(token, dict):
+        return "token must be an object"
+    if not isinstance(token.get('asset_address'), str) or not token['asset_address']:
+        return "asset_address is required"
+    if not isinstance(token.get('asset_type'), str):
+        return "asset_type is required"
+    annual_yield = token.get('annual_yield')
+    if isinstance(annual_yield, bool) or not isinstance(annual_yield, (int, float)):
+        return "annual_yield must be a number"
+    maturity = token.get('maturity_timestamp', 0)
+    if isinstance(maturity, bool) or not isinstance(maturity, int) or maturity < 0:
+        return "maturity_timestamp must be a non-negative integer"
+    risk_tier = token.get('risk_tier', 3)
+    if isinstance(risk_tier, bool) or not isinstance(risk_tier, int) or not 1 <= risk_tier <= 5:
+        return "risk_tier must be an integer from 1 to 5"
+    return None
+
+
+def _simulate_batch_chunk(
+    simulator: RiskSimulator,
+    chunk: List,
+    valid: List[int],
+    results: List[Dict],
+    current_timestamp: int,
+    record: bool
+) -> List[Optional[RiskSignature]]:
+    """
+    Simulate the valid tokens of a chunk in one vectorized pass
+    
+    If the pass fails, the tokens are retried one at a time so that a bad
+    token only fails itself (its error is written to results).
+    
+    Returns:
+        One signature per valid token, None where simulation failed
+    """
+    def simulate(indices: List[int]) -> List[RiskSignature]:
+        return simulator.simulate_risk_batch(
+            asset_addresses=[chunk[i]['asset_address'] for i in indices],
+            asset_types=[chunk[i]['asset_type'] for i in indices],
+            annual_yields=[chunk[i]['annual_yield'] for i in indices],
+            maturity_timestamps=[chunk[i].get('maturity_timestamp', 0) for i in indices],
+            risk_tiers=[chunk[i].get('risk_tier', 3) for i in indices],
+            current_timestamp=current_timestamp,
+            record=record
+        )
+    
+    try:
+        return simulate(valid)
+    except Exception:
+        signatures = []
+        for i in valid:
+            try:
+                signatures.extend(simulate([i]))
+            except Exception as e:
+                signatures.append(None)
+                results[i] = {"error": str(e)}
+        return signatures
+
+
+def iter_batch_risk_analysis(tokens: List) -> Iterator[Dict]:
+    """
+    Analyze many tokens, chunk by chunk, through the vectorized simulator
+    
+    The batch runs against its own simulator, so it neither grows the shared
+    universe nor depends on it: correlation_factors describe each token
+    within the tokens of the request. A first pass records that universe
+    chunk by chunk; a second pass recomputes each chunk's signatures and
+    yields its results, so only one chunk of results is held at a time.
+    
+    The universe holds one asset per address, so an address may appear only
+    once per batch: repeats get an error instead of sharing the factors of
+    whichever occurrence was recorded last.
+    
+    Yields:
+        One result per token, in input order: {"risk_signature": {...}} or
+        {"error": "..."} for tokens that fail validation or simulation, or
+        repeat an earlier token's address
+    """
+    current_timestamp = int(time.time())
+    # Bounded by MAX_BATCH_TOKENS and released with the request
+    simulator = RiskSimulator(enable_cache=False, max_assets=0)
+    starts = range(0, len(tokens), BATCH_CHUNK_SIZE)
+    errors: Dict[int, str] = {}  # token index -> validation or simulation error
+    first_index: Dict[str, int] = {}  # address -> index of its first valid token
+    
+    with metrics.stage("simulation"):
+        for start in starts:
+            chunk = tokens[start:start + BATCH_CHUNK_SIZE]
+            results: List[Dict] = [{"error": error} for error in map(validate_risk_token, chunk)]
+            for i, result in enumerate(results):
+                if result["error"] is None:
+                    address = chunk[i]['asset_address']
+                    first = first_index.setdefault(address, start + i)
+                    if first != start + i:
+                        result["error"] = f"duplicate asset_address {address} (first at index {first})"
+            valid = [i for i, result in enumerate(results) if result["error"] is None]
+            _simulate_batch_chunk(simulator, chunk, valid, results, current_timestamp, record=True)
+            errors.update((start + i, result["error"]) for i, result in enumerate(results) if result["error"])
+    
+    for start in starts:
+        chunk = tokens[start:start + BATCH_CHUNK_SIZE]
+        results = [{"error": errors.get(start + i)} for i in range(len(chunk))]
+        valid = [i for i, result in enumerate(results) if result["error"] is None]
+        with metrics.stage("simulation"):
+            signatures = _simulate_batch_chunk(simulator, chunk, valid, results, current_timestamp, record=False)
+        
+        analyzed = [(i, signature) for i, signature in zip(valid, signatures) if signature is not None]
+        factors = simulator.correlation_engine.correlation_factors_batch(
+            [signature.asset_address for _, signature in analyzed]
+        )
+        for (i, signature), correlation_factors in zip(analyzed, factors):
+            results[i] = {"risk_signature": risk_analysis_to_dict(signature, correlation_factors)}
+        yield from results
+
+
+def warm_up():
+    """
+    Prime this process before it takes traffic
+    
+    Runs a small synthetic universe through a scratch pipeline (so imports,
+    NumPy / BLAS initialization and first-call costs are paid up front
+    without touching the shared state) and precomputes the agent's
+    recommendation rankings.
+    """
+    now = int(time.time())
+    asset_types = list(RiskSimulator.BASE_VOLATILITY)
+    tokens = [
+        {
+            "address": f"0x{i:040x}",
+            "asset_type": asset_types[i % len(asset_types)],
+            "annual_yield": 300 + 100 * (i % 12),
+            "maturity_timestamp": now + 86400 * 90 * (i % 40) if i % 7 else 0,
+            "risk_tier": 1 + i % 5
+        }
+        for i in range(64)
+    ]
+    scratch = VaultGenerator()
+    scratch.process_rwa_tokens(tokens)
+    scratch.ai_engine.close()
+    ai_agent.precompute_recommendations()
+
+
+if metrics.enabled():
+    @app.before_request
+    def _start_request_timer():
+        g.request_started = time.perf_counter()
+    
+    @app.after_request
+    def _record_request_metrics(response):
+        started = g.get("request_started")
+        if started is not None:
+            endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+            metrics.observe_request(endpoint, request.method, response.status_code, time.perf_counter() - started)
+        return response
+
+
+# Opt-in request profiling (PRAXOS_PROFILE_DIR); no hooks are installed otherwise
+request_profiler = profiling.RequestProfiler.from_env()
+if request_profiler is not None:
+    request_profiler.install(app)
+
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Pipeline stage and request metrics in Prometheus text format (PRAXOS_METRICS=1)"""
+    if not metrics.enabled():
+        return jsonify({"error": "metrics are disabled, set PRAXOS_METRICS=1"}), 404
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
 
 @app.route('/health', methods=['GET'])
 def health():
@@ -33,6 +278,7 @@ def health():
 
 
 @app.route('/api/vaults/generate', methods=['POST'])
+@cached_response(response_cache, on_hit=vault_generator.record_strategies)
 def generate_vaults():
     """
     Generate vault strategies from RWA tokens
@@ -75,8 +321,19 @@ def generate_vaults():
         if not rwa_tokens:
             return jsonify({"error": "rwa_tokens is required"}), 400
         
-        # Generate strategies
+        if wants_ndjson():
+            # Stream risk signatures as they are simulated, then the strategies
+            def events():
+                for kind, item in vault_generator.iter_process_rwa_tokens(rwa_tokens):
+                    if kind == "risk_signature":
+                        yield {"type": kind, "data": signature_to_dict(item)}
+                    elif not strategy_types or item.strategy_id in strategy_types:
+                        yield {"type": kind, "data": strategy_to_dict(item)}
+            return ndjson_response(events())
+        
+        # Generate strategies (a cache hit re-records them instead, see cached_response)
         strategies = vault_generator.process_rwa_tokens(rwa_tokens)
+        set_cache_context(strategies)
         
         # Filter by strategy types if provided
         if strategy_types:
@@ -84,22 +341,10 @@ def generate_vaults():
         
         # Convert to JSON-serializable format
         result = {
-            "strategies": [
-                {
-                    "strategy_id": s.strategy_id,
-                    "name": s.name,
-                    "risk_tier": s.risk_tier,
-                    "target_duration": s.target_duration,
-                    "assets": s.assets,
-                    "weights": s.weights,
-                    "expected_yield": getattr(s, 'expected_yield', 0.0),
-                    "diversification_score": s.diversification_score
-                }
-                for s in strategies
-            ]
+            "strategies": [strategy_to_dict(s) for s in strategies]
         }
         
-        return jsonify(result)
+        return api_response(result)
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -142,17 +387,19 @@ def recommend_vaults():
         # Generate strategies first
         strategies = vault_generator.process_rwa_tokens(rwa_tokens)
         
-        # Convert strategies to vault registry format
-        for strategy in strategies:
-            ai_agent.register_vault({
-                "address": strategy.assets[0] if strategy.assets else "0x0",  # Use first asset as placeholder
-                "name": strategy.name,
-                "risk_tier": strategy.risk_tier,
-                "target_duration": strategy.target_duration,
-                "expected_yield": getattr(strategy, 'expected_yield', 0.0),
-                "strategy": strategy.strategy_id,
-                "assets": strategy.assets
-            })
+        # Convert strategies to vault registry format (keyed by strategy, since
+        # the address is a placeholder; re-registering replaces the old entry)
+        with metrics.stage("register_vaults"):
+            for strategy in strategies:
+                ai_agent.register_vault({
+                    "address": strategy.assets[0] if strategy.assets else "0x0",  # Use first asset as placeholder
+                    "name": strategy.name,
+                    "risk_tier": strategy.risk_tier,
+                    "target_duration": strategy.target_duration,
+                    "expected_yield": getattr(strategy, 'expected_yield', 0.0),
+                    "strategy": strategy.strategy_id,
+                    "assets": strategy.assets
+                }, key=strategy.strategy_id)
         
         # Create user preferences
         from ai_agent.suggestion_engine import UserPreferences, RiskTolerance, Timeframe
@@ -182,27 +429,17 @@ def recommend_vaults():
         
         # Convert to JSON-serializable format
         result = {
-            "recommendations": [
-                {
-                    "vault_address": rec.vault_address,
-                    "vault_name": rec.vault_name,
-                    "match_score": rec.match_score,
-                    "risk_tier": rec.risk_tier,
-                    "expected_yield": rec.expected_yield,
-                    "timeframe_match": rec.timeframe_match,
-                    "reasoning": rec.reasoning
-                }
-                for rec in recommendations
-            ]
+            "recommendations": [recommendation_to_dict(rec) for rec in recommendations]
         }
         
-        return jsonify(result)
+        return api_response(result)
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 @app.route('/api/risk/analyze', methods=['POST'])
+@cached_response(response_cache, version=lambda: risk_simulator.correlation_engine.version)
 def analyze_risk():
     """
     Analyze risk for a single RWA token
@@ -221,38 +458,96 @@ def analyze_risk():
         "risk_signature": {
             "asset_address": "0x...",
             "asset_type": "...",
-            "risk_score": 0.65,
-            "volatility": 0.12,
-            "liquidity_score": 0.8,
-            ...
+            "risk_tier": 2,
+            "volatility": 0.065,
+            "liquidity_score": 80,
+            "credit_score": 72.5,
+            "counterparty_risk": 38.75,
+            "correlation_factors": {"mean_correlation": 0.42, ...}
         }
     }
     """
     try:
         data = request.get_json()
         
-        signature = risk_simulator.simulate_risk(
-            asset_address=data.get('asset_address'),
-            asset_type=data.get('asset_type'),
-            annual_yield=data.get('annual_yield'),
-            maturity_timestamp=data.get('maturity_timestamp', 0),
-            risk_tier=data.get('risk_tier', 3)
-        )
+        with metrics.stage("simulation"):
+            signature = risk_simulator.simulate_risk(
+                asset_address=data.get('asset_address'),
+                asset_type=data.get('asset_type'),
+                annual_yield=data.get('annual_yield'),
+                maturity_timestamp=data.get('maturity_timestamp', 0),
+                risk_tier=data.get('risk_tier', 3)
+            )
         
         # Convert to dict
         result = {
-            "risk_signature": {
-                "asset_address": signature.asset_address,
-                "asset_type": signature.asset_type,
-                "risk_score": signature.risk_score,
-                "volatility": signature.volatility,
-                "liquidity_score": signature.liquidity_score,
-                "credit_score": signature.credit_score,
-                "correlation_factors": signature.correlation_factors
-            }
+            "risk_signature": risk_analysis_to_dict(signature)
         }
         
-        return jsonify(result)
+        if wants_ndjson():
+            return ndjson_response(iter([{"type": "risk_signature", "data": result["risk_signature"]}]))
+        
+        return api_response(result)
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route('/api/risk/analyze/batch', methods=['POST'])
+def analyze_risk_batch():
+    """
+    Analyze risk for many RWA tokens in one request
+    
+    Request body:
+    {
+        "tokens": [
+            {
+                "asset_address": "0x...",
+                "asset_type": "corporate-bond",
+                "annual_yield": 500,
+                "maturity_timestamp": 1234567890,  # optional, default 0
+                "risk_tier": 2  # optional, default 3
+            }
+        ]
+    }
+    
+    Returns (results[i] belongs to tokens[i]):
+    {
+        "results": [
+            {"risk_signature": {...}},  # as returned by /api/risk/analyze
+            {"error": "annual_yield must be a number"}
+        ],
+        "errors": 1
+    }
+    
+    With Accept: application/x-ndjson the results are streamed as
+    {"type": "risk_signature", "index": 0, "data": {...}} and
+    {"type": "error", "index": 1, "error": "..."} lines.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        tokens = data.get('tokens')
+        
+        if not isinstance(tokens, list):
+            return jsonify({"error": "tokens must be a list"}), 400
+        if len(tokens) > MAX_BATCH_TOKENS:
+            return jsonify({"error": f"at most {MAX_BATCH_TOKENS} tokens per request"}), 413
+        
+        results = iter_batch_risk_analysis(tokens)
+        
+        if wants_ndjson():
+            return ndjson_response(
+                {"type": "risk_signature", "index": i, "data": result["risk_signature"]}
+                if "risk_signature" in result else
+                {"type": "error", "index": i, "error": result["error"]}
+                for i, result in enumerate(results)
+            )
+        
+        results = list(results)
+        return api_response({
+            "results": results,
+            "errors": sum(1 for result in results if "error" in result)
+        })
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -262,9 +557,17 @@ if __name__ == '__main__':
     print("🚀 Starting Praxos AI Backend Server...")
     print("📡 API endpoints:")
     print("   GET  /health")
+    print("   GET  /metrics")
     print("   POST /api/vaults/generate")
     print("   POST /api/vaults/recommend")
     print("   POST /api/risk/analyze")
+    print("   POST /api/risk/analyze/batch")
+    print("   GET  /api/vaults/<address>/metadata")
+    print("   POST /api/vaults/<address>/metadata")
+    print("   POST /api/vaults/metadata/batch")
     print("\n🌐 Server running on http://localhost:5000")
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Development server only (see serve.py for production); the debugger and
+    # reloader are opt-in via PRAXOS_DEBUG=1
+    debug = os.environ.get("PRAXOS_DEBUG", "").lower() in ("1", "true", "yes")
+    app.run(host='0.0.0.0', port=5000, debug=debug, use_reloader=debug)
 
@@ -1,4 +1,6 @@
 from .risk_model import RiskSimulator, RiskSignature
+from .signature_store import RiskSignatureStore
+from .signature_cache import SignatureCache
+from .correlation import CorrelationEngine
 
-__all__ = ["RiskSimulator", "RiskSignature"]
-
+__all__ = ["RiskSimulator", "RiskSignature", "RiskSignatureStore", "SignatureCache", "CorrelationEngine"]
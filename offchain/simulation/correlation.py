@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Praxos Correlation Engine
+Models co-movement between RWA assets from asset-type and risk-tier factors
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+# Default factor weights: every pair shares the market factor, assets of the
+# same type share the asset-type factor, and the risk-tier factor decays
+# linearly with tier distance. Off-diagonal correlations stay in [0.15, 0.7].
+MARKET_CORRELATION = 0.15
+ASSET_TYPE_CORRELATION = 0.35
+RISK_TIER_CORRELATION = 0.20
+RISK_TIER_SPAN = 4.0
+
+
+def factor_correlation(
+    type_codes_a: np.ndarray,
+    tiers_a: np.ndarray,
+    type_codes_b: np.ndarray,
+    tiers_b: np.ndarray,
+    market: float = MARKET_CORRELATION,
+    asset_type: float = ASSET_TYPE_CORRELATION,
+    risk_tier: float = RISK_TIER_CORRELATION
+) -> np.ndarray:
+    """
+    Pairwise factor-model correlation between two sets of assets
+
+    The block is computed as if every pair were distinct assets; callers set
+    the diagonal of square blocks to 1. Because every factor term is positive
+    semi-definite and their sum stays below 1, the full matrix is PSD.
+
+    Args:
+        type_codes_a, tiers_a: Asset type codes and risk tiers of the row assets
+        type_codes_b, tiers_b: Asset type codes and risk tiers of the column assets
+
+    Returns:
+        Correlation block of shape (len(a), len(b))
+    """
+    same_type = np.asarray(type_codes_a)[:, None] == np.asarray(type_codes_b)[None, :]
+    tier_distance = np.abs(
+        np.asarray(tiers_a, dtype=np.float64)[:, None] - np.asarray(tiers_b, dtype=np.float64)[None, :]
+    )
+    tier_kernel = np.clip(1.0 - tier_distance / RISK_TIER_SPAN, 0.0, None)
+    return market + asset_type * same_type + risk_tier * tier_kernel
+
+
+class CorrelationEngine:
+    """
+    Maintains asset correlations / covariances over the signature universe
+
+    For universes up to max_dense_assets the full correlation matrix is cached
+    and kept current with row/column updates as assets are added, changed or
+    removed, so slices are plain array lookups. Larger universes fall back to
+    computing slices directly from the factor model. `version` increases
+    whenever the universe changes, so results derived from it (such as
+    correlation_factors) can be cached against it.
+    """
+
+    def __init__(
+        self,
+        market_correlation: float = MARKET_CORRELATION,
+        asset_type_correlation: float = ASSET_TYPE_CORRELATION,
+        risk_tier_correlation: float = RISK_TIER_CORRELATION,
+        max_dense_assets: int = 4096
+    ):
+        if market_correlation + asset_type_correlation + risk_tier_correlation > 1.0:
+            raise ValueError("Factor correlations must sum to at most 1")
+        self.market_correlation = market_correlation
+        self.asset_type_correlation = asset_type_correlation
+        self.risk_tier_correlation = risk_tier_correlation
+        self.max_dense_assets = max_dense_assets
+
+        self._size = 0
+        self._capacity = 0
+        self._addresses: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._type_vocab: Dict[str, int] = {}
+        self._type_codes = np.zeros(0, dtype=np.int16)
+        self._tiers = np.zeros(0, dtype=np.int16)
+        self._volatility = np.zeros(0, dtype=np.float64)
+        self._type_counts: Dict[int, int] = {}
+        self._tier_counts: Dict[int, int] = {}
+        self._correlation = None  # dense cache (capacity x capacity) or None
+        self.version = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, asset_address: str) -> bool:
+        return asset_address in self._index
+
+    @property
+    def is_dense(self) -> bool:
+        """Whether the full correlation matrix is currently cached"""
+        return self._correlation is not None
+
+    def upsert(
+        self,
+        asset_addresses: Sequence[str],
+        asset_types: Sequence[str],
+        risk_tiers: Sequence[int],
+        volatilities: Sequence[float]
+    ):
+        """
+        Add or update assets
+
+        Only the rows/columns of the touched assets are recomputed, at
+        O(len(asset_addresses) * universe) cost.
+        """
+        k = len(asset_addresses)
+        if k == 0:
+            return
+
+        codes = np.array([self._type_code(t) for t in asset_types], dtype=np.int16)
+        tiers = np.asarray(risk_tiers, dtype=np.int16)
+        vols = np.asarray(volatilities, dtype=np.float64)
+
+        positions = {}
+        for i, address in enumerate(asset_addresses):
+            positions[address] = i  # last occurrence wins
+        touched = np.empty(len(positions), dtype=np.int64)
+        source = np.empty(len(positions), dtype=np.int64)
+        new_count = sum(1 for address in positions if address not in self._index)
+        self._ensure_capacity(self._size + new_count)
+
+        for j, (address, i) in enumerate(positions.items()):
+            idx = self._index.get(address)
+            if idx is None:
+                idx = self._size
+                self._size += 1
+                self._index[address] = idx
+                self._addresses.append(address)
+            else:
+                self._count(int(self._type_codes[idx]), int(self._tiers[idx]), -1)
+            touched[j] = idx
+            source[j] = i
+
+        if new_count or not (
+            np.array_equal(self._type_codes[touched], codes[source])
+            and np.array_equal(self._tiers[touched], tiers[source])
+            and np.array_equal(self._volatility[touched], vols[source])
+        ):
+            self.version += 1
+        self._type_codes[touched] = codes[source]
+        self._tiers[touched] = tiers[source]
+        self._volatility[touched] = vols[source]
+        for code, tier in zip(codes[source].tolist(), tiers[source].tolist()):
+            self._count(code, tier, 1)
+
+        if self._size > self.max_dense_assets:
+            self._correlation = None
+        elif self._correlation is not None:
+            n = self._size
+            block = self._block(touched, np.arange(n))
+            self._correlation[touched, :n] = block
+            self._correlation[:n, touched] = block.T
+            self._correlation[touched, touched] = 1.0
+
+    def remove(self, asset_address: str) -> bool:
+        """Remove an asset, moving the last asset into its slot"""
+        idx = self._index.pop(asset_address, None)
+        if idx is None:
+            return False
+
+        self._count(int(self._type_codes[idx]), int(self._tiers[idx]), -1)
+        self.version += 1
+        last = self._size - 1
+        if idx != last:
+            moved = self._addresses[last]
+            self._addresses[idx] = moved
+            self._index[moved] = idx
+            self._type_codes[idx] = self._type_codes[last]
+            self._tiers[idx] = self._tiers[last]
+            self._volatility[idx] = self._volatility[last]
+            if self._correlation is not None:
+                corr = self._correlation
+                corr[idx, :last] = corr[last, :last]
+                corr[:last, idx] = corr[:last, last]
+                corr[idx, idx] = 1.0
+        self._addresses.pop()
+        self._size = last
+        return True
+
+    def remove_many(self, asset_addresses: Sequence[str]) -> int:
+        """
+        Remove several assets in one compaction pass
+
+        The remaining assets keep their relative order, and the dense cache
+        (if any) is compacted instead of rebuilt. Unknown addresses are ignored.
+
+        Returns:
+            Number of assets removed
+        """
+        idx = [self._index[a] for a in set(asset_addresses) if a in self._index]
+        if not idx:
+            return 0
+
+        for i in idx:
+            self._count(int(self._type_codes[i]), int(self._tiers[i]), -1)
+        keep = np.ones(self._size, dtype=bool)
+        keep[idx] = False
+        survivors = np.flatnonzero(keep)
+        m = len(survivors)
+        for name in ("_type_codes", "_tiers", "_volatility"):
+            column = getattr(self, name)
+            column[:m] = column[survivors]
+        if self._correlation is not None:
+            self._correlation[:m, :m] = self._correlation[np.ix_(survivors, survivors)]
+        self._addresses = [self._addresses[i] for i in survivors.tolist()]
+        self._index = {address: i for i, address in enumerate(self._addresses)}
+        self._size = m
+        self.version += 1
+        return len(idx)
+
+    def correlation_factors(self, asset_address: str) -> Dict[str, float]:
+        """
+        Per-asset correlation summary, computed in O(number of tiers)
+
+        Returns:
+            Factor weights applied to the asset plus its mean correlation with
+            the rest of the universe and its number of same-type peers
+        """
+        idx = self._index.get(asset_address)
+        if idx is None:
+            raise ValueError(f"No correlation data for {asset_address}")
+
+        code = int(self._type_codes[idx])
+        tier = int(self._tiers[idx])
+        peers = self._size - 1
+        same_type_peers = self._type_counts[code] - 1
+        if peers > 0:
+            tier_kernel_sum = sum(
+                count * max(0.0, 1.0 - abs(other - tier) / RISK_TIER_SPAN)
+                for other, count in self._tier_counts.items()
+            ) - 1.0  # exclude the asset itself
+            mean_correlation = (
+                self.market_correlation
+                + self.asset_type_correlation * same_type_peers / peers
+                + self.risk_tier_correlation * tier_kernel_sum / peers
+            )
+        else:
+            mean_correlation = 0.0
+
+        return {
+            "market": self.market_correlation,
+            "asset_type": self.asset_type_correlation,
+            "risk_tier": self.risk_tier_correlation,
+            "mean_correlation": mean_correlation,
+            "same_type_peers": same_type_peers,
+            "volatility": float(self._volatility[idx])
+        }
+
+    def correlation_factors_batch(self, asset_addresses: Sequence[str]) -> List[Dict[str, float]]:
+        """
+        correlation_factors for many assets at once
+
+        Per-asset terms are gathered with array lookups; the risk-tier kernel
+        sum is computed once per distinct tier.
+        """
+        try:
+            idx = np.fromiter(
+                (self._index[a] for a in asset_addresses), dtype=np.int64, count=len(asset_addresses)
+            )
+        except KeyError as e:
+            raise ValueError(f"No correlation data for {e.args[0]}")
+
+        peers = self._size - 1
+        codes = self._type_codes[idx].astype(np.int64)
+        type_counts = np.zeros(len(self._type_vocab), dtype=np.int64)
+        for code, count in self._type_counts.items():
+            type_counts[code] = count
+        same_type_peers = type_counts[codes] - 1
+
+        if peers > 0:
+            distinct_tiers, tier_positions = np.unique(self._tiers[idx], return_inverse=True)
+            tier_kernel_sums = np.array([
+                sum(
+                    count * max(0.0, 1.0 - abs(other - tier) / RISK_TIER_SPAN)
+                    for other, count in self._tier_counts.items()
+                ) - 1.0  # exclude the asset itself
+                for tier in distinct_tiers.tolist()
+            ])
+            mean_correlation = (
+                self.market_correlation
+                + self.asset_type_correlation * same_type_peers / peers
+                + self.risk_tier_correlation * tier_kernel_sums[tier_positions] / peers
+            )
+        else:
+            mean_correlation = np.zeros(len(idx))
+
+        return [
+            {
+                "market": self.market_correlation,
+                "asset_type": self.asset_type_correlation,
+                "risk_tier": self.risk_tier_correlation,
+                "mean_correlation": mean,
+                "same_type_peers": same,
+                "volatility": volatility
+            }
+            for mean, same, volatility in zip(
+                mean_correlation.tolist(), same_type_peers.tolist(), self._volatility[idx].tolist()
+            )
+        ]
+
+    def submatrix(self, asset_addresses: Sequence[str], covariance: bool = True) -> np.ndarray:
+        """
+        Correlation or covariance matrix restricted to a set of assets
+
+        Args:
+            asset_addresses: Assets to slice, in the desired row order
+            covariance: Return covariances (True) or correlations (False)
+        """
+        idx = np.fromiter(
+            (self._index[a] for a in asset_addresses), dtype=np.int64, count=len(asset_addresses)
+        )
+        if self._correlation is None and self._size <= self.max_dense_assets:
+            self._rebuild()
+
+        if self._correlation is not None:
+            block = self._correlation[np.ix_(idx, idx)]
+        else:
+            block = self._block(idx, idx)
+            np.fill_diagonal(block, 1.0)
+            # Repeated addresses are the same asset
+            block[idx[:, None] == idx[None, :]] = 1.0
+
+        if covariance:
+            vols = self._volatility[idx]
+            block = block * np.outer(vols, vols)
+        return block
+
+    def _block(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Factor-model correlation between two index sets"""
+        return factor_correlation(
+            self._type_codes[rows], self._tiers[rows],
+            self._type_codes[cols], self._tiers[cols],
+            market=self.market_correlation,
+            asset_type=self.asset_type_correlation,
+            risk_tier=self.risk_tier_correlation
+        )
+
+    def _rebuild(self):
+        """Build the dense correlation cache from scratch"""
+        n = self._size
+        dim = min(self._capacity, self.max_dense_assets)
+        self._correlation = np.zeros((dim, dim))
+        everything = np.arange(n)
+        self._correlation[:n, :n] = self._block(everything, everything)
+        np.fill_diagonal(self._correlation[:n, :n], 1.0)
+
+    def _ensure_capacity(self, size: int):
+        """Grow the per-asset arrays (and the dense cache) geometrically"""
+        if size <= self._capacity:
+            return
+        capacity = max(16, self._capacity)
+        while capacity < size:
+            capacity *= 2
+
+        for name in ("_type_codes", "_tiers", "_volatility"):
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:self._size] = old[:self._size]
+            setattr(self, name, grown)
+
+        if self._correlation is not None and capacity <= self.max_dense_assets:
+            grown = np.zeros((capacity, capacity))
+            grown[:self._size, :self._size] = self._correlation[:self._size, :self._size]
+            self._correlation = grown
+        else:
+            self._correlation = None
+        self._capacity = capacity
+
+    def _type_code(self, asset_type: str) -> int:
+        code = self._type_vocab.get(asset_type)
+        if code is None:
+            code = len(self._type_vocab)
+            self._type_vocab[asset_type] = code
+        return code
+
+    def _count(self, code: int, tier: int, delta: int):
+        """Maintain the type / tier histograms used by correlation_factors"""
+        self._type_counts[code] = self._type_counts.get(code, 0) + delta
+        self._tier_counts[tier] = self._tier_counts.get(tier, 0) + delta
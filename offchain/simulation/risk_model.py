@@ -5,10 +5,13 @@ Simulates risk profiles for ERC-3643 RWA tokens
 """
 
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Sequence
 import math
+import threading
 from datetime import datetime, timedelta
 
+import numpy as np
+
 
 @dataclass
 class RiskSignature:
@@ -26,10 +29,71 @@ class RiskSignature:
 
 
 class RiskSimulator:
-    """Simulates risk profiles for ERC-3643 RWA tokens"""
+    """
+    Simulates risk profiles for ERC-3643 RWA tokens
+    
+    A simulator may be shared by request threads. Every write to the
+    signature store, the correlation engine and the signature cache happens
+    under `lock`; callers reading the store or the correlation engine
+    directly (row lookups, submatrix, correlation_factors) must hold it too.
+    """
+    
+    # Per-asset-type base parameters (shared by the scalar and batch paths)
+    BASE_VOLATILITY = {
+        "corporate-bond": 0.05,
+        "real-estate": 0.12,
+        "startup-fund": 0.35,
+        "revenue-sharing": 0.20,
+        "credit-risk-pool": 0.15
+    }
+    DEFAULT_VOLATILITY = 0.15
+    
+    BASE_LIQUIDITY = {
+        "corporate-bond": 70,
+        "real-estate": 40,
+        "startup-fund": 20,
+        "revenue-sharing": 50,
+        "credit-risk-pool": 60
+    }
+    DEFAULT_LIQUIDITY = 50
+    
+    BASE_COUNTERPARTY_RISK = {
+        "corporate-bond": 15,
+        "real-estate": 25,
+        "startup-fund": 60,
+        "revenue-sharing": 35,
+        "credit-risk-pool": 30
+    }
+    DEFAULT_COUNTERPARTY_RISK = 40
+    
+    # Assets kept in the signature store and correlation universe by default
+    DEFAULT_MAX_ASSETS = 250_000
     
-    def __init__(self):
-        self.risk_cache: Dict[str, RiskSignature] = {}
+    def __init__(self, signature_cache=None, enable_cache: bool = True, max_assets: int = None):
+        """
+        Args:
+            signature_cache: SignatureCache used to memoize simulate_risk
+                (a default-sized cache is created if omitted)
+            enable_cache: Set to False to always recompute signatures
+            max_assets: Assets kept in the signature store and correlation
+                universe (default DEFAULT_MAX_ASSETS, 0 = unbounded). Beyond
+                it the least recently simulated assets are evicted, down to
+                90% of the budget.
+        """
+        # Imported here: these modules depend on RiskSignature defined above
+        from .signature_store import RiskSignatureStore
+        from .signature_cache import SignatureCache
+        from .correlation import CorrelationEngine
+        self.signature_store = RiskSignatureStore(asset_types=self.BASE_VOLATILITY.keys())
+        self.correlation_engine = CorrelationEngine()
+        if enable_cache:
+            self.signature_cache = signature_cache if signature_cache is not None else SignatureCache()
+        else:
+            self.signature_cache = None
+        self.max_assets = self.DEFAULT_MAX_ASSETS if max_assets is None else max_assets
+        self.evictions = 0
+        # Guards the store, the correlation engine and the cache (see class docstring)
+        self.lock = threading.RLock()
     
     def simulate_risk(
         self,
@@ -57,6 +121,22 @@ class RiskSimulator:
         if current_timestamp is None:
             current_timestamp = int(datetime.now().timestamp())
         
+        cache_key = None
+        if self.signature_cache is not None:
+            cache_key = self.signature_cache.make_key(
+                asset_address, asset_type, annual_yield, maturity_timestamp, risk_tier, current_timestamp
+            )
+            with self.lock:
+                cached = self.signature_cache.get(cache_key)
+                if cached is not None:
+                    # The store usually still holds this exact signature; only
+                    # rewrite it (and the correlation universe) when it does not
+                    if self.signature_store.get(asset_address) == cached:
+                        self.signature_store.touch(asset_address)
+                    else:
+                        self._store([cached])
+                    return cached
+        
         # Calculate maturity in days
         if maturity_timestamp == 0:
             maturity_days = 0
@@ -72,7 +152,7 @@ class RiskSimulator:
         # Lower risk tier + reasonable yield = higher credit score
         base_credit = 100 - (risk_tier * 15)
         yield_adjustment = min(10, yield_pct * 0.5)  # Bonus for yield up to 10 points
-        credit_score = max(0, min(100, base_credit + yield_adjustment))
+        credit_score = float(max(0, min(100, base_credit + yield_adjustment)))
         
         # Calculate volatility based on asset type and risk tier
         volatility = self._calculate_volatility(asset_type, risk_tier, yield_pct)
@@ -96,18 +176,192 @@ class RiskSimulator:
             duration=duration
         )
         
-        self.risk_cache[asset_address] = signature
+        with self.lock:
+            self._store([signature])
+            if cache_key is not None:
+                self.signature_cache.put(cache_key, signature)
         return signature
     
+    def simulate_risk_batch(
+        self,
+        asset_addresses: Sequence[str],
+        asset_types: Sequence[str],
+        annual_yields: Sequence[float],
+        maturity_timestamps: Sequence[int],
+        risk_tiers: Sequence[int],
+        current_timestamp: int = None,
+        record: bool = True
+    ) -> List[RiskSignature]:
+        """
+        Simulate risk profiles for many RWA tokens in one vectorized pass
+        
+        Produces the same signatures as calling simulate_risk() once per token,
+        but computes every metric with NumPy array math over the whole batch.
+        The signature cache is not consulted: a per-token lookup costs more
+        than recomputing the batch.
+        
+        Args:
+            asset_addresses: Token contract addresses
+            asset_types: Asset type of each token
+            annual_yields: Annual yields in basis points
+            maturity_timestamps: Unix maturity timestamps (0 if no maturity)
+            risk_tiers: Risk tiers (1-5)
+            current_timestamp: Current block timestamp, shared by the whole batch
+            record: Add the signatures to the signature store and correlation
+                universe (False only computes them)
+            
+        Returns:
+            RiskSignatures in input order
+        """
+        n = len(asset_addresses)
+        if not (len(asset_types) == len(annual_yields) == len(maturity_timestamps) == len(risk_tiers) == n):
+            raise ValueError("All input columns must have the same length")
+        if n == 0:
+            return []
+        
+        if current_timestamp is None:
+            current_timestamp = int(datetime.now().timestamp())
+        
+        columns = self._compute_risk_columns(
+            asset_types,
+            np.asarray(annual_yields, dtype=np.float64),
+            np.asarray(maturity_timestamps, dtype=np.int64),
+            np.asarray(risk_tiers, dtype=np.int64),
+            current_timestamp
+        )
+        if record:
+            with self.lock:
+                self.signature_store.upsert_columns(asset_addresses, asset_types, columns)
+                self.correlation_engine.upsert(
+                    asset_addresses, asset_types, columns["risk_tier"], columns["volatility"]
+                )
+                self._enforce_asset_budget()
+        return self._signatures_from_columns(asset_addresses, asset_types, columns)
+    
+    def remove_asset(self, asset_address: str) -> bool:
+        """Drop an asset from the signature store and correlation universe"""
+        with self.lock:
+            removed = self.signature_store.remove(asset_address)
+            self.correlation_engine.remove(asset_address)
+        return removed
+    
+    def _enforce_asset_budget(self):
+        """Evict the least recently simulated assets once the store exceeds max_assets (lock held)"""
+        if self.max_assets <= 0 or len(self.signature_store) <= self.max_assets:
+            return
+        # Evict down to 90% of the budget, so eviction is amortized over many inserts
+        evicted = self.signature_store.least_recent(len(self.signature_store) - self.max_assets * 9 // 10)
+        self.signature_store.remove_many(evicted)
+        self.correlation_engine.remove_many(evicted)
+        self.evictions += len(evicted)
+    
+    def _store(self, signatures: List[RiskSignature]):
+        """Record signatures in the store and the correlation universe (lock held)"""
+        if len(signatures) == 1:
+            self.signature_store.upsert(signatures[0])
+        else:
+            self.signature_store.upsert_signatures(signatures)
+        self.correlation_engine.upsert(
+            [sig.asset_address for sig in signatures],
+            [sig.asset_type for sig in signatures],
+            [sig.risk_tier for sig in signatures],
+            [sig.volatility for sig in signatures]
+        )
+        self._enforce_asset_budget()
+    
+    @staticmethod
+    def _signatures_from_columns(
+        asset_addresses: Sequence[str],
+        asset_types: Sequence[str],
+        columns: Dict[str, np.ndarray]
+    ) -> List[RiskSignature]:
+        """Build RiskSignature objects from computed metric columns"""
+        return [
+            RiskSignature(*row)
+            for row in zip(
+                asset_addresses,
+                asset_types,
+                columns["risk_tier"].tolist(),
+                columns["annual_yield"].tolist(),
+                columns["maturity_days"].tolist(),
+                columns["credit_score"].tolist(),
+                columns["volatility"].tolist(),
+                columns["liquidity_score"].tolist(),
+                columns["counterparty_risk"].tolist(),
+                columns["duration"].tolist()
+            )
+        ]
+    
+    def _compute_risk_columns(
+        self,
+        asset_types: Sequence[str],
+        annual_yields: np.ndarray,
+        maturity_timestamps: np.ndarray,
+        risk_tiers: np.ndarray,
+        current_timestamp: int
+    ) -> Dict[str, np.ndarray]:
+        """Vectorized counterpart of simulate_risk's metric calculations"""
+        # Map asset types to per-type base parameters via their unique values
+        unique_types, type_codes = np.unique(np.asarray(asset_types, dtype=str), return_inverse=True)
+        base_volatility = np.array(
+            [self.BASE_VOLATILITY.get(t, self.DEFAULT_VOLATILITY) for t in unique_types], dtype=np.float64
+        )[type_codes]
+        base_liquidity = np.array(
+            [self.BASE_LIQUIDITY.get(t, self.DEFAULT_LIQUIDITY) for t in unique_types], dtype=np.int64
+        )[type_codes]
+        base_counterparty = np.array(
+            [self.BASE_COUNTERPARTY_RISK.get(t, self.DEFAULT_COUNTERPARTY_RISK) for t in unique_types], dtype=np.float64
+        )[type_codes]
+        
+        # Maturity in days (0 when there is no maturity)
+        has_maturity = maturity_timestamps != 0
+        maturity_days = np.where(
+            has_maturity,
+            np.maximum(0, (maturity_timestamps - current_timestamp) // 86400),
+            0
+        )
+        duration = maturity_days / 365.0
+        
+        yield_pct = annual_yields / 100.0
+        
+        # Credit score
+        base_credit = 100 - risk_tiers * 15
+        yield_adjustment = np.minimum(10, yield_pct * 0.5)
+        credit_score = np.clip(base_credit + yield_adjustment, 0, 100)
+        
+        # Volatility
+        tier_multiplier = 1.0 + (risk_tiers - 1) * 0.3
+        volatility = base_volatility * tier_multiplier
+        volatility = np.where(yield_pct > 10, volatility * 1.2, volatility)
+        volatility = np.minimum(1.0, volatility)
+        
+        # Liquidity score
+        maturity_bonus = np.select(
+            [maturity_days <= 0, maturity_days < 90, maturity_days < 365],
+            [0, 20, 10],
+            default=-10
+        )
+        liquidity_score = np.clip(base_liquidity + maturity_bonus + (6 - risk_tiers) * 5, 0, 100)
+        
+        # Counterparty risk
+        tier_adjustment = (risk_tiers - 1) * 10
+        credit_adjustment = (100 - credit_score) / 2
+        counterparty_risk = np.clip(base_counterparty + tier_adjustment + credit_adjustment, 0, 100)
+        
+        return {
+            "risk_tier": risk_tiers,
+            "annual_yield": yield_pct,
+            "maturity_days": maturity_days,
+            "credit_score": credit_score,
+            "volatility": volatility,
+            "liquidity_score": liquidity_score,
+            "counterparty_risk": counterparty_risk,
+            "duration": duration
+        }
+    
     def _calculate_volatility(self, asset_type: str, risk_tier: int, yield_pct: float) -> float:
         """Calculate annualized volatility"""
-        base_volatility = {
-            "corporate-bond": 0.05,
-            "real-estate": 0.12,
-            "startup-fund": 0.35,
-            "revenue-sharing": 0.20,
-            "credit-risk-pool": 0.15
-        }.get(asset_type, 0.15)
+        base_volatility = self.BASE_VOLATILITY.get(asset_type, self.DEFAULT_VOLATILITY)
         
         # Adjust for risk tier
         tier_multiplier = 1.0 + (risk_tier - 1) * 0.3
@@ -122,13 +376,7 @@ class RiskSimulator:
     def _calculate_liquidity(self, asset_type: str, maturity_days: int, risk_tier: int) -> float:
         """Calculate liquidity score (0-100, higher is better)"""
         # Base liquidity by asset type
-        base_liquidity = {
-            "corporate-bond": 70,
-            "real-estate": 40,
-            "startup-fund": 20,
-            "revenue-sharing": 50,
-            "credit-risk-pool": 60
-        }.get(asset_type, 50)
+        base_liquidity = self.BASE_LIQUIDITY.get(asset_type, self.DEFAULT_LIQUIDITY)
         
         # Adjust for maturity (shorter = more liquid)
         if maturity_days > 0:
@@ -149,13 +397,7 @@ class RiskSimulator:
     
     def _calculate_counterparty_risk(self, asset_type: str, risk_tier: int, credit_score: float) -> float:
         """Calculate counterparty risk (0-100, lower is better)"""
-        base_risk = {
-            "corporate-bond": 15,
-            "real-estate": 25,
-            "startup-fund": 60,
-            "revenue-sharing": 35,
-            "credit-risk-pool": 30
-        }.get(asset_type, 40)
+        base_risk = self.BASE_COUNTERPARTY_RISK.get(asset_type, self.DEFAULT_COUNTERPARTY_RISK)
         
         # Adjust for risk tier
         tier_adjustment = (risk_tier - 1) * 10
@@ -164,17 +406,20 @@ class RiskSimulator:
         credit_adjustment = (100 - credit_score) / 2
         
         counterparty_risk = base_risk + tier_adjustment + credit_adjustment
-        return max(0, min(100, counterparty_risk))
+        return float(max(0, min(100, counterparty_risk)))
     
     def get_risk_signature(self, asset_address: str) -> RiskSignature:
-        """Get cached risk signature"""
-        if asset_address not in self.risk_cache:
+        """Get stored risk signature"""
+        with self.lock:
+            signature = self.signature_store.get(asset_address)
+        if signature is None:
             raise ValueError(f"No risk signature found for {asset_address}")
-        return self.risk_cache[asset_address]
+        return signature
     
     def get_all_signatures(self) -> List[RiskSignature]:
-        """Get all cached risk signatures"""
-        return list(self.risk_cache.values())
+        """Get all stored risk signatures"""
+        with self.lock:
+            return self.signature_store.signatures()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Praxos Risk Signature Cache
+Bounded, TTL-aware memoization of simulated risk signatures
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+import sys
+import time
+
+from .risk_model import RiskSignature
+
+
+SECONDS_PER_DAY = 86400
+
+# Key tuple, LRU node, entry tuple, dataclass instance and boxed numeric values
+_ENTRY_OVERHEAD_BYTES = 96 + 100 + 64 + 48 + 14 * 32
+
+
+def _copy_signature(signature: RiskSignature) -> RiskSignature:
+    """Shallow copy of a signature (every field is immutable), cheaper than copy.copy"""
+    clone = object.__new__(RiskSignature)
+    clone.__dict__.update(signature.__dict__)
+    return clone
+
+
+class SignatureCache:
+    """
+    LRU cache of RiskSignatures keyed on the simulation inputs
+
+    Entries are keyed on (address, asset_type, yield, tier, days to
+    maturity). Days to maturity are the only time-dependent input of a
+    signature, so a hit is exactly what simulate_risk would compute at that
+    valuation time. The cache is bounded both by entry count and by an
+    estimate of the bytes it holds, and entries expire after a TTL.
+    Signatures are copied on put and get, so callers may modify the objects
+    they hold without corrupting the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 200_000,
+        max_bytes: int = 128 * 1024 * 1024,
+        ttl_seconds: float = 3600.0
+    ):
+        """
+        Args:
+            max_entries: Maximum number of cached signatures
+            max_bytes: Approximate memory budget for cached entries
+            ttl_seconds: Lifetime of an entry (0 disables expiry)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[RiskSignature, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(
+        asset_address: str,
+        asset_type: str,
+        annual_yield: float,
+        maturity_timestamp: int,
+        risk_tier: int,
+        current_timestamp: int
+    ) -> Tuple:
+        """Build the cache key for a set of simulation inputs"""
+        # Same rule as RiskSimulator.simulate_risk (0 = no maturity or matured)
+        if maturity_timestamp == 0:
+            maturity_days = 0
+        else:
+            maturity_days = max(0, (maturity_timestamp - current_timestamp) // SECONDS_PER_DAY)
+        return (
+            asset_address,
+            asset_type,
+            annual_yield,
+            risk_tier,
+            maturity_days
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[RiskSignature]:
+        """Get a cached signature, or None on a miss or expired entry"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        signature, expires_at, size = entry
+        if self.ttl_seconds > 0 and time.monotonic() >= expires_at:
+            del self._entries[key]
+            self._bytes -= size
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return _copy_signature(signature)
+
+    def put(self, key: Hashable, signature: RiskSignature):
+        """Cache a signature, evicting least recently used entries if over budget"""
+        if self.max_entries <= 0:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[2]
+
+        size = self._estimate_size(signature)
+        self._entries[key] = (_copy_signature(signature), time.monotonic() + self.ttl_seconds, size)
+        self._bytes += size
+
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Get hit/miss/eviction counters and current occupancy"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    @staticmethod
+    def _estimate_size(signature: RiskSignature) -> int:
+        """Approximate bytes held by a cache entry"""
+        return (
+            _ENTRY_OVERHEAD_BYTES
+            + sys.getsizeof(signature.__dict__)
+            + sys.getsizeof(signature.asset_address)
+            + sys.getsizeof(signature.asset_type)
+        )
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Praxos Risk Signature Store
+Columnar storage for simulated RiskSignatures
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .risk_model import RiskSignature
+
+
+class RiskSignatureStore:
+    """
+    Columnar store of risk signatures
+
+    Every numeric RiskSignature field lives in its own typed NumPy array and
+    asset types are kept as small integer codes into a shared vocabulary.
+    Rows are addressed through an address -> row index, and RiskSignature
+    objects are only materialized on demand. Every write stamps its rows
+    with a logical clock, so the least recently written assets can be found
+    for eviction (see least_recent).
+    """
+
+    # Stored numeric fields and their dtypes (duration is derived from maturity_days)
+    FIELD_DTYPES = {
+        "risk_tier": np.int8,
+        "annual_yield": np.float64,
+        "maturity_days": np.int32,
+        "credit_score": np.float64,
+        "volatility": np.float64,
+        "liquidity_score": np.int16,
+        "counterparty_risk": np.float64
+    }
+
+    def __init__(self, asset_types: Iterable[str] = (), initial_capacity: int = 1024):
+        self._capacity = max(1, initial_capacity)
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(self._capacity, dtype=dtype)
+            for name, dtype in self.FIELD_DTYPES.items()
+        }
+        self._type_codes = np.zeros(self._capacity, dtype=np.int16)
+        # Logical time of each row's last write / touch
+        self._touched = np.zeros(self._capacity, dtype=np.int64)
+        self._clock = 0
+        self._addresses: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self.asset_types: List[str] = []
+        self._type_index: Dict[str, int] = {}
+        for asset_type in asset_types:
+            self.type_code(asset_type)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, asset_address: str) -> bool:
+        return asset_address in self._rows
+
+    @property
+    def addresses(self) -> List[str]:
+        """Asset addresses in row order"""
+        return self._addresses
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays"""
+        return sum(col.nbytes for col in self._columns.values()) + self._type_codes.nbytes + self._touched.nbytes
+
+    def type_code(self, asset_type: str) -> int:
+        """Get (registering if needed) the integer code for an asset type"""
+        code = self._type_index.get(asset_type)
+        if code is None:
+            code = len(self.asset_types)
+            if code > np.iinfo(np.int16).max:
+                raise ValueError("Too many distinct asset types")
+            self.asset_types.append(asset_type)
+            self._type_index[asset_type] = code
+        return code
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get a field as a NumPy array view (no copy)
+
+        Args:
+            name: A RiskSignature field name, "asset_type_code" or "duration"
+        """
+        if name == "asset_type_code":
+            return self._type_codes[:self._size]
+        if name == "duration":
+            return self._columns["maturity_days"][:self._size] / 365.0
+        if name not in self._columns:
+            raise KeyError(f"Unknown column {name}")
+        return self._columns[name][:self._size]
+
+    def row_of(self, asset_address: str) -> Optional[int]:
+        """Get the row of an asset, or None if it is not stored"""
+        return self._rows.get(asset_address)
+
+    def rows_for(self, asset_addresses: Sequence[str]) -> np.ndarray:
+        """Get the rows of several assets (raises KeyError for unknown addresses)"""
+        rows = self._rows
+        return np.fromiter((rows[a] for a in asset_addresses), dtype=np.int64, count=len(asset_addresses))
+
+    def upsert(self, signature: RiskSignature) -> int:
+        """Insert or overwrite a single signature, returning its row"""
+        row = self._rows.get(signature.asset_address)
+        if row is None:
+            self._ensure_capacity(self._size + 1)
+            row = self._size
+            self._size += 1
+            self._addresses.append(signature.asset_address)
+            self._rows[signature.asset_address] = row
+
+        for name in self.FIELD_DTYPES:
+            self._columns[name][row] = getattr(signature, name)
+        self._type_codes[row] = self.type_code(signature.asset_type)
+        self._clock += 1
+        self._touched[row] = self._clock
+        return row
+
+    def upsert_columns(
+        self,
+        asset_addresses: Sequence[str],
+        asset_types: Sequence[str],
+        columns: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Insert or overwrite a batch of signatures given as columns
+
+        Args:
+            asset_addresses: Asset address of each input row
+            asset_types: Asset type of each input row
+            columns: Arrays for every stored field, aligned with asset_addresses
+
+        Returns:
+            Store row of each input row
+        """
+        n = len(asset_addresses)
+        rows = np.empty(n, dtype=np.int64)
+        index = self._rows
+        size = self._size
+        new_addresses = []
+        for i, address in enumerate(asset_addresses):
+            row = index.get(address)
+            if row is None:
+                row = size
+                size += 1
+                index[address] = row
+                new_addresses.append(address)
+            rows[i] = row
+
+        self._ensure_capacity(size)
+        self._addresses.extend(new_addresses)
+        self._size = size
+
+        # Keep only the last occurrence of addresses repeated within the batch
+        _, first_from_end = np.unique(rows[::-1], return_index=True)
+        positions = n - 1 - first_from_end
+        target = rows[positions]
+
+        for name in self.FIELD_DTYPES:
+            self._columns[name][target] = np.asarray(columns[name])[positions]
+
+        unique_types, inverse = np.unique(np.asarray(asset_types, dtype=str), return_inverse=True)
+        codes = np.array([self.type_code(t) for t in unique_types], dtype=np.int16)[inverse]
+        self._type_codes[target] = codes[positions]
+        self._clock += 1
+        self._touched[target] = self._clock
+        return rows
+
+    def upsert_signatures(self, signatures: Sequence[RiskSignature]) -> np.ndarray:
+        """Insert or overwrite a batch of RiskSignature objects"""
+        n = len(signatures)
+        columns = {
+            name: np.fromiter((getattr(sig, name) for sig in signatures), dtype=dtype, count=n)
+            for name, dtype in self.FIELD_DTYPES.items()
+        }
+        return self.upsert_columns(
+            [sig.asset_address for sig in signatures],
+            [sig.asset_type for sig in signatures],
+            columns
+        )
+
+    def remove(self, asset_address: str) -> bool:
+        """Remove an asset, moving the last row into its slot"""
+        row = self._rows.pop(asset_address, None)
+        if row is None:
+            return False
+
+        last = self._size - 1
+        if row != last:
+            moved = self._addresses[last]
+            self._addresses[row] = moved
+            self._rows[moved] = row
+            for col in self._columns.values():
+                col[row] = col[last]
+            self._type_codes[row] = self._type_codes[last]
+            self._touched[row] = self._touched[last]
+        self._addresses.pop()
+        self._size = last
+        return True
+
+    def remove_many(self, asset_addresses: Iterable[str]) -> int:
+        """
+        Remove several assets in one compaction pass
+
+        The remaining rows keep their relative order. Unknown addresses are
+        ignored.
+
+        Returns:
+            Number of assets removed
+        """
+        rows = [self._rows[a] for a in set(asset_addresses) if a in self._rows]
+        if not rows:
+            return 0
+
+        keep = np.ones(self._size, dtype=bool)
+        keep[rows] = False
+        survivors = np.flatnonzero(keep)
+        m = len(survivors)
+        for col in self._columns.values():
+            col[:m] = col[survivors]
+        self._type_codes[:m] = self._type_codes[survivors]
+        self._touched[:m] = self._touched[survivors]
+        self._addresses = [self._addresses[row] for row in survivors.tolist()]
+        self._rows = {address: row for row, address in enumerate(self._addresses)}
+        self._size = m
+        return len(rows)
+
+    def touch(self, asset_address: str) -> bool:
+        """Mark an asset as recently used without rewriting it"""
+        row = self._rows.get(asset_address)
+        if row is None:
+            return False
+        self._clock += 1
+        self._touched[row] = self._clock
+        return True
+
+    def least_recent(self, count: int) -> List[str]:
+        """Addresses of the (up to) count least recently written or touched assets"""
+        count = min(count, self._size)
+        if count <= 0:
+            return []
+        touched = self._touched[:self._size]
+        if count == self._size:
+            rows = np.arange(self._size)
+        else:
+            rows = np.argpartition(touched, count - 1)[:count]
+        return [self._addresses[row] for row in rows.tolist()]
+
+    def clear(self):
+        """Remove all signatures (the asset type vocabulary is kept)"""
+        self._size = 0
+        self._addresses = []
+        self._rows = {}
+
+    def signature(self, row: int) -> RiskSignature:
+        """Materialize the RiskSignature stored at a row"""
+        if not 0 <= row < self._size:
+            raise IndexError(f"Row {row} out of range")
+        cols = self._columns
+        maturity_days = int(cols["maturity_days"][row])
+        return RiskSignature(
+            asset_address=self._addresses[row],
+            asset_type=self.asset_types[self._type_codes[row]],
+            risk_tier=int(cols["risk_tier"][row]),
+            annual_yield=float(cols["annual_yield"][row]),
+            maturity_days=maturity_days,
+            credit_score=float(cols["credit_score"][row]),
+            volatility=float(cols["volatility"][row]),
+            liquidity_score=int(cols["liquidity_score"][row]),
+            counterparty_risk=float(cols["counterparty_risk"][row]),
+            duration=maturity_days / 365.0
+        )
+
+    def get(self, asset_address: str) -> Optional[RiskSignature]:
+        """Materialize the signature of an asset, or None if it is not stored"""
+        row = self._rows.get(asset_address)
+        return None if row is None else self.signature(row)
+
+    def signatures(self, rows: Optional[Sequence[int]] = None) -> List[RiskSignature]:
+        """Materialize signatures for the given rows (all rows by default)"""
+        n = self._size
+        if rows is None:
+            rows = np.arange(n)
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) and (rows.min() < 0 or rows.max() >= n):
+            raise IndexError("Row out of range")
+
+        cols = self._columns
+        maturity_days = cols["maturity_days"][rows].tolist()
+        types = self.asset_types
+        return [
+            RiskSignature(
+                asset_address=self._addresses[row],
+                asset_type=types[code],
+                risk_tier=tier,
+                annual_yield=annual_yield,
+                maturity_days=days,
+                credit_score=credit,
+                volatility=volatility,
+                liquidity_score=liquidity,
+                counterparty_risk=counterparty,
+                duration=days / 365.0
+            )
+            for row, code, tier, annual_yield, days, credit, volatility, liquidity, counterparty in zip(
+                rows.tolist(),
+                self._type_codes[rows].tolist(),
+                cols["risk_tier"][rows].tolist(),
+                cols["annual_yield"][rows].tolist(),
+                maturity_days,
+                cols["credit_score"][rows].tolist(),
+                cols["volatility"][rows].tolist(),
+                cols["liquidity_score"][rows].tolist(),
+                cols["counterparty_risk"][rows].tolist()
+            )
+        ]
+
+    def _ensure_capacity(self, size: int):
+        """Grow the column arrays geometrically to hold at least size rows"""
+        if size <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < size:
+            capacity *= 2
+        for name, col in self._columns.items():
+            grown = np.zeros(capacity, dtype=col.dtype)
+            grown[:self._size] = col[:self._size]
+            self._columns[name] = grown
+        grown_codes = np.zeros(capacity, dtype=np.int16)
+        grown_codes[:self._size] = self._type_codes[:self._size]
+        self._type_codes = grown_codes
+        grown_touched = np.zeros(capacity, dtype=np.int64)
+        grown_touched[:self._size] = self._touched[:self._size]
+        self._touched = grown_touched
+        self._capacity = capacity
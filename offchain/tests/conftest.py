@@ -0,0 +1,17 @@
+import importlib
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def server(tmp_path_factory):
+    """The API server module, with its metadata database in a temporary directory"""
+    os.environ["PRAXOS_METADATA_DB"] = str(tmp_path_factory.mktemp("metadata") / "vault_metadata.db")
+    return importlib.import_module("server")
+
+
+@pytest.fixture
+def client(server):
+    server.response_cache.clear()
+    return server.app.test_client()
@@ -0,0 +1,102 @@
+import time
+
+from loadgen.universe import generate_universe
+
+
+def batch_tokens(n, seed=4, prefix="0xbatch"):
+    return [
+        {
+            "asset_address": f"{prefix}{i}",
+            "asset_type": token["asset_type"],
+            "annual_yield": token["annual_yield"],
+            "maturity_timestamp": token["maturity_timestamp"],
+            "risk_tier": token["risk_tier"]
+        }
+        for i, token in enumerate(generate_universe(n, seed=seed, now=int(time.time())))
+    ]
+
+
+def analyze(client, tokens):
+    response = client.post("/api/risk/analyze/batch", json={"tokens": tokens})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_matches_single_analysis_of_the_same_universe(client, server):
+    tokens = batch_tokens(50)
+    results = analyze(client, tokens)["results"]
+
+    # The request's tokens form the universe their correlation factors refer to
+    simulator = server.RiskSimulator(enable_cache=False)
+    for token in tokens:
+        simulator.simulate_risk(
+            token["asset_address"], token["asset_type"], token["annual_yield"],
+            token["maturity_timestamp"], token["risk_tier"]
+        )
+    for token, result in zip(tokens, results):
+        expected = simulator.correlation_engine.correlation_factors(token["asset_address"])
+        signature = result["risk_signature"]
+        assert signature["asset_address"] == token["asset_address"]
+        assert signature["correlation_factors"] == expected
+
+
+def test_does_not_touch_the_shared_universe(client, server):
+    size = len(server.risk_simulator.signature_store)
+    version = server.risk_simulator.correlation_engine.version
+    analyze(client, batch_tokens(200))
+
+    assert len(server.risk_simulator.signature_store) == size
+    assert server.risk_simulator.correlation_engine.version == version
+
+
+def test_results_do_not_depend_on_earlier_requests(client):
+    tokens = batch_tokens(30)
+    first = analyze(client, tokens)
+    analyze(client, batch_tokens(300, seed=8, prefix="0xother"))
+    client.post("/api/risk/analyze", json=tokens[0])
+    assert analyze(client, tokens) == first
+
+
+def test_chunking_does_not_change_results(client, server, monkeypatch):
+    tokens = batch_tokens(95)
+    whole = analyze(client, tokens)
+    monkeypatch.setattr(server, "BATCH_CHUNK_SIZE", 10)
+    assert analyze(client, tokens) == whole
+
+
+def test_invalid_tokens_fail_alone(client, server, monkeypatch):
+    monkeypatch.setattr(server, "BATCH_CHUNK_SIZE", 4)
+    tokens = batch_tokens(10)
+    tokens[2] = {"asset_address": "0xbad", "asset_type": "real-estate", "annual_yield": "high"}
+    tokens[7] = dict(tokens[7], maturity_timestamp=2 ** 70)  # passes validation, overflows int64
+
+    body = analyze(client, tokens)
+    assert body["errors"] == 2
+    assert body["results"][2] == {"error": "annual_yield must be a number"}
+    assert "error" in body["results"][7]
+    assert all("risk_signature" in result for i, result in enumerate(body["results"]) if i not in (2, 7))
+    # Factors describe the tokens that could be analyzed
+    peers = sum(1 for result in body["results"] if "risk_signature" in result) - 1
+    factors = body["results"][0]["risk_signature"]["correlation_factors"]
+    assert factors["same_type_peers"] <= peers
+
+
+def test_repeated_addresses_are_rejected(client, server, monkeypatch):
+    monkeypatch.setattr(server, "BATCH_CHUNK_SIZE", 4)
+    tokens = batch_tokens(10)
+    unique = analyze(client, tokens)
+
+    # Repeats in the same chunk and in a later one, with different inputs
+    repeated = tokens + [dict(tokens[9], asset_type="startup-fund"), dict(tokens[1], risk_tier=5)]
+    body = analyze(client, repeated)
+    assert body["errors"] == 2
+    assert body["results"][10] == {"error": "duplicate asset_address 0xbatch9 (first at index 9)"}
+    assert body["results"][11] == {"error": "duplicate asset_address 0xbatch1 (first at index 1)"}
+    # The first occurrences are analyzed as if the repeats were not there
+    assert body["results"][:10] == unique["results"]
+
+
+def test_rejects_oversized_requests(client, server, monkeypatch):
+    monkeypatch.setattr(server, "MAX_BATCH_TOKENS", 3)
+    response = client.post("/api/risk/analyze/batch", json={"tokens": batch_tokens(4)})
+    assert response.status_code == 413
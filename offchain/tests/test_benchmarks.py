@@ -0,0 +1,78 @@
+from dataclasses import asdict
+import json
+
+import pytest
+
+from benchmarks.runner import BenchmarkResult, compare, load_baseline, main, save_baseline
+
+
+def result(case="simulate_risk", size=1000, items_per_second=1000.0, peak_bytes=1_000_000):
+    return BenchmarkResult(
+        case=case, size=size, unit="tokens", seconds=size / items_per_second,
+        items_per_second=items_per_second, peak_bytes=peak_bytes
+    )
+
+
+def baseline_of(*results):
+    return {"results": {r.key: {"items_per_second": r.items_per_second, "peak_bytes": r.peak_bytes} for r in results}}
+
+
+def test_compare_flags_throughput_drops_beyond_the_tolerance():
+    baseline = baseline_of(result())
+    assert compare([result(items_per_second=800.0)], baseline, tolerance=0.25) == []
+    assert compare([result(items_per_second=5000.0)], baseline, tolerance=0.25) == []
+
+    regressions = compare([result(items_per_second=700.0)], baseline, tolerance=0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("simulate_risk@1000: throughput 700 tokens/s is 30.0% below")
+
+
+def test_compare_flags_peak_memory_growth_beyond_the_tolerance():
+    baseline = baseline_of(result())
+    assert compare([result(peak_bytes=1_200_000)], baseline, memory_tolerance=0.25) == []
+
+    regressions = compare([result(peak_bytes=1_300_000)], baseline, memory_tolerance=0.25)
+    assert len(regressions) == 1
+    assert "peak memory" in regressions[0] and "30.0% above" in regressions[0]
+
+    # A baseline without a memory measurement only checks throughput
+    assert compare([result(peak_bytes=10**9)], baseline_of(result(peak_bytes=0))) == []
+
+
+def test_compare_skips_cases_missing_from_the_baseline():
+    baseline = baseline_of(result())
+    slow_new_case = result(case="suggest_vaults", items_per_second=1.0)
+    other_size = result(size=10_000, items_per_second=1.0)
+    assert compare([slow_new_case, other_size], baseline) == []
+    assert compare([result(items_per_second=1.0), slow_new_case], baseline) != []
+
+
+def test_baseline_round_trip(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    results = [result(), result(case="suggest_vaults", size=10_000, peak_bytes=0)]
+    save_baseline(results, path)
+
+    baseline = load_baseline(path)
+    assert baseline["results"] == {r.key: asdict(r) for r in results}
+    assert compare(results, baseline, tolerance=0.0, memory_tolerance=0.0) == []
+
+    (tmp_path / "future.json").write_text(json.dumps({**baseline, "version": 99}))
+    with pytest.raises(ValueError):
+        load_baseline(str(tmp_path / "future.json"))
+
+
+def test_cli_saves_and_checks_a_baseline(tmp_path, capsys):
+    path = tmp_path / "baseline.json"
+    args = ["--sizes", "200", "--cases", "simulate_risk_batch", "--repeat", "1"]
+    assert main(args + ["--save-baseline", str(path)]) == 0
+    saved = json.loads(path.read_text())
+    assert list(saved["results"]) == ["simulate_risk_batch@200"]
+
+    # Generous tolerances: tiny runs are noisy, only the wiring is checked here
+    assert main(args + ["--baseline", str(path), "--tolerance", "0.99", "--memory-tolerance", "100"]) == 0
+    assert "No regressions" in capsys.readouterr().out
+
+    saved["results"]["simulate_risk_batch@200"]["items_per_second"] *= 1000
+    path.write_text(json.dumps(saved))
+    assert main(args + ["--baseline", str(path)]) == 1
+    assert "1 regression(s)" in capsys.readouterr().out
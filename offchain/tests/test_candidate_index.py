@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from ai_engine.allocation_engine import PraxosAIEngine
+from ai_engine.candidate_index import CandidateIndex, SignatureColumns
+from loadgen.universe import generate_universe
+from simulation.risk_model import RiskSimulator
+
+
+NOW = 1_760_000_000
+
+
+@pytest.fixture(scope="module")
+def universe():
+    tokens = generate_universe(3000, seed=4, now=NOW)
+    return RiskSimulator(enable_cache=False).simulate_risk_batch(
+        [t["address"] for t in tokens],
+        [t["asset_type"] for t in tokens],
+        [t["annual_yield"] for t in tokens],
+        [t["maturity_timestamp"] for t in tokens],
+        [t["risk_tier"] for t in tokens],
+        NOW
+    )
+
+
+def brute_force(assets, template):
+    """The template filter as a plain loop over the universe"""
+    rows = []
+    for row, asset in enumerate(assets):
+        if abs(asset.risk_tier - template["risk_tier"]) > 1:
+            continue
+        if "min_credit_score" in template and asset.credit_score < template["min_credit_score"]:
+            continue
+        if "min_yield" in template and asset.annual_yield < template["min_yield"]:
+            continue
+        duration = template["target_duration"]
+        if duration > 0 and abs(asset.maturity_days - duration) > duration * 0.5:
+            continue
+        rows.append(row)
+    return rows
+
+
+def random_templates(count, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        template = {"risk_tier": int(rng.integers(1, 6)), "target_duration": int(rng.choice([0, 90, 365, 1825, 3650]))}
+        if rng.random() < 0.5:
+            template["min_credit_score"] = float(rng.uniform(30, 95))
+        if rng.random() < 0.5:
+            template["min_yield"] = float(rng.uniform(2, 12))
+        yield template
+
+
+def test_query_matches_brute_force(universe):
+    index = CandidateIndex.from_signatures(universe)
+    templates = list(PraxosAIEngine.STRATEGY_TEMPLATES.values()) + list(random_templates(50))
+    for template in templates:
+        assert index.query(template).tolist() == brute_force(universe, template)
+
+
+def test_filter_assets_keeps_universe_order(universe):
+    engine = PraxosAIEngine(RiskSimulator())
+    template = PraxosAIEngine.STRATEGY_TEMPLATES["real-estate-heavy"]
+    assert engine._filter_assets(universe, template) == [universe[row] for row in brute_force(universe, template)]
+
+
+def test_empty_universe():
+    index = CandidateIndex.from_signatures([])
+    assert index.query({"risk_tier": 3, "target_duration": 365}).tolist() == []
+
+
+def test_signature_columns_round_trip(universe):
+    columns = SignatureColumns(len(universe))
+    for start in range(0, len(universe), 700):
+        columns.extend(universe[start:start + 700])
+
+    assert len(columns) == len(universe)
+    assert [columns[row] for row in range(len(universe))] == universe
+    with pytest.raises(IndexError):
+        columns[len(universe)]
+    with pytest.raises(ValueError):
+        columns.extend(universe[:1])
+
+    # Indexed from the arrays, with the same results as the signature list
+    index = CandidateIndex.from_signatures(columns)
+    expected = CandidateIndex.from_signatures(universe)
+    for template in PraxosAIEngine.STRATEGY_TEMPLATES.values():
+        assert index.query(template).tolist() == expected.query(template).tolist()
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from simulation.correlation import CorrelationEngine
+
+
+TYPES = ["corporate-bond", "real-estate", "startup-fund", "treasury"]
+
+
+def universe(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (
+        [f"0x{i:04x}" for i in range(n)],
+        [TYPES[i] for i in rng.integers(0, len(TYPES), n)],
+        rng.integers(1, 6, n).tolist(),
+        rng.uniform(0.02, 0.4, n).tolist()
+    )
+
+
+def rebuilt(engine):
+    """A fresh engine holding the same assets in the same order"""
+    fresh = CorrelationEngine()
+    addresses = list(engine._addresses)
+    rows = [engine._index[a] for a in addresses]
+    types = {code: t for t, code in engine._type_vocab.items()}
+    fresh.upsert(
+        addresses,
+        [types[int(engine._type_codes[i])] for i in rows],
+        engine._tiers[rows].tolist(),
+        engine._volatility[rows].tolist()
+    )
+    return fresh
+
+
+def test_incremental_updates_match_a_rebuild():
+    addresses, types, tiers, vols = universe(120)
+    engine = CorrelationEngine()
+    engine.upsert(addresses[:80], types[:80], tiers[:80], vols[:80])
+    engine.submatrix(addresses[:80])  # build the dense cache before mutating
+    assert engine.is_dense
+
+    engine.upsert(addresses[80:], types[80:], tiers[80:], vols[80:])
+    engine.upsert(addresses[:10], types[10:20], tiers[10:20], vols[10:20])  # changed
+    engine.remove(addresses[30])
+    engine.remove_many(addresses[40:50] + ["0xmissing"])
+
+    remaining = list(engine._addresses)
+    assert len(remaining) == 109
+    np.testing.assert_allclose(engine.submatrix(remaining), rebuilt(engine).submatrix(remaining))
+
+
+def test_dense_and_factor_paths_agree_and_are_psd():
+    addresses, types, tiers, vols = universe(60, seed=1)
+    dense, sparse = CorrelationEngine(), CorrelationEngine(max_dense_assets=0)
+    for engine in (dense, sparse):
+        engine.upsert(addresses, types, tiers, vols)
+
+    subset = addresses[::3] + [addresses[0]]  # repeated addresses are the same asset
+    np.testing.assert_allclose(dense.submatrix(subset), sparse.submatrix(subset))
+    correlation = dense.submatrix(addresses, covariance=False)
+    assert np.allclose(np.diag(correlation), 1.0)
+    assert np.linalg.eigvalsh(correlation).min() > -1e-10
+
+
+def test_factors_match_brute_force_and_batch():
+    addresses, types, tiers, vols = universe(50, seed=2)
+    engine = CorrelationEngine()
+    engine.upsert(addresses, types, tiers, vols)
+
+    correlation = engine.submatrix(addresses, covariance=False)
+    for i in (0, 17, 49):
+        factors = engine.correlation_factors(addresses[i])
+        assert factors["mean_correlation"] == pytest.approx((correlation[i].sum() - 1.0) / 49)
+        assert factors["same_type_peers"] == types.count(types[i]) - 1
+    assert engine.correlation_factors_batch(addresses) == [engine.correlation_factors(a) for a in addresses]
+    with pytest.raises(ValueError):
+        engine.correlation_factors_batch(["0xmissing"])
+
+
+def test_version_moves_only_on_real_changes():
+    addresses, types, tiers, vols = universe(5, seed=3)
+    engine = CorrelationEngine()
+    engine.upsert(addresses, types, tiers, vols)
+    version = engine.version
+    engine.upsert(addresses[:2], types[:2], tiers[:2], vols[:2])
+    assert engine.version == version
+    engine.upsert(addresses[:1], types[:1], tiers[:1], [0.5])
+    assert engine.version > version
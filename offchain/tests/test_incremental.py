@@ -0,0 +1,53 @@
+from dataclasses import asdict
+
+from loadgen.universe import generate_universe
+from token_diff import TokenDiff, diff_tokens
+from vault_generator import VaultGenerator
+
+
+NOW = 1_760_000_000
+
+
+def full_rebuild(tokens):
+    return [asdict(strategy) for strategy in VaultGenerator().update_rwa_tokens(tokens, NOW)]
+
+
+def test_diff_ignores_metadata_only_edits():
+    previous = {"0xa": {"address": "0xa", "asset_type": "corporate-bond", "annual_yield": 500, "risk_tier": 2}}
+    renamed = [{**previous["0xa"], "name": "Bond A"}]
+    assert not diff_tokens(previous, renamed)
+
+    current = [{**previous["0xa"], "annual_yield": 550}, {**previous["0xa"], "address": "0xb"}]
+    diff = diff_tokens(previous, current)
+    assert [t["address"] for t in diff.changed] == ["0xa"]
+    assert [t["address"] for t in diff.added] == ["0xb"]
+    assert diff_tokens({**previous, "0xc": previous["0xa"]}, current).removed == ["0xc"]
+
+
+def test_incremental_update_matches_full_rebuild():
+    tokens = generate_universe(400, seed=11, now=NOW)
+    generator = VaultGenerator()
+    generator.update_rwa_tokens(tokens, NOW)
+
+    tokens = tokens[5:]  # removed
+    tokens[10] = {**tokens[10], "annual_yield": tokens[10]["annual_yield"] + 75}  # changed
+    tokens += generate_universe(420, seed=12, now=NOW)[400:]  # added
+    for token in tokens[-20:]:
+        token["address"] = token["address"] + "ff"
+
+    updated = generator.update_rwa_tokens(tokens, NOW + 60)
+    assert updated
+    assert [asdict(strategy) for strategy in updated] == full_rebuild(tokens)
+
+
+def test_unaffected_strategies_are_reused():
+    tokens = generate_universe(400, seed=13, now=NOW)
+    generator = VaultGenerator()
+    baseline = generator.update_rwa_tokens(tokens, NOW)
+    assert generator.apply_token_diff(TokenDiff(), NOW + 60) is baseline
+
+    tokens[0] = {**tokens[0], "annual_yield": tokens[0]["annual_yield"] + 10}
+    updated = generator.update_rwa_tokens(tokens, NOW + 60)
+    reused = [strategy for strategy in updated if any(strategy is previous for previous in baseline)]
+    assert baseline and reused
+    assert [asdict(strategy) for strategy in updated] == full_rebuild(tokens)
@@ -0,0 +1,50 @@
+import json
+import math
+
+from loadgen.driver import build_payloads, percentile
+from loadgen.universe import generate_universe
+
+
+NOW = 1_760_000_000
+
+
+def test_same_seed_gives_the_same_universe_and_payloads():
+    assert generate_universe(500, seed=3, now=NOW) == generate_universe(500, seed=3, now=NOW)
+    assert generate_universe(500, seed=3, now=NOW) != generate_universe(500, seed=4, now=NOW)
+
+    payloads = build_payloads(1000, tokens_per_request=50, distinct=8, seed=3, now=NOW)
+    assert payloads == build_payloads(1000, tokens_per_request=50, distinct=8, seed=3, now=NOW)
+    assert payloads != build_payloads(1000, tokens_per_request=50, distinct=8, seed=4, now=NOW)
+    assert {kind: len(bodies) for kind, bodies in payloads.items()} == {"generate": 8, "recommend": 8, "analyze": 8}
+
+
+def test_payload_maturities_count_from_now():
+    later = NOW + 86400
+    first = json.loads(build_payloads(200, tokens_per_request=200, distinct=1, now=NOW)["generate"][0])
+    second = json.loads(build_payloads(200, tokens_per_request=200, distinct=1, now=later)["generate"][0])
+    for token, shifted in zip(first["rwa_tokens"], second["rwa_tokens"]):
+        if token["maturity_timestamp"]:
+            assert shifted["maturity_timestamp"] == token["maturity_timestamp"] + 86400
+        else:
+            assert shifted["maturity_timestamp"] == 0
+
+
+def test_smaller_universe_is_a_prefix_of_a_larger_one():
+    large = generate_universe(2000, seed=7, now=NOW)
+    for n in (0, 1, 10, 999):
+        assert generate_universe(n, seed=7, now=NOW) == large[:n]
+
+
+def test_percentile_uses_the_nearest_rank():
+    values = [float(v) for v in range(1, 101)]  # 1..100
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile(values, 0) == 1.0
+
+    ten = [0.1 * v for v in range(1, 11)]
+    assert percentile(ten, 50) == ten[4]
+    assert percentile(ten, 95) == ten[9]  # rank ceil(9.5) = 10
+    assert percentile([0.25], 99) == 0.25
+    assert math.isnan(percentile([], 50))
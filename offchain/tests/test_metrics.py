@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from observability import metrics
+from observability.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def collecting():
+    previous = metrics.enabled()
+    metrics.set_enabled(True)
+    yield
+    metrics.set_enabled(previous)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("t_seconds", "Test latency", (0.1, 1.0), ("stage",))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, ("a",))
+    registry.counter("t_total", "Test count", ("path",)).inc(2, ('x"y\\z',))
+
+    assert registry.render().splitlines() == [
+        "# HELP t_seconds Test latency",
+        "# TYPE t_seconds histogram",
+        't_seconds_bucket{stage="a",le="0.1"} 1',
+        't_seconds_bucket{stage="a",le="1.0"} 3',
+        't_seconds_bucket{stage="a",le="+Inf"} 4',
+        't_seconds_sum{stage="a"} 4.05',
+        't_seconds_count{stage="a"} 4',
+        "# HELP t_total Test count",
+        "# TYPE t_total counter",
+        't_total{path="x\\"y\\\\z"} 2',
+    ]
+
+
+def test_stage_is_a_shared_no_op_when_disabled():
+    previous = metrics.enabled()
+    metrics.set_enabled(False)
+    try:
+        assert metrics.stage("simulation") is metrics.stage("allocation")
+    finally:
+        metrics.set_enabled(previous)
+
+
+def test_stages_are_recorded_when_enabled(collecting):
+    with metrics.stage("test_stage"):
+        pass
+    metrics.record_size("test_stage", "items", 42)
+    rendered = metrics.render()
+    assert 'praxos_stage_duration_seconds_count{stage="test_stage"} 1' in rendered
+    assert 'praxos_stage_items_sum{stage="test_stage",kind="items"} 42' in rendered
+
+
+def test_metrics_endpoint(client, collecting):
+    body = {"asset_address": "0xmetrics", "asset_type": "real-estate", "annual_yield": 650, "risk_tier": 3}
+    client.post("/api/risk/analyze", json=body)
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    assert 'praxos_stage_duration_seconds_count{stage="simulation"}' in response.get_data(as_text=True)
+
+    metrics.set_enabled(False)
+    assert client.get("/metrics").status_code == 404
+
+
+def test_render_sums_the_snapshots_of_every_worker(tmp_path, monkeypatch, collecting):
+    # A sibling worker's snapshot, plus files that must be skipped
+    sibling = {"praxos_http_requests_total": [[["/merge-test", "GET", "200"], 3]]}
+    (tmp_path / "worker-1-sibling.json").write_text(json.dumps(sibling))
+    (tmp_path / "worker-2-partial.json").write_text("{")
+    (tmp_path / "unrelated.json").write_text(json.dumps(sibling))
+    monkeypatch.setattr(metrics, "_shared_dir", str(tmp_path))
+    monkeypatch.setattr(metrics, "_snapshot_path", str(tmp_path / "worker-0-self.json"))
+
+    metrics.observe_request("/merge-test", "GET", 200, 0.01)
+    metrics.observe_request("/merge-test", "GET", 200, 0.02)
+    rendered = metrics.render()
+
+    assert 'praxos_http_requests_total{endpoint="/merge-test",method="GET",status="200"} 5' in rendered
+    assert 'praxos_http_request_duration_seconds_count{endpoint="/merge-test",method="GET",status="200"} 2' in rendered
+    assert json.loads((tmp_path / "worker-0-self.json").read_text()) == metrics.REGISTRY.snapshot()
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from ai_engine.allocation_engine import VaultStrategy
+from ai_engine.monte_carlo import MonteCarloEngine
+from simulation.risk_model import RiskSimulator
+
+
+NOW = 1_760_000_000
+
+
+@pytest.fixture(scope="module")
+def signatures():
+    sigs = RiskSimulator(enable_cache=False).simulate_risk_batch(
+        ["0xa", "0xb", "0xc"],
+        ["corporate-bond", "real-estate", "startup-fund"],
+        [500, 700, 1500],
+        [NOW + 400 * 86400, NOW + 1500 * 86400, 0],
+        [2, 3, 5],
+        NOW
+    )
+    return {sig.asset_address: sig for sig in sigs}
+
+
+def strategy(strategy_id, assets, weights):
+    return VaultStrategy(strategy_id, strategy_id, 3, 365, assets, weights, 0.0, 0.0)
+
+
+STRATEGIES = [strategy("mixed", ["0xa", "0xb", "0xc"], [5000, 3000, 2000]), strategy("bond", ["0xa"], [10000])]
+
+
+def test_seeded_runs_are_reproducible_and_chunking_is_invisible(signatures):
+    reports = MonteCarloEngine(n_paths=20_000, seed=7).evaluate_strategies(STRATEGIES, signatures)
+    again = MonteCarloEngine(n_paths=20_000, seed=7).evaluate_strategies(STRATEGIES, signatures)
+    chunked = MonteCarloEngine(n_paths=20_000, chunk_size=3_000, seed=7).evaluate_strategies(STRATEGIES, signatures)
+    assert reports == again == chunked
+
+
+def test_report_shape_and_tail_ordering(signatures):
+    engine = MonteCarloEngine(n_paths=20_000, histogram_bins=20, seed=1)
+    for report in engine.evaluate_strategies(STRATEGIES, signatures):
+        assert report.n_paths == 20_000
+        assert report.var <= report.cvar
+        assert sum(report.histogram_counts) == 20_000
+        assert len(report.histogram_edges) == 21
+
+
+def test_single_asset_var_matches_the_normal_quantile(signatures):
+    bond = signatures["0xa"]
+    report = MonteCarloEngine(n_paths=200_000, seed=3).evaluate_strategy(STRATEGIES[1], signatures)
+    mean, sigma = bond.annual_yield / 100.0, bond.volatility
+    assert report.expected_return == pytest.approx(mean, abs=4 * sigma / np.sqrt(200_000))
+    assert report.var == pytest.approx(-mean + 1.6449 * sigma, rel=0.02)
+
+
+def test_invalid_confidence_is_rejected():
+    with pytest.raises(ValueError):
+        MonteCarloEngine(confidence=1.0)
@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+
+from ai_engine.allocation_engine import PraxosAIEngine
+from ai_engine.optimizer import PortfolioOptimizer, project_capped_simplex, to_basis_points
+from ai_engine.strategy_registry import StrategyRegistry
+from simulation.risk_model import RiskSimulator
+
+
+NOW = 1_760_000_000
+
+
+def reference_projection(v, cap, iterations=200):
+    """Projection onto the capped simplex by bisection on the shift"""
+    lo, hi = v.min() - cap, v.max()
+    for _ in range(iterations):
+        tau = (lo + hi) / 2
+        if np.clip(v - tau, 0, cap).sum() > 1:
+            lo = tau
+        else:
+            hi = tau
+    return np.clip(v - (lo + hi) / 2, 0, cap)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_projection_sums_to_one_within_caps(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 40))
+    v = rng.normal(0, 2, n)
+    cap = float(rng.uniform(0.01, 1.0))
+
+    w = project_capped_simplex(v, cap)
+    effective_cap = max(cap, 1.0 / n)
+    assert w.sum() == pytest.approx(1.0)
+    assert w.min() >= 0.0
+    assert w.max() <= effective_cap + 1e-12
+    np.testing.assert_allclose(w, reference_projection(v, effective_cap), atol=1e-9)
+
+
+def test_projection_keeps_feasible_points():
+    w = np.array([0.2, 0.3, 0.5])
+    np.testing.assert_allclose(project_capped_simplex(w, 0.5), w)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_basis_points_sum_to_10000_within_cap(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 30))
+    cap = float(rng.uniform(1.0 / n, 1.0))
+    weights = project_capped_simplex(rng.random(n), cap)
+
+    bps = to_basis_points(weights, cap)
+    assert sum(bps) == 10000
+    assert all(isinstance(b, int) and b >= 0 for b in bps)
+    assert max(bps) <= max(int(np.floor(cap * 10000)), -(-10000 // n))
+    assert np.max(np.abs(np.array(bps) - weights * 10000)) <= n
+
+
+def test_basis_points_largest_remainder():
+    assert to_basis_points(np.array([1 / 3, 1 / 3, 1 / 3])) == [3334, 3333, 3333]
+    assert to_basis_points(np.array([])) == []
+
+
+@pytest.mark.parametrize("mode", PortfolioOptimizer.MODES)
+def test_optimizer_respects_caps(mode):
+    rng = np.random.default_rng(3)
+    a = rng.normal(size=(8, 8))
+    covariance = a @ a.T / 8 + np.eye(8) * 0.01
+    mu = rng.uniform(0.02, 0.15, 8)
+
+    w = PortfolioOptimizer(mode, max_weight=0.2).optimize(mu, covariance)
+    assert w.sum() == pytest.approx(1.0)
+    assert w.min() >= 0.0
+    assert w.max() <= 0.2 + 1e-9
+
+
+def test_min_variance_diagonal_is_inverse_variance():
+    variances = np.array([0.01, 0.04, 0.09])
+    w = PortfolioOptimizer("min-variance", max_iterations=5000, tolerance=1e-12).optimize(
+        np.zeros(3), np.diag(variances)
+    )
+    expected = (1 / variances) / (1 / variances).sum()
+    np.testing.assert_allclose(w, expected, atol=1e-6)
+
+
+def test_risk_parity_equalizes_contributions():
+    covariance = np.array([[0.04, 0.01, 0.0], [0.01, 0.09, 0.02], [0.0, 0.02, 0.16]])
+    w = PortfolioOptimizer("risk-parity", max_iterations=5000, tolerance=1e-12).optimize(np.zeros(3), covariance)
+    contributions = w * (covariance @ w)
+    np.testing.assert_allclose(contributions / contributions.sum(), 1 / 3, atol=1e-4)
+
+
+def test_warm_start_reaches_the_same_solution():
+    covariance = np.diag([0.01, 0.02, 0.03, 0.05])
+    mu = np.array([0.05, 0.06, 0.07, 0.09])
+    optimizer = PortfolioOptimizer(max_iterations=5000, tolerance=1e-12)
+    cold = optimizer.optimize(mu, covariance)
+    warm = optimizer.optimize(mu, covariance, warm_start=np.array([0.7, 0.1, 0.1, 0.1]))
+    np.testing.assert_allclose(warm, cold, atol=1e-6)
+
+
+def universe(simulator, n=60):
+    types = list(RiskSimulator.BASE_VOLATILITY)
+    return simulator.simulate_risk_batch(
+        [f"0x{i:040x}" for i in range(n)],
+        [types[i % len(types)] for i in range(n)],
+        [300 + 50 * (i % 25) for i in range(n)],
+        [NOW + 86400 * (30 + 45 * (i % 90)) if i % 6 else 0 for i in range(n)],
+        [1 + i % 5 for i in range(n)],
+        NOW
+    )
+
+
+def test_engine_weights_are_basis_points():
+    simulator = RiskSimulator()
+    engine = PraxosAIEngine(simulator, optimizer=PortfolioOptimizer("mean-variance", max_weight=0.4))
+    strategies = engine.generate_vault_strategies(universe(simulator))
+
+    assert strategies
+    for strategy in strategies:
+        assert sum(strategy.weights) == 10000
+        assert len(strategy.weights) == len(strategy.assets)
+        assert max(strategy.weights) <= max(4000, -(-10000 // len(strategy.weights)))
+
+
+def test_covariance_fallback_matches_correlation_engine():
+    simulator = RiskSimulator()
+    assets = universe(simulator, 12)
+    # An engine whose simulator never saw these assets builds the factor model itself
+    engine = PraxosAIEngine(RiskSimulator(), optimizer=PortfolioOptimizer())
+    np.testing.assert_allclose(
+        engine._covariance(assets),
+        simulator.correlation_engine.submatrix([asset.asset_address for asset in assets])
+    )
+
+
+def test_warm_starts_are_pruned_with_the_registry():
+    simulator = RiskSimulator()
+    assets = universe(simulator)
+    engine = PraxosAIEngine(
+        simulator, optimizer=PortfolioOptimizer(), strategy_registry=StrategyRegistry(max_generations=2)
+    )
+    template = dict(PraxosAIEngine.STRATEGY_TEMPLATES["balanced-diversified"])
+    for i in range(5):
+        engine.generate_vault_strategies(assets, [f"custom-{i}"], {f"custom-{i}": template})
+
+    assert set(engine._previous_weights) == {"custom-3", "custom-4"}
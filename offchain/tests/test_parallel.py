@@ -0,0 +1,73 @@
+from dataclasses import asdict, replace
+
+import pytest
+
+from ai_engine.allocation_engine import PraxosAIEngine
+from ai_engine.optimizer import PortfolioOptimizer
+from ai_engine.parallel import ParallelStrategyBuilder
+from loadgen.universe import generate_universe
+from simulation.risk_model import RiskSimulator
+
+
+NOW = 1_760_000_000
+
+
+@pytest.fixture(scope="module")
+def universe():
+    tokens = generate_universe(2000, seed=8, now=NOW)
+    return RiskSimulator(enable_cache=False).simulate_risk_batch(
+        [t["address"] for t in tokens],
+        [t["asset_type"] for t in tokens],
+        [t["annual_yield"] for t in tokens],
+        [t["maturity_timestamp"] for t in tokens],
+        [t["risk_tier"] for t in tokens],
+        NOW
+    )
+
+
+def generate(universe, **kwargs):
+    engine = PraxosAIEngine(RiskSimulator(), **kwargs)
+    try:
+        return [asdict(strategy) for strategy in engine.generate_vault_strategies(universe)]
+    finally:
+        engine.close()
+
+
+@pytest.mark.parametrize("optimizer", [None, PortfolioOptimizer()], ids=["scoring", "optimizer"])
+def test_parallel_matches_serial(universe, optimizer):
+    serial = generate(universe, optimizer=optimizer)
+    assert serial
+    assert generate(universe, optimizer=optimizer, max_workers=3) == serial
+
+
+def test_spawned_workers_match_serial(universe):
+    engine = PraxosAIEngine(RiskSimulator())
+    engine._parallel_builder = ParallelStrategyBuilder(max_workers=2, mp_context="spawn")
+    engine.max_workers = 2
+    try:
+        spawned = [asdict(strategy) for strategy in engine.generate_vault_strategies(universe)]
+    finally:
+        engine.close()
+    assert spawned == generate(universe)
+
+
+def test_parallel_keeps_optimizer_warm_starts(universe):
+    # Two generations: the second starts from the weights of the first
+    shifted = [replace(asset, annual_yield=asset.annual_yield * 1.1) for asset in universe]
+
+    def two_generations(**kwargs):
+        engine = PraxosAIEngine(RiskSimulator(), optimizer=PortfolioOptimizer(), **kwargs)
+        try:
+            generations = [
+                [asdict(strategy) for strategy in engine.generate_vault_strategies(assets)]
+                for assets in (universe, shifted)
+            ]
+            return generations, engine._previous_weights
+        finally:
+            engine.close()
+
+    serial, serial_weights = two_generations()
+    parallel, parallel_weights = two_generations(max_workers=3)
+    assert serial_weights
+    assert parallel_weights == serial_weights
+    assert parallel == serial
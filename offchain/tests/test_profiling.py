@@ -0,0 +1,70 @@
+import json
+import os
+
+import pytest
+from flask import Flask, jsonify
+
+from observability import metrics
+from observability.profiling import PROFILE_HEADER, RequestProfiler
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    def build(**kwargs):
+        app = Flask(__name__)
+        profiler = RequestProfiler(str(tmp_path), **kwargs)
+        profiler.install(app)
+
+        @app.route("/work")
+        def work():
+            with metrics.stage("simulation"):
+                pass
+            with metrics.stage("allocation"):
+                with metrics.stage("select_assets"):
+                    pass
+            return jsonify({"ok": True})
+
+        return app.test_client()
+
+    yield build
+    metrics.set_tracing(False)
+    metrics.set_span_recorder(None)
+
+
+def get(client, headers=None):
+    # Reports are written once the response is closed
+    response = client.get("/work", headers=headers or {})
+    response.close()
+    return response
+
+
+def reports(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+
+
+def test_header_is_ignored_without_a_token(make_app, tmp_path):
+    client = make_app()
+    response = get(client, {PROFILE_HEADER: "1"})
+    assert "X-Praxos-Profile-Id" not in response.headers
+    assert reports(tmp_path) == []
+
+
+def test_header_requires_the_configured_token(make_app, tmp_path):
+    client = make_app(token="secret")
+    assert "X-Praxos-Profile-Id" not in get(client, {PROFILE_HEADER: "1"}).headers
+
+    profile_id = get(client, {PROFILE_HEADER: "secret"}).headers["X-Praxos-Profile-Id"]
+    assert os.path.exists(tmp_path / f"{profile_id}.prof")
+    with open(tmp_path / f"{profile_id}.json") as f:
+        report = json.load(f)
+    assert report["reasons"] == ["header"]
+    assert set(report["breakdown_ms"]) == {"RiskSimulator", "PraxosAIEngine", "unattributed"}
+    assert [span["name"] for span in report["spans"]] == ["simulation", "select_assets", "allocation"]
+
+
+def test_reports_are_pruned_periodically(make_app, tmp_path):
+    client = make_app(slow_threshold_ms=0.0, max_files=20)
+    for _ in range(45):
+        get(client)
+    # Pruned every max_files / 10 writes, so at most 10% over the budget
+    assert 20 <= len(reports(tmp_path)) <= 22
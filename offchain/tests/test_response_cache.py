@@ -0,0 +1,158 @@
+import time
+
+from flask import Flask, jsonify
+
+from loadgen.universe import generate_universe
+from response_cache import ResponseCache, cached_response
+
+
+NOW = 1_760_000_000
+
+
+def test_lru_eviction_by_bytes_and_entries():
+    cache = ResponseCache(max_bytes=10, max_entries=2)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    cache.get("a")
+    cache.put("c", b"1")  # over the entry budget: evicts b
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    cache.put("d", b"123456789")  # over the byte budget
+    assert len(cache) == 1
+    assert cache.stats()["evictions"] == 3
+
+
+def test_oversized_bodies_are_not_stored():
+    cache = ResponseCache(max_bytes=4)
+    entry = cache.put("a", b"too large")
+    assert entry.etag and len(cache) == 0
+
+
+def test_key_is_canonical_and_day_bucketed():
+    key = ResponseCache.make_key("/p", {"a": 1, "b": [1, 2]}, NOW)
+    assert key == ResponseCache.make_key("/p", {"b": [1, 2], "a": 1}, NOW + 60)
+    assert key != ResponseCache.make_key("/p", {"a": 1, "b": [1, 2]}, NOW + 86400)
+    assert key != ResponseCache.make_key("/q", {"a": 1, "b": [1, 2]}, NOW)
+    assert key != ResponseCache.make_key("/p", {"a": 1, "b": [1, 2]}, NOW, variant="application/msgpack")
+
+
+def make_app(version=None):
+    app = Flask(__name__)
+    cache = ResponseCache()
+    calls = []
+
+    @app.route("/echo", methods=["POST"])
+    @cached_response(cache, version=version)
+    def echo():
+        calls.append(1)
+        return jsonify({"calls": len(calls)})
+
+    return app.test_client(), calls
+
+
+def test_hit_miss_and_etag():
+    client, calls = make_app()
+    first = client.post("/echo", json={"x": 1})
+    second = client.post("/echo", json={"x": 1})
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.get_json() == first.get_json()
+    assert len(calls) == 1
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert "Accept" in first.headers["Vary"]
+
+    not_modified = client.post("/echo", json={"x": 1}, headers={"If-None-Match": first.headers["ETag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.data == b""
+    assert not_modified.headers["ETag"] == first.headers["ETag"]
+    assert "Accept" in not_modified.headers["Vary"]
+
+    stale = client.post("/echo", json={"x": 1}, headers={"If-None-Match": '"other"'})
+    assert stale.status_code == 200
+
+
+def test_accept_header_selects_the_variant():
+    client, calls = make_app()
+    client.post("/echo", json={"x": 1}, headers={"Accept": "application/json"})
+    client.post("/echo", json={"x": 1}, headers={"Accept": "application/msgpack"})
+    assert len(calls) == 2
+
+
+def test_version_change_invalidates():
+    version = [0]
+    client, calls = make_app(version=lambda: version[0])
+    client.post("/echo", json={"x": 1})
+    assert client.post("/echo", json={"x": 1}).headers["X-Cache"] == "HIT"
+
+    version[0] += 1
+    assert client.post("/echo", json={"x": 1}).headers["X-Cache"] == "MISS"
+    assert len(calls) == 2
+
+
+def test_requests_without_json_bypass_the_cache():
+    client, calls = make_app()
+    response = client.post("/echo", data="x")
+    assert "X-Cache" not in response.headers
+    assert len(calls) == 1
+
+
+def analyze_body(address, tier=2):
+    return {
+        "asset_address": address,
+        "asset_type": "corporate-bond",
+        "annual_yield": 500,
+        "maturity_timestamp": 0,
+        "risk_tier": tier
+    }
+
+
+def test_analyze_is_cached_until_the_universe_changes(client):
+    first = client.post("/api/risk/analyze", json=analyze_body("0xcache-a"))
+    repeat = client.post("/api/risk/analyze", json=analyze_body("0xcache-a"))
+    assert first.status_code == repeat.status_code == 200
+    assert repeat.headers["X-Cache"] == "HIT"
+    assert repeat.get_json() == first.get_json()
+
+    # A new asset of the same type changes the universe, and so the factors
+    client.post("/api/risk/analyze", json=analyze_body("0xcache-b"))
+    after = client.post("/api/risk/analyze", json=analyze_body("0xcache-a"))
+    assert after.headers["X-Cache"] == "MISS"
+    before_factors = first.get_json()["risk_signature"]["correlation_factors"]
+    after_factors = after.get_json()["risk_signature"]["correlation_factors"]
+    assert after_factors["same_type_peers"] == before_factors["same_type_peers"] + 1
+
+
+def test_generate_hit_replays_the_bookkeeping(client, server):
+    body = {"rwa_tokens": generate_universe(200, seed=5, now=int(time.time()))}
+    recorded = len(server.vault_generator.generated_vaults)
+    generation = server.vault_generator.ai_engine.strategy_registry.latest_generation
+    first = client.post("/api/vaults/generate", json=body)
+    second = client.post("/api/vaults/generate", json=body)
+
+    assert first.status_code == second.status_code == 200
+    assert (first.headers["X-Cache"], second.headers["X-Cache"]) == ("MISS", "HIT")
+    assert second.get_json() == first.get_json()
+    strategies = first.get_json()["strategies"]
+    assert strategies
+
+    # The hit records the same strategies again, as a regeneration would
+    assert len(server.vault_generator.generated_vaults) == recorded + 2 * len(strategies)
+    registry = server.vault_generator.ai_engine.strategy_registry
+    assert registry.latest_generation == generation + 2
+    assert [s.strategy_id for s in registry.generation()] == [s["strategy_id"] for s in strategies]
+
+    not_modified = client.post(
+        "/api/vaults/generate", json=body, headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert not_modified.status_code == 304
+
+
+def test_generate_streams_bypass_the_cache(client):
+    body = {"rwa_tokens": generate_universe(50, seed=6, now=int(time.time()))}
+    for _ in range(2):
+        streamed = client.post("/api/vaults/generate", json=body, headers={"Accept": "application/x-ndjson"})
+        assert streamed.mimetype == "application/x-ndjson"
+        assert "X-Cache" not in streamed.headers
+        assert streamed.get_data(as_text=True).count("\n") > len(body["rwa_tokens"])
@@ -0,0 +1,96 @@
+from dataclasses import asdict
+import threading
+
+import pytest
+
+from simulation.risk_model import RiskSimulator
+
+
+NOW = 1_760_000_000
+DAY = 86400
+
+# Covers every asset type (plus an unknown one), every maturity bracket and
+# tiers whose credit score / counterparty risk hit the 0 / 100 clamps
+TOKENS = [
+    ("0x01", "corporate-bond", 500, NOW + 30 * DAY, 1),
+    ("0x02", "real-estate", 700, NOW + 200 * DAY, 3),
+    ("0x03", "startup-fund", 2500, 0, 5),
+    ("0x04", "revenue-sharing", 1100, NOW + 2000 * DAY, 2),
+    ("0x05", "credit-risk-pool", 900, NOW - 10 * DAY, 4),
+    ("0x06", "farmland", 400, NOW + 400 * DAY, 3),
+    ("0x07", "startup-fund", 3000, NOW + 10 * DAY, 8),
+]
+
+
+def columns(tokens):
+    return [list(column) for column in zip(*tokens)]
+
+
+def test_batch_matches_scalar():
+    scalar = [RiskSimulator(enable_cache=False).simulate_risk(*token, NOW) for token in TOKENS]
+    batch = RiskSimulator(enable_cache=False).simulate_risk_batch(*columns(TOKENS), NOW)
+
+    assert len(batch) == len(scalar)
+    for expected, actual in zip(scalar, batch):
+        assert asdict(actual) == pytest.approx(asdict(expected))
+
+
+def test_batch_and_scalar_return_the_same_types():
+    scalar = [RiskSimulator(enable_cache=False).simulate_risk(*token, NOW) for token in TOKENS]
+    batch = RiskSimulator(enable_cache=False).simulate_risk_batch(*columns(TOKENS), NOW)
+
+    clamped = scalar[-1]
+    assert clamped.credit_score == 0.0 and clamped.counterparty_risk == 100.0
+    for expected, actual in zip(scalar, batch):
+        for field, value in asdict(expected).items():
+            assert type(getattr(actual, field)) is type(value), field
+        assert isinstance(actual.credit_score, float)
+        assert isinstance(actual.counterparty_risk, float)
+
+
+def test_batch_records_signatures():
+    simulator = RiskSimulator(enable_cache=False)
+    batch = simulator.simulate_risk_batch(*columns(TOKENS), NOW)
+
+    assert simulator.get_all_signatures() == batch
+    assert simulator.get_risk_signature("0x03") == batch[2]
+
+
+def test_batch_rejects_ragged_columns():
+    addresses, types, yields, maturities, tiers = columns(TOKENS)
+    with pytest.raises(ValueError):
+        RiskSimulator().simulate_risk_batch(addresses, types, yields[:-1], maturities, tiers, NOW)
+
+
+def test_empty_batch():
+    assert RiskSimulator().simulate_risk_batch([], [], [], [], [], NOW) == []
+
+
+def test_shared_simulator_survives_concurrent_writers():
+    simulator = RiskSimulator(max_assets=3_000)
+    errors = []
+
+    def work(worker):
+        try:
+            for round_ in range(12):
+                base = (worker * 12 + round_) * 200
+                addresses = [f"0x{base + i:06x}" for i in range(200)]
+                simulator.simulate_risk_batch(
+                    addresses, ["real-estate"] * 200, [600] * 200, [NOW + 500 * 86400] * 200, [3] * 200, NOW
+                )
+                simulator.simulate_risk(addresses[0], "corporate-bond", 450, 0, 2, NOW)
+                simulator.get_all_signatures()
+        except Exception as e:  # surfaced below; a failing thread would otherwise pass silently
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    store, engine = simulator.signature_store, simulator.correlation_engine
+    assert len(store) == len(store.addresses) == len(engine) <= 3_000
+    assert all(store.row_of(address) == row for row, address in enumerate(store.addresses))
+    assert all(address in engine for address in store.addresses)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from ai_engine.selection import select_diverse_top_k, top_k_indices
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_top_k_matches_a_full_stable_sort(seed):
+    rng = np.random.default_rng(seed)
+    scores = rng.integers(0, 20, 200).astype(float)  # plenty of ties
+    for k in (0, 1, 7, 200, 500):
+        expected = np.argsort(-scores, kind="stable")[:k]
+        np.testing.assert_array_equal(top_k_indices(scores, k), expected)
+
+
+def reference_diverse(scores, codes, k):
+    """Best of each type first (best types first), then the best of the rest"""
+    order = np.argsort(-scores, kind="stable").tolist()
+    picked, seen = [], set()
+    for i in order:
+        if codes[i] not in seen:
+            seen.add(codes[i])
+            picked.append(i)
+    picked = picked[:k]
+    picked += [i for i in order if i not in picked][:k - len(picked)]
+    return picked
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_diverse_top_k_covers_types_first(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 60))
+    scores = rng.random(n)
+    codes = rng.integers(0, 6, n)
+    for k in (2, 4, 10, n):
+        picked = select_diverse_top_k(scores, codes, k)
+        assert picked.tolist() == reference_diverse(scores, codes, min(k, n))
+        assert len(set(picked.tolist())) == len(picked)
+
+
+def test_below_min_diversification_falls_back_to_top_k():
+    scores = np.array([0.1, 0.9, 0.5])
+    codes = np.array([0, 0, 1])
+    assert select_diverse_top_k(scores, codes, 1).tolist() == [1]
+    assert select_diverse_top_k(scores, codes, 0).tolist() == []
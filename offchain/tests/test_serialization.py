@@ -0,0 +1,46 @@
+from dataclasses import asdict
+
+import pytest
+
+from ai_agent.suggestion_engine import RiskTolerance, Timeframe, UserPreferences
+from ai_engine.allocation_engine import VaultStrategy
+from serialization import encode_payload, encoder_for
+
+
+STRATEGY = VaultStrategy("s-1", "Strategy", 3, 365, ["0xa", "0xb"], [6000, 4000], 7.25, 81.5)
+
+
+def test_generated_encoder_matches_asdict():
+    assert encoder_for(VaultStrategy)(STRATEGY) == asdict(STRATEGY)
+    assert encoder_for(VaultStrategy) is encoder_for(VaultStrategy)
+
+
+def test_field_selection_and_enums():
+    prefs = UserPreferences(Timeframe.LONG_TERM, RiskTolerance.GROWTH, 500.0)
+    encoded = encoder_for(UserPreferences, ("risk_tolerance", "timeframe", "min_yield"))(prefs)
+    assert list(encoded) == ["risk_tolerance", "timeframe", "min_yield"]
+    assert encoded == {"risk_tolerance": 4, "timeframe": "long", "min_yield": None}
+    with pytest.raises(ValueError):
+        encoder_for(VaultStrategy, ("missing",))
+
+
+def test_payload_encodings_round_trip():
+    msgpack = pytest.importorskip("msgpack")
+    payload = {"strategies": [asdict(STRATEGY)], "count": 1}
+    assert msgpack.unpackb(encode_payload(payload, "application/msgpack")) == payload
+    assert encode_payload(payload, "application/json") == (
+        b'{"strategies":[{"strategy_id":"s-1","name":"Strategy","risk_tier":3,"target_duration":365,'
+        b'"assets":["0xa","0xb"],"weights":[6000,4000],"expected_yield":7.25,"diversification_score":81.5}],'
+        b'"count":1}'
+    )
+
+
+@pytest.mark.parametrize("accept", ["application/msgpack", "application/x-msgpack"])
+def test_server_negotiates_msgpack(client, accept):
+    msgpack = pytest.importorskip("msgpack")
+    body = {"asset_address": "0xwire", "asset_type": "corporate-bond", "annual_yield": 500, "risk_tier": 2}
+    packed = client.post("/api/risk/analyze", json=body, headers={"Accept": accept})
+    assert packed.mimetype == accept
+    plain = client.post("/api/risk/analyze", json=body)
+    assert plain.mimetype == "application/json"
+    assert msgpack.unpackb(packed.get_data()) == plain.get_json()
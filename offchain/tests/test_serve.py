@@ -0,0 +1,77 @@
+import json
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from contextlib import contextmanager
+
+import pytest
+
+
+OFFCHAIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="pre-forking needs os.fork")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def worker_pool(tmp_path, workers=2, **env):
+    """Run serve.py until the pool answers /health, yield its base URL, then stop it"""
+    port = free_port()
+    env = {**os.environ, "PRAXOS_METADATA_DB": str(tmp_path / "metadata.db"), **env}
+    process = subprocess.Popen(
+        [sys.executable, "serve.py", "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers)],
+        cwd=OFFCHAIN, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                with urllib.request.urlopen(f"{base}/health", timeout=5) as response:
+                    assert json.load(response)["status"] == "healthy"
+                    break
+            except OSError:
+                assert process.poll() is None, "serve.py exited"
+                assert time.monotonic() < deadline, "no /health answer within 60s"
+                time.sleep(0.2)
+        yield base
+    finally:
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=30) == 0
+
+
+def test_prefork_pool_answers_health(tmp_path):
+    with worker_pool(tmp_path) as base:
+        # Both workers share the socket; a burst of requests is served without errors
+        for _ in range(10):
+            with urllib.request.urlopen(f"{base}/health", timeout=5) as response:
+                assert response.status == 200
+
+
+def test_metrics_scrape_covers_every_worker(tmp_path):
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+    (metrics_dir / "worker-1-stale.json").write_text("{}")  # left by a previous run
+
+    with worker_pool(tmp_path, PRAXOS_METRICS="1", PRAXOS_METRICS_DIR=str(metrics_dir)) as base:
+        for _ in range(20):
+            urllib.request.urlopen(f"{base}/health", timeout=5).close()
+        time.sleep(1.5)  # one snapshot interval
+
+        # Every scrape sees all 21 /health requests, whichever worker answers it
+        pattern = re.compile(r'praxos_http_requests_total\{endpoint="/health",method="GET",status="200"\} (\d+)')
+        for _ in range(4):
+            with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+                assert int(pattern.search(response.read().decode()).group(1)) == 21
+        assert not (metrics_dir / "worker-1-stale.json").exists()
+        assert len(list(metrics_dir.glob("worker-*.json"))) == 2
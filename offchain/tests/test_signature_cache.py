@@ -0,0 +1,181 @@
+import numpy as np
+import pytest
+
+from simulation import signature_cache as signature_cache_module
+from simulation.risk_model import RiskSimulator
+from simulation.signature_cache import SignatureCache
+
+
+NOW = 1_760_000_000
+
+
+def simulate(simulator, address, annual_yield=500, timestamp=NOW):
+    return simulator.simulate_risk(address, "corporate-bond", annual_yield, NOW + 400 * 86400, 2, timestamp)
+
+
+def test_lru_eviction_by_entry_count():
+    simulator = RiskSimulator(signature_cache=SignatureCache(max_entries=2))
+    cache = simulator.signature_cache
+
+    simulate(simulator, "0x1")
+    simulate(simulator, "0x2")
+    simulate(simulator, "0x1")  # hit, 0x1 becomes most recent
+    simulate(simulator, "0x3")  # evicts 0x2
+
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 1
+    simulate(simulator, "0x1")
+    simulate(simulator, "0x2")
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 4
+
+
+def test_byte_budget():
+    cache = SignatureCache(max_bytes=1)
+    cache.put("k", simulate(RiskSimulator(enable_cache=False), "0x1"))
+    assert len(cache) == 0
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(signature_cache_module.time, "monotonic", lambda: clock[0])
+    simulator = RiskSimulator(signature_cache=SignatureCache(ttl_seconds=10))
+
+    simulate(simulator, "0x1")
+    clock[0] += 5
+    simulate(simulator, "0x1")
+    clock[0] += 10
+    simulate(simulator, "0x1")
+
+    stats = simulator.signature_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["expirations"] == 1
+    assert stats["misses"] == 2
+
+
+def test_key_includes_inputs_and_days_to_maturity():
+    simulator = RiskSimulator()
+    simulate(simulator, "0x1")
+    simulate(simulator, "0x1", annual_yield=600)
+    simulate(simulator, "0x1", timestamp=NOW + 86400)
+    simulate(simulator, "0x1", timestamp=NOW - 60)  # still 400 days to maturity
+    assert simulator.signature_cache.stats()["hits"] == 1
+
+
+def test_hit_never_crosses_a_maturity_boundary_within_a_day():
+    # Valuation times in the same UTC day, on either side of the maturity time of day
+    day_start = NOW - NOW % 86400
+    maturity = day_start + 100 * 86400 + 12 * 3600
+    before, after = day_start + 11 * 3600, day_start + 13 * 3600
+
+    simulator = RiskSimulator()
+    assert simulator.simulate_risk("0x1", "corporate-bond", 500, maturity, 2, before).maturity_days == 100
+    late = simulator.simulate_risk("0x1", "corporate-bond", 500, maturity, 2, after)
+    batch = RiskSimulator().simulate_risk_batch(["0x1"], ["corporate-bond"], [500], [maturity], [2], after)
+    assert late.maturity_days == batch[0].maturity_days == 99
+    assert late == batch[0]
+
+    # Perpetual tokens do not depend on the valuation time at all
+    simulator.simulate_risk("0x2", "real-estate", 700, 0, 3, before)
+    simulator.simulate_risk("0x2", "real-estate", 700, 0, 3, after + 30 * 86400)
+    assert simulator.signature_cache.stats()["hits"] == 1
+
+
+def test_hits_are_copies():
+    simulator = RiskSimulator()
+    first = simulate(simulator, "0x1")
+    first.credit_score = -1.0
+
+    second = simulate(simulator, "0x1")
+    assert second.credit_score != -1.0
+    second.volatility = -1.0
+    assert simulate(simulator, "0x1").volatility != -1.0
+    assert simulator.signature_cache.stats()["hits"] == 2
+
+
+def test_hit_restores_a_changed_store_entry():
+    simulator = RiskSimulator()
+    original = simulate(simulator, "0x1")
+    simulate(simulator, "0x1", annual_yield=900)
+    assert simulator.get_risk_signature("0x1").annual_yield == 9.0
+
+    simulate(simulator, "0x1")  # cache hit for the original inputs
+    assert simulator.get_risk_signature("0x1") == original
+    assert simulator.signature_cache.stats()["hits"] == 1
+
+
+def test_batch_bypasses_cache():
+    simulator = RiskSimulator()
+    simulator.simulate_risk_batch(["0x1"], ["real-estate"], [700], [0], [3], NOW)
+    assert simulator.signature_cache.stats()["misses"] == 0
+    assert len(simulator.signature_cache) == 0
+
+
+def test_store_and_correlation_universe_are_bounded():
+    simulator = RiskSimulator(max_assets=100)
+    for start in range(0, 1000, 50):
+        addresses = [f"0x{i:x}" for i in range(start, start + 50)]
+        simulator.simulate_risk_batch(
+            addresses, ["real-estate"] * 50, [700] * 50, [0] * 50, [3] * 50, NOW
+        )
+        assert len(simulator.signature_store) <= 100
+        assert len(simulator.correlation_engine) == len(simulator.signature_store)
+
+    # The most recently simulated assets survive
+    assert "0x3e7" in simulator.signature_store
+    assert "0x0" not in simulator.signature_store
+    assert "0x0" not in simulator.correlation_engine
+    assert simulator.evictions == 1000 - len(simulator.signature_store)
+
+
+def test_cache_hits_refresh_eviction_order():
+    simulator = RiskSimulator(max_assets=10)
+    for i in range(10):
+        simulate(simulator, f"0x{i}")
+    simulate(simulator, "0x0")  # hit, touches 0x0
+    simulate(simulator, "0xa")  # over budget: evicts the least recently used
+
+    assert "0x0" in simulator.signature_store
+    assert "0x1" not in simulator.signature_store
+    assert len(simulator.signature_store) == 9
+
+
+def test_unbounded_universe():
+    simulator = RiskSimulator(max_assets=0)
+    n = 300
+    simulator.simulate_risk_batch(
+        [f"0x{i:x}" for i in range(n)], ["startup-fund"] * n, [1500] * n, [0] * n, [5] * n, NOW
+    )
+    assert len(simulator.signature_store) == n
+    assert simulator.evictions == 0
+
+
+def test_remove_many_matches_repeated_remove():
+    addresses = [f"0x{i:x}" for i in range(40)]
+    types = ["corporate-bond", "real-estate", "startup-fund", "revenue-sharing"] * 10
+    tiers = [1 + i % 5 for i in range(40)]
+
+    def build():
+        simulator = RiskSimulator(enable_cache=False, max_assets=0)
+        simulator.simulate_risk_batch(addresses, types, [500] * 40, [0] * 40, tiers, NOW)
+        simulator.correlation_engine.submatrix(addresses)  # builds the dense cache
+        assert simulator.correlation_engine.is_dense
+        return simulator
+
+    removed = addresses[::3] + ["0xmissing"]
+    bulk, single = build(), build()
+    bulk.signature_store.remove_many(removed)
+    bulk.correlation_engine.remove_many(removed)
+    for address in removed:
+        single.remove_asset(address)
+
+    assert sorted(bulk.signature_store.addresses) == sorted(single.signature_store.addresses)
+    survivors = bulk.signature_store.addresses
+    assert [bulk.get_risk_signature(a) for a in survivors] == [single.get_risk_signature(a) for a in survivors]
+    np.testing.assert_allclose(
+        bulk.correlation_engine.submatrix(survivors), single.correlation_engine.submatrix(survivors)
+    )
+    assert bulk.correlation_engine.correlation_factors_batch(survivors) == pytest.approx(
+        single.correlation_engine.correlation_factors_batch(survivors)
+    )
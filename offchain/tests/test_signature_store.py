@@ -0,0 +1,70 @@
+import numpy as np
+
+from simulation.risk_model import RiskSimulator
+from simulation.signature_store import RiskSignatureStore
+
+
+NOW = 1_760_000_000
+
+
+def signatures(n, offset=0):
+    simulator = RiskSimulator(enable_cache=False)
+    types = ["corporate-bond", "real-estate", "startup-fund"]
+    return simulator.simulate_risk_batch(
+        [f"0x{i + offset:04x}" for i in range(n)],
+        [types[i % 3] for i in range(n)],
+        [400 + 10 * i for i in range(n)],
+        [NOW + (100 + i) * 86400 for i in range(n)],
+        [1 + i % 5 for i in range(n)],
+        NOW
+    )
+
+
+def test_round_trip_and_columns():
+    sigs = signatures(50)
+    store = RiskSignatureStore(initial_capacity=4)  # forces growth
+    store.upsert(sigs[0])
+    store.upsert_signatures(sigs[1:])
+
+    assert len(store) == 50 and store.addresses == [s.asset_address for s in sigs]
+    assert store.signatures() == sigs
+    assert store.get(sigs[7].asset_address) == sigs[7]
+    assert store.get("0xmissing") is None
+    np.testing.assert_array_equal(store.column("annual_yield"), [s.annual_yield for s in sigs])
+    np.testing.assert_allclose(store.column("duration"), [s.duration for s in sigs])
+    assert [store.asset_types[c] for c in store.column("asset_type_code")] == [s.asset_type for s in sigs]
+
+
+def test_upsert_overwrites_and_keeps_last_duplicate():
+    sigs = signatures(3)
+    store = RiskSignatureStore()
+    store.upsert_signatures(sigs)
+    changed = signatures(1)[0]
+    changed.annual_yield = 9.99
+    store.upsert_signatures([sigs[0], changed])
+
+    assert len(store) == 3
+    assert store.get(sigs[0].asset_address).annual_yield == 9.99
+
+
+def test_remove_and_remove_many():
+    sigs = signatures(10)
+    store = RiskSignatureStore()
+    store.upsert_signatures(sigs)
+
+    assert store.remove(sigs[2].asset_address) and not store.remove(sigs[2].asset_address)
+    assert store.remove_many([sigs[0].asset_address, sigs[5].asset_address, "0xmissing"]) == 2
+    remaining = [s for i, s in enumerate(sigs) if i not in (0, 2, 5)]
+    assert sorted(store.addresses) == sorted(s.asset_address for s in remaining)
+    for sig in remaining:
+        assert store.signature(store.row_of(sig.asset_address)) == sig
+
+
+def test_least_recent_follows_writes_and_touches():
+    sigs = signatures(4)
+    store = RiskSignatureStore()
+    for sig in sigs:
+        store.upsert(sig)
+    store.touch(sigs[0].asset_address)
+    assert sorted(store.least_recent(2)) == [sigs[1].asset_address, sigs[2].asset_address]
+    assert len(store.least_recent(10)) == 4
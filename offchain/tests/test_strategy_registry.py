@@ -0,0 +1,60 @@
+from ai_engine.allocation_engine import PraxosAIEngine, VaultStrategy
+from ai_engine.strategy_registry import StrategyRegistry
+from simulation.risk_model import RiskSimulator
+
+
+def strategy(strategy_id, expected_yield=5.0):
+    return VaultStrategy(strategy_id, strategy_id.title(), 2, 365, ["0x1", "0x2"], [6000, 4000], expected_yield, 40.0)
+
+
+def test_latest_generation_wins():
+    registry = StrategyRegistry()
+    registry.record([strategy("a"), strategy("b")])
+    newer = strategy("a", 6.0)
+    generation = registry.record([newer])
+
+    assert generation == 2 == registry.latest_generation
+    assert registry.get("a") is newer
+    assert registry.get("b").expected_yield == 5.0
+    assert registry.generation() == [newer]
+    assert len(registry) == 3
+
+
+def test_identical_content_is_stored_once():
+    registry = StrategyRegistry()
+    first = strategy("a")
+    registry.record([first])
+    registry.record([strategy("a")])
+
+    assert registry.get("a") is first
+    assert registry.get_by_hash(StrategyRegistry.content_hash(first)) is first
+
+
+def test_only_max_generations_are_retained():
+    registry = StrategyRegistry(max_generations=2)
+    registry.record([strategy("a")])
+    registry.record([strategy("b")])
+    registry.record([strategy("c")])
+
+    assert registry.get("a") is None
+    assert registry.get_by_hash(StrategyRegistry.content_hash(strategy("a"))) is None
+    assert [s.strategy_id for s in registry.strategies()] == ["b", "c"]
+    assert registry.generation(1) == []
+
+
+def test_shared_content_survives_partial_eviction():
+    registry = StrategyRegistry(max_generations=2)
+    shared = strategy("a")
+    registry.record([shared])
+    registry.record([strategy("a")])
+    registry.record([strategy("b")])
+
+    digest = StrategyRegistry.content_hash(shared)
+    assert registry.get_by_hash(digest) is shared
+    assert registry.get("a") is shared
+
+
+def test_engine_uses_the_given_registry():
+    registry = StrategyRegistry(max_generations=1)
+    engine = PraxosAIEngine(RiskSimulator(), strategy_registry=registry)
+    assert engine.strategy_registry is registry
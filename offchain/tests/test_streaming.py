@@ -0,0 +1,54 @@
+import gc
+import json
+import time
+import weakref
+
+from loadgen.universe import generate_universe
+from vault_generator import VaultGenerator
+
+
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+def read_lines(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_generate_streams_signatures_then_strategies(client):
+    tokens = generate_universe(300, seed=9, now=int(time.time()))
+    streamed = client.post("/api/vaults/generate", json={"rwa_tokens": tokens}, headers=NDJSON)
+    assert streamed.mimetype == "application/x-ndjson"
+
+    events = read_lines(streamed)
+    kinds = [event["type"] for event in events]
+    assert kinds == ["risk_signature"] * len(tokens) + ["strategy"] * (len(kinds) - len(tokens))
+    assert [event["data"]["asset_address"] for event in events[:len(tokens)]] == [t["address"] for t in tokens]
+
+    buffered = client.post("/api/vaults/generate", json={"rwa_tokens": tokens}).get_json()
+    assert [event["data"] for event in events[len(tokens):]] == buffered["strategies"]
+
+
+def test_stream_drops_signatures_once_yielded():
+    tokens = generate_universe(500, seed=5, now=int(time.time()))
+    stream = VaultGenerator().iter_process_rwa_tokens(tokens, chunk_size=100)
+    signatures = []
+    for kind, item in stream:
+        if kind != "risk_signature":
+            break
+        signatures.append(weakref.ref(item))
+
+    # The first strategy is out, so the whole universe has been allocated
+    assert kind == "strategy"
+    assert len(signatures) == len(tokens)
+    del item
+    gc.collect()
+    assert all(ref() is None for ref in signatures)
+    stream.close()
+
+
+def test_analyze_streams_one_line(client):
+    body = {"asset_address": "0xstream", "asset_type": "real-estate", "annual_yield": 700, "risk_tier": 3}
+    events = read_lines(client.post("/api/risk/analyze", json=body, headers=NDJSON))
+    assert len(events) == 1
+    assert events[0]["type"] == "risk_signature"
+    assert events[0]["data"]["asset_address"] == "0xstream"
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from ai_agent.suggestion_engine import PraxosAIAgent, RiskTolerance, Timeframe, UserPreferences
+
+
+def register(agent, n, seed=0):
+    rng = np.random.default_rng(seed)
+    for i in range(n):
+        agent.register_vault({
+            "address": f"0x{i:04x}",
+            "name": f"Vault {i}",
+            "risk_tier": int(rng.integers(1, 6)),
+            "target_duration": int(rng.choice([0, 180, 365, 800, 1095, 2000, 3650])),
+            "expected_yield": float(np.round(rng.uniform(2, 14), 2))
+        })
+
+
+def brute_force(agent, prefs, k=5):
+    """Score every vault, drop the low scores and take the best (stable)"""
+    scored = [(agent._calculate_match_score(vault, prefs), vault) for vault in agent.vault_registry]
+    scored = [(score, vault) for score, vault in scored if score >= agent.MIN_MATCH_SCORE]
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return [(vault["address"], pytest.approx(score)) for score, vault in scored[:k]]
+
+
+def suggested(agent, prefs, k=5):
+    return [(rec.vault_address, rec.match_score) for rec in agent.suggest_vaults(prefs, k)]
+
+
+PREFERENCES = [
+    UserPreferences(timeframe, risk, 1000.0, min_yield)
+    for risk in RiskTolerance
+    for timeframe in Timeframe
+    for min_yield in (None, 4.0, 9.5)
+]
+
+
+def test_cached_rankings_match_brute_force():
+    agent = PraxosAIAgent()
+    register(agent, 400)
+    agent.precompute_recommendations()
+    for prefs in PREFERENCES:
+        assert suggested(agent, prefs) == brute_force(agent, prefs)
+        assert suggested(agent, prefs, 50) == brute_force(agent, prefs, 50)
+
+
+def test_cache_is_dropped_when_the_registry_changes():
+    agent = PraxosAIAgent()
+    register(agent, 50)
+    prefs = UserPreferences(Timeframe.SHORT_TERM, RiskTolerance.CONSERVATIVE, 1000.0)
+    before = suggested(agent, prefs, 100)
+
+    agent.register_vault({
+        "address": "0xbest", "name": "Best", "risk_tier": 1, "target_duration": 90, "expected_yield": 5.0
+    })
+    after = suggested(agent, prefs, 100)
+    assert ("0xbest", 85.0) in after
+    assert after == brute_force(agent, prefs, 100)
+
+    agent.unregister_vault("0xbest")
+    assert suggested(agent, prefs, 100) == before
+
+
+def reference_reasoning(agent, vault, prefs):
+    """Reasoning built field by field, as before memoization"""
+    reasons = []
+    if agent._match_risk_tier(vault["risk_tier"], prefs.risk_tolerance) >= 80:
+        reasons.append(
+            f"Risk tier {vault['risk_tier']} aligns well with your {prefs.risk_tolerance.name.lower()} risk tolerance"
+        )
+    if agent._check_timeframe_match(vault, prefs.timeframe):
+        reasons.append(f"Timeframe matches your {prefs.timeframe.value}-term investment preference")
+    if vault.get("expected_yield", 0.0) > 0:
+        reasons.append(f"Expected yield: {vault['expected_yield']:.2f}%")
+    if not reasons:
+        reasons.append("This vault may be suitable based on your preferences")
+    return ". ".join(reasons) + "."
+
+
+def test_reasoning_matches_the_reference_text():
+    agent = PraxosAIAgent()
+    register(agent, 200, seed=2)
+    agent.register_vault({"address": "0xzero", "name": "Zero", "risk_tier": 5, "target_duration": 4000})
+    for prefs in PREFERENCES:
+        for rec in agent.suggest_vaults(prefs, 20):
+            vault = agent.vault_registry.get(rec.vault_address)
+            assert rec.reasoning == reference_reasoning(agent, vault, prefs)
+    for vault in agent.vault_registry:
+        for prefs in PREFERENCES[::5]:
+            assert agent._generate_reasoning(vault, prefs, 0.0) == reference_reasoning(agent, vault, prefs)
@@ -0,0 +1,64 @@
+import multiprocessing
+
+import pytest
+
+from vault_metadata_store import BATCH_QUERY_SIZE, VaultMetadataStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "metadata.db")
+
+
+def test_round_trip_is_case_insensitive_and_persistent(path):
+    store = VaultMetadataStore(path)
+    store.put("0xAbC", {"description": "Bonds", "apr": 5.4})
+    assert store.get("0xabc") == store.get("0xABC") == {"description": "Bonds", "apr": 5.4}
+    store.close()
+
+    reopened = VaultMetadataStore(path)
+    assert reopened.get("0xabc")["apr"] == 5.4
+    assert len(reopened) == 1
+    assert reopened.delete("0xABC") and not reopened.delete("0xabc")
+    assert reopened.get("0xabc") is None
+
+
+def test_batch_reads_span_several_queries(path):
+    store = VaultMetadataStore(path)
+    entries = {f"0x{i:04X}": {"i": i} for i in range(2 * BATCH_QUERY_SIZE + 7)}
+    store.put_many(entries)
+    requested = list(entries) + ["0xmissing"]
+    assert store.get_many(requested) == entries
+
+
+def test_writes_through_another_connection_invalidate_the_cache(path):
+    reader, writer = VaultMetadataStore(path), VaultMetadataStore(path)
+    writer.put("0xa", {"apr": 1})
+    assert reader.get("0xa") == {"apr": 1}
+    assert reader.get("0xb") is None  # cached as missing
+
+    writer.put_many({"0xa": {"apr": 2}, "0xb": {"apr": 3}})
+    assert reader.get_many(["0xa", "0xb"]) == {"0xa": {"apr": 2}, "0xb": {"apr": 3}}
+    writer.delete("0xa")
+    assert reader.get("0xa") is None
+
+
+def _write_from_child(path):
+    VaultMetadataStore(path).put("0xchild", {"apr": 7})
+
+
+def test_writes_from_another_process_are_visible(path):
+    store = VaultMetadataStore(path)
+    assert store.get("0xchild") is None
+    child = multiprocessing.get_context("spawn").Process(target=_write_from_child, args=(path,))
+    child.start()
+    child.join(30)
+    assert child.exitcode == 0
+    assert store.get("0xchild") == {"apr": 7}
+
+
+def test_cache_is_bounded(path):
+    store = VaultMetadataStore(path, cache_size=3)
+    store.put_many({f"0x{i}": {"i": i} for i in range(10)})
+    store.get_many([f"0x{i}" for i in range(10)])
+    assert len(store._cache) == 3
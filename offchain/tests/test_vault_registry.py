@@ -0,0 +1,69 @@
+import numpy as np
+
+from ai_agent.vault_registry import VaultRegistry, duration_bucket
+
+
+def vaults(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "address": f"0x{i:04x}",
+            "name": f"Vault {i}",
+            "risk_tier": int(rng.integers(1, 6)),
+            "target_duration": int(rng.choice([0, 90, 365, 366, 1095, 1096, 3650])),
+            "expected_yield": float(rng.uniform(2, 14))
+        }
+        for i in range(n)
+    ]
+
+
+def test_reregistering_identical_metadata_is_a_no_op():
+    registry = VaultRegistry()
+    vault = vaults(1)[0]
+    row = registry.upsert(vault)
+    version = registry.version
+
+    assert registry.upsert(dict(vault)) == row
+    assert registry.version == version and len(registry) == 1
+    assert registry.upsert({**vault, "expected_yield": 1.0}) == row
+    assert registry.version == version + 1
+    assert registry.get(vault["address"])["expected_yield"] == 1.0
+
+
+def test_index_queries_match_a_scan():
+    registry = VaultRegistry()
+    all_vaults = vaults(300)
+    for vault in all_vaults:
+        registry.upsert(vault)
+    for vault in all_vaults[::4]:  # move some vaults to other groups
+        registry.upsert({**vault, "risk_tier": 6 - vault["risk_tier"], "target_duration": 2000})
+    for vault in all_vaults[1::7]:
+        registry.remove(vault["address"])
+
+    live = [registry.get(v["address"]) for v in all_vaults if v["address"] in registry]
+    for tier in (None, 1, 3, 5):
+        for bucket in (None, "short", "medium", "long"):
+            expected = [
+                v["address"] for v in live
+                if (tier is None or v["risk_tier"] == tier)
+                and (bucket is None or duration_bucket(v["target_duration"]) == bucket)
+            ]
+            assert [registry[row]["address"] for row in registry.rows_for(tier, bucket).tolist()] == expected
+
+
+def test_compaction_keeps_registration_order_and_features():
+    registry = VaultRegistry()
+    all_vaults = vaults(3000, seed=1)
+    for vault in all_vaults:
+        registry.upsert(vault)
+    for vault in all_vaults[:2000]:  # enough holes to trigger compaction
+        registry.remove(vault["address"])
+
+    kept = all_vaults[2000:]
+    assert len(registry._vaults) < len(all_vaults)
+    assert list(registry) == kept
+    tiers, durations, yields = registry.features()
+    assert tiers.tolist() == [v["risk_tier"] for v in kept]
+    assert durations.tolist() == [v["target_duration"] for v in kept]
+    assert yields.tolist() == [v["expected_yield"] for v in kept]
+    assert [registry[row] for row in registry.rows_for().tolist()] == kept
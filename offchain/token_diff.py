@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Praxos Token Diff
+Added / removed / changed tokens between two RWA token universes
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+@dataclass
+class TokenDiff:
+    """Difference between two token universes, keyed by token address"""
+    added: List[Dict] = field(default_factory=list)  # New tokens, in universe order
+    removed: List[str] = field(default_factory=list)  # Addresses no longer present
+    changed: List[Dict] = field(default_factory=list)  # New versions of tokens whose inputs changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+
+def simulation_inputs(token: Dict) -> Tuple:
+    """The fields of a token that determine its risk signature"""
+    return (
+        token["asset_type"],
+        token["annual_yield"],
+        token.get("maturity_timestamp", 0),
+        token["risk_tier"]
+    )
+
+
+def diff_tokens(previous: Dict[str, Dict], current: List[Dict]) -> TokenDiff:
+    """
+    Compare a token universe against the previous one
+
+    Only simulation inputs are compared, so metadata-only edits are not
+    reported as changes.
+
+    Args:
+        previous: Previous tokens by address
+        current: Current tokens (rwa_tokens format, unique addresses)
+
+    Returns:
+        TokenDiff from previous to current
+    """
+    diff = TokenDiff()
+    seen = set()
+    for token in current:
+        address = token["address"]
+        seen.add(address)
+        old = previous.get(address)
+        if old is None:
+            diff.added.append(token)
+        elif old != token and simulation_inputs(old) != simulation_inputs(token):
+            diff.changed.append(token)
+    diff.removed = [address for address in previous if address not in seen]
+    return diff
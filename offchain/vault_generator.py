@@ -5,18 +5,35 @@ Orchestrates the full pipeline: simulation -> AI allocation -> vault deployment
 """
 
 import json
-from typing import List, Dict
+import time
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from simulation.risk_model import RiskSimulator, RiskSignature
 from ai_engine.allocation_engine import PraxosAIEngine, VaultStrategy
+from ai_engine.candidate_index import SignatureColumns
+from observability import metrics
+from token_diff import TokenDiff, diff_tokens
+
+
+SECONDS_PER_DAY = 86400
 
 
 class VaultGenerator:
     """Main orchestrator for generating ERC-4626 vaults"""
     
+    # Tokens simulated per batch when streaming
+    STREAM_CHUNK_SIZE = 10_000
+    
     def __init__(self):
         self.risk_simulator = RiskSimulator()
         self.ai_engine = PraxosAIEngine(self.risk_simulator)
         self.generated_vaults: List[Dict] = []
+        # Incremental pipeline state (see update_rwa_tokens): the current
+        # universe, its signatures (same order) and strategies, valued at a
+        # timestamp pinned until the UTC day rolls over
+        self._tokens: Dict[str, Dict] = {}
+        self._signatures: Dict[str, RiskSignature] = {}
+        self._strategies: List[VaultStrategy] = []
+        self._valuation_timestamp: Optional[int] = None
     
     def process_rwa_tokens(
         self,
@@ -38,37 +55,190 @@ class VaultGenerator:
         Returns:
             List of generated vault strategies
         """
-        # Step 1: Simulate risk for all RWAs
-        risk_signatures = []
-        for token in rwa_tokens:
-            signature = self.risk_simulator.simulate_risk(
-                asset_address=token["address"],
-                asset_type=token["asset_type"],
-                annual_yield=token["annual_yield"],
-                maturity_timestamp=token.get("maturity_timestamp", 0),
-                risk_tier=token["risk_tier"]
-            )
-            risk_signatures.append(signature)
+        # Step 1: Simulate risk for all RWAs in one vectorized batch
+        risk_signatures = self._simulate_tokens(rwa_tokens)
         
         # Step 2: Generate vault strategies using AI engine
-        strategies = self.ai_engine.generate_vault_strategies(risk_signatures)
+        with metrics.stage("allocation"):
+            strategies = self.ai_engine.generate_vault_strategies(risk_signatures)
+        metrics.record_size("allocation", "strategies", len(strategies))
         
         # Step 3: Format for deployment
         for strategy in strategies:
-            vault_config = {
-                "strategy_id": strategy.strategy_id,
-                "name": strategy.name,
-                "risk_tier": strategy.risk_tier,
-                "target_duration": strategy.target_duration,
-                "assets": strategy.assets,
-                "weights": strategy.weights,
-                "expected_yield": strategy.expected_yield,
-                "diversification_score": strategy.diversification_score
-            }
-            self.generated_vaults.append(vault_config)
+            self._record_vault_config(strategy)
         
         return strategies
     
+    def iter_process_rwa_tokens(
+        self,
+        rwa_tokens: List[Dict],
+        chunk_size: int = None
+    ) -> Iterator[Tuple[str, Union[RiskSignature, VaultStrategy]]]:
+        """
+        Streaming variant of process_rwa_tokens
+        
+        Tokens are simulated in chunks and each chunk's risk signatures are
+        yielded as soon as it is done; the strategies follow once the whole
+        universe is simulated. Signatures are not kept once yielded: the
+        strategies are built from a SignatureColumns copy of the universe,
+        which holds the numeric fields as arrays (about 64 bytes per token)
+        and references the address strings of the request.
+        
+        Args:
+            rwa_tokens: List of RWA token metadata (see process_rwa_tokens)
+            chunk_size: Tokens simulated per batch (default STREAM_CHUNK_SIZE)
+        
+        Yields:
+            ("risk_signature", RiskSignature) per token, in input order, then
+            ("strategy", VaultStrategy) per generated strategy
+        """
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        
+        universe = SignatureColumns(len(rwa_tokens))
+        for start in range(0, len(rwa_tokens), chunk_size):
+            chunk = self._simulate_tokens(rwa_tokens[start:start + chunk_size])
+            universe.extend(chunk)
+            for signature in chunk:
+                yield "risk_signature", signature
+            del chunk, signature
+        
+        with metrics.stage("allocation"):
+            strategies = self.ai_engine.generate_vault_strategies(universe)
+        metrics.record_size("allocation", "strategies", len(strategies))
+        
+        for strategy in strategies:
+            self._record_vault_config(strategy)
+            yield "strategy", strategy
+    
+    def update_rwa_tokens(
+        self,
+        rwa_tokens: List[Dict],
+        current_timestamp: int = None
+    ) -> List[VaultStrategy]:
+        """
+        Incremental variant of process_rwa_tokens
+        
+        The universe is diffed against the one passed to the previous call
+        and only the difference is processed (see apply_token_diff).
+        
+        Args:
+            rwa_tokens: The full current universe (see process_rwa_tokens),
+                with unique addresses
+            current_timestamp: Valuation time (defaults to now)
+        
+        Returns:
+            Vault strategies for the current universe
+        """
+        return self.apply_token_diff(diff_tokens(self._tokens, rwa_tokens), current_timestamp)
+    
+    def apply_token_diff(
+        self,
+        diff: TokenDiff,
+        current_timestamp: int = None
+    ) -> List[VaultStrategy]:
+        """
+        Update the universe by a diff and regenerate the affected strategies
+        
+        Only added and changed tokens are simulated, and only the strategies
+        whose template criteria match an added, removed or changed asset
+        (before or after the change) are rebuilt; the others are returned as
+        the same VaultStrategy objects. Changed tokens keep their position in
+        the universe and added ones are appended, so the result equals
+        process_rwa_tokens over the updated universe at the pinned valuation
+        time. The valuation time is pinned at the first call and on each new
+        UTC day, when the whole universe is re-simulated (every token's time
+        to maturity moves).
+        
+        Args:
+            diff: Tokens added, removed and changed since the previous call
+            current_timestamp: Valuation time (defaults to now)
+        
+        Returns:
+            Vault strategies for the updated universe
+        """
+        now = int(time.time()) if current_timestamp is None else current_timestamp
+        full_rebuild = (
+            self._valuation_timestamp is None
+            or now // SECONDS_PER_DAY != self._valuation_timestamp // SECONDS_PER_DAY
+        )
+        if not diff and not full_rebuild:
+            return self._strategies
+        
+        old_signatures = [self._signatures[address] for address in diff.removed if address in self._signatures]
+        old_signatures += [
+            self._signatures[token["address"]] for token in diff.changed if token["address"] in self._signatures
+        ]
+        
+        # Removed first, then changed (in place), then added (appended)
+        for address in diff.removed:
+            if self._tokens.pop(address, None) is not None:
+                self._signatures.pop(address, None)
+                self.risk_simulator.remove_asset(address)
+        for token in diff.changed + diff.added:
+            self._tokens[token["address"]] = token
+        
+        if full_rebuild:
+            self._valuation_timestamp = now
+            signatures = self._simulate_tokens(list(self._tokens.values()), now)
+            self._signatures = {signature.asset_address: signature for signature in signatures}
+            with metrics.stage("allocation"):
+                strategies = self.ai_engine.generate_vault_strategies(signatures)
+            rebuilt = strategies
+        else:
+            new_signatures = self._simulate_tokens(diff.changed + diff.added, self._valuation_timestamp)
+            for signature in new_signatures:
+                self._signatures[signature.asset_address] = signature
+            with metrics.stage("allocation"):
+                strategies, rebuilt_ids = self.ai_engine.update_vault_strategies(
+                    list(self._signatures.values()), self._strategies, old_signatures + new_signatures
+                )
+            rebuilt = [strategy for strategy in strategies if strategy.strategy_id in rebuilt_ids]
+        metrics.record_size("allocation", "rebuilt_strategies", len(rebuilt))
+        
+        for strategy in rebuilt:
+            self._record_vault_config(strategy)
+        self._strategies = strategies
+        return strategies
+    
+    def record_strategies(self, strategies: List[VaultStrategy]):
+        """
+        Apply the bookkeeping of process_rwa_tokens for strategies built earlier
+        
+        Records them as the engine's newest generation (identical strategies
+        are deduplicated by content) and appends their deployment configs, as
+        if they had just been generated.
+        """
+        self.ai_engine.record_strategies(strategies)
+        for strategy in strategies:
+            self._record_vault_config(strategy)
+    
+    def _simulate_tokens(self, rwa_tokens: List[Dict], current_timestamp: int = None) -> List[RiskSignature]:
+        """Simulate risk for a list of RWA tokens in one vectorized batch"""
+        metrics.record_size("simulation", "tokens", len(rwa_tokens))
+        with metrics.stage("simulation"):
+            return self.risk_simulator.simulate_risk_batch(
+                asset_addresses=[token["address"] for token in rwa_tokens],
+                asset_types=[token["asset_type"] for token in rwa_tokens],
+                annual_yields=[token["annual_yield"] for token in rwa_tokens],
+                maturity_timestamps=[token.get("maturity_timestamp", 0) for token in rwa_tokens],
+                risk_tiers=[token["risk_tier"] for token in rwa_tokens],
+                current_timestamp=current_timestamp
+            )
+    
+    def _record_vault_config(self, strategy: VaultStrategy):
+        """Format a generated strategy for deployment"""
+        vault_config = {
+            "strategy_id": strategy.strategy_id,
+            "name": strategy.name,
+            "risk_tier": strategy.risk_tier,
+            "target_duration": strategy.target_duration,
+            "assets": strategy.assets,
+            "weights": strategy.weights,
+            "expected_yield": strategy.expected_yield,
+            "diversification_score": strategy.diversification_score
+        }
+        self.generated_vaults.append(vault_config)
+    
     def get_vault_config_for_deployment(
         self,
         strategy_id: str,
@@ -149,4 +319,10 @@ if __name__ == "__main__":
         print(f"  Assets: {len(strategy.assets)}")
     
     generator.export_strategies_json()
-
+    
+    # Incremental regeneration: only strategies whose candidates changed are rebuilt
+    baseline = generator.update_rwa_tokens(rwa_tokens)
+    rwa_tokens[2] = {**rwa_tokens[2], "annual_yield": 1800}
+    updated = generator.update_rwa_tokens(rwa_tokens)
+    reused = sum(1 for strategy in updated if any(strategy is previous for previous in baseline))
+    print(f"\nAfter a yield change: {len(updated) - reused} rebuilt, {reused} reused")
@@ -4,16 +4,19 @@ This shows how to link on-chain vaults with off-chain metadata
 """
 
 from flask import Flask, request, jsonify
-from typing import Dict, List, Optional
+from vault_metadata_store import VaultMetadataStore
 
-# In-memory storage (in production, use a database)
-vault_metadata_db: Dict[str, Dict] = {}
-
-def register_vault_metadata_endpoints(app: Flask):
+def register_vault_metadata_endpoints(app: Flask, store: VaultMetadataStore = None):
     """
     Register vault metadata API endpoints
     Add these to your existing Flask app
+    
+    Args:
+        app: Flask app
+        store: Metadata store (default: SQLite database at PRAXOS_METADATA_DB)
     """
+    if store is None:
+        store = VaultMetadataStore.from_env()
     
     @app.route('/api/vaults/<vault_address>/metadata', methods=['GET'])
     def get_vault_metadata(vault_address: str):
@@ -39,7 +42,7 @@ def register_vault_metadata_endpoints(app: Flask):
             ]
         }
         """
-        metadata = vault_metadata_db.get(vault_address.lower())
+        metadata = store.get(vault_address)
         if not metadata:
             return jsonify({"error": "Vault metadata not found"}), 404
         
@@ -70,13 +73,13 @@ def register_vault_metadata_endpoints(app: Flask):
         """
         data = request.get_json()
         
-        vault_metadata_db[vault_address.lower()] = {
+        store.put(vault_address, {
             "vaultAddress": vault_address,
             "description": data.get("description", ""),
             "apr": data.get("apr", 0),
             "isNew": data.get("isNew", False),
             "assets": data.get("assets", []),
-        }
+        })
         
         return jsonify({"status": "success", "vaultAddress": vault_address})
     
@@ -105,11 +108,5 @@ def register_vault_metadata_endpoints(app: Flask):
         data = request.get_json()
         addresses = data.get("vaultAddresses", [])
         
-        result = {}
-        for addr in addresses:
-            metadata = vault_metadata_db.get(addr.lower())
-            if metadata:
-                result[addr] = metadata
-        
-        return jsonify(result)
+        return jsonify(store.get_many(addresses))
 
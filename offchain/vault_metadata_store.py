@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Praxos Vault Metadata Store
+Persistent SQLite (WAL) store for off-chain vault metadata with a read-through cache
+"""
+
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+DEFAULT_DB_PATH = "vault_metadata.db"
+
+# Bound parameters per IN (...) query (SQLite builds before 3.32 allow at most 999)
+BATCH_QUERY_SIZE = 500
+
+
+def normalize_address(address: str) -> str:
+    """Canonical (lowercase) form of a vault address, used as the storage key"""
+    return address.lower()
+
+
+class VaultMetadataStore:
+    """
+    Vault metadata by address, persisted in SQLite
+
+    The database runs in WAL mode, so any number of processes (e.g. serve.py
+    workers) can read while one writes, and every process sees the same
+    metadata. Addresses are lowercased once on write and looked up by primary
+    key; batch reads are one IN query per BATCH_QUERY_SIZE addresses.
+
+    Reads go through an in-process LRU cache. Before serving from it, the
+    store checks SQLite's data_version, which changes whenever another
+    process commits, and drops the cache if so; writes through this store
+    invalidate their own entries. Cached dicts are shared, so callers must
+    not mutate them.
+
+    A process uses one connection (opened lazily, and reopened after a fork)
+    shared by its threads under a lock; lookups are primary-key reads, so
+    holding it is short.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, cache_size: int = 4096, timeout: float = 5.0):
+        """
+        Args:
+            path: Database file (created if missing)
+            cache_size: Maximum number of cached vault entries (0 disables the cache)
+            timeout: Seconds to wait for a lock held by another writer
+        """
+        self.path = path
+        self.cache_size = cache_size
+        self.timeout = timeout
+        self._connection_pid: Optional[int] = None
+        self._db: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._cache: "OrderedDict[str, Optional[Dict]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_env(cls) -> "VaultMetadataStore":
+        """Store at PRAXOS_METADATA_DB (default vault_metadata.db)"""
+        return cls(os.environ.get("PRAXOS_METADATA_DB", DEFAULT_DB_PATH))
+
+    def get(self, address: str) -> Optional[Dict]:
+        """Metadata of a vault, or None"""
+        return self.get_many([address]).get(address)
+
+    def get_many(self, addresses: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Metadata of many vaults
+
+        Args:
+            addresses: Vault addresses (any case)
+
+        Returns:
+            Metadata by requested address, for the vaults that have metadata
+        """
+        keys = {address: normalize_address(address) for address in addresses}
+
+        found: Dict[str, Optional[Dict]] = {}
+        with self._lock:
+            connection = self._connection()
+            self._validate_cache(connection)
+            missing = []
+            for key in set(keys.values()):
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    found[key] = self._cache[key]
+                else:
+                    missing.append(key)
+
+            if missing:
+                # Unknown addresses are cached as None too
+                loaded: Dict[str, Optional[Dict]] = dict.fromkeys(missing)
+                for start in range(0, len(missing), BATCH_QUERY_SIZE):
+                    chunk = missing[start:start + BATCH_QUERY_SIZE]
+                    rows = connection.execute(
+                        f"SELECT address, metadata FROM vault_metadata WHERE address IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    )
+                    for key, metadata in rows:
+                        loaded[key] = json.loads(metadata)
+                found.update(loaded)
+                self._cache_put(loaded)
+
+        return {address: found[key] for address, key in keys.items() if found[key] is not None}
+
+    def put(self, address: str, metadata: Dict):
+        """Store (or replace) the metadata of a vault"""
+        self.put_many({address: metadata})
+
+    def put_many(self, entries: Dict[str, Dict]):
+        """Store (or replace) the metadata of many vaults in one transaction"""
+        rows = [
+            (normalize_address(address), json.dumps(metadata, separators=(",", ":")), time.time())
+            for address, metadata in entries.items()
+        ]
+        with self._lock:
+            connection = self._connection()
+            with connection:
+                connection.executemany(
+                    "INSERT INTO vault_metadata (address, metadata, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(address) DO UPDATE SET metadata = excluded.metadata, updated_at = excluded.updated_at",
+                    rows
+                )
+            for key, _, _ in rows:
+                self._cache.pop(key, None)
+
+    def delete(self, address: str) -> bool:
+        """Remove the metadata of a vault"""
+        key = normalize_address(address)
+        with self._lock:
+            connection = self._connection()
+            with connection:
+                deleted = connection.execute("DELETE FROM vault_metadata WHERE address = ?", (key,)).rowcount
+            self._cache.pop(key, None)
+        return deleted > 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM vault_metadata").fetchone()[0]
+
+    def clear_cache(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self):
+        """Close the connection (it is reopened on next use)"""
+        with self._lock:
+            if self._db is not None and self._connection_pid == os.getpid():
+                self._db.close()
+            self._db = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """This process's connection (lock held)"""
+        if self._db is None or self._connection_pid != os.getpid():
+            # A connection inherited over fork must not be used; the copied cache may be stale too
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS vault_metadata ("
+                    "address TEXT PRIMARY KEY, metadata TEXT NOT NULL, updated_at REAL NOT NULL"
+                    ") WITHOUT ROWID"
+                )
+            self._db = connection
+            self._connection_pid = os.getpid()
+            self._data_version = None
+            self._cache.clear()
+        return self._db
+
+    def _validate_cache(self, connection: sqlite3.Connection):
+        """Drop the cache if another process committed since the last check (lock held)"""
+        data_version = connection.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._cache.clear()
+            self._data_version = data_version
+
+    def _cache_put(self, entries: Dict[str, Optional[Dict]]):
+        """Add entries, evicting the least recently used (lock held)"""
+        if not self.cache_size:
+            return
+        for key, metadata in entries.items():
+            self._cache[key] = metadata
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)